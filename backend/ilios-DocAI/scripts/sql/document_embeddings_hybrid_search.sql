@@ -0,0 +1,37 @@
+-- Indexes for the hybrid (semantic + keyword) search on document_embeddings.
+-- Run with psql outside of a transaction, CREATE INDEX CONCURRENTLY cannot run in one:
+-- psql -h 127.0.0.2 -U chatbot -d chatbot-documents -f document_embeddings_hybrid_search.sql
+-- Once applied, set PG_VECTOR_INDEXED_SEARCH=true so the retriever uses content_tsv.
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- Keyword search: tsvector computed once on write instead of for every row on read
+ALTER TABLE document_embeddings
+    ADD COLUMN IF NOT EXISTS content_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', content)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS document_embeddings_content_tsv_idx
+    ON document_embeddings USING gin (content_tsv);
+
+-- Semantic search: approximate nearest neighbours for the cosine distance (<=>)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS document_embeddings_summary_embedding_idx
+    ON document_embeddings USING hnsw (summary_embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS document_embeddings_embedding_idx
+    ON document_embeddings USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- Filters of both searches
+CREATE INDEX CONCURRENTLY IF NOT EXISTS document_embeddings_company_site_agreement_idx
+    ON document_embeddings (company_id, site_id, agreement_type);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS document_embeddings_company_site_document_idx
+    ON document_embeddings (company_id, site_id, document_name);
+
+-- The HNSW scan filters the rows after the index lookup, so a selective site filter
+-- can return fewer than the requested rows. With pgvector >= 0.8, iterative scans
+-- keep searching until enough rows pass the filter:
+-- ALTER DATABASE "chatbot-documents" SET hnsw.iterative_scan = relaxed_order;
+
+ANALYZE document_embeddings;
@@ -21,8 +21,12 @@ def file_processing_background_task(upload_input: FileUploadInput) -> None:
     file_data = pipeline.run(metadata=upload_input.model_dump())
     logger.info(f"Creating Document: {upload_input.file_link}")
     logger.info(f"Storing Document in PGVector: {upload_input.file_link}")
-    pg_connector = PGVectorConnector(config=settings.get_pg_vector_config())
-    pg_connector.store_documents(file_data)
+    pg_config = settings.get_pg_vector_config()
+    pg_connector = PGVectorConnector(config=pg_config)
+    if pg_config.chunk_upsert:
+        pg_connector.upsert_documents(file_data)
+    else:
+        pg_connector.store_documents(file_data)
     logger.info(f"Pipeline complete: {upload_input.file_link}")
 
 
@@ -24,6 +24,7 @@ from src.deployment.fast_api.models.output import (
     CoterminousOutputPayload,
 )
 from src.pipelines.co_terminus_check.base import CoTerminusCheck
+from src.utils.engine_registry import engine_registry
 
 
 logging.config.fileConfig("logging.conf", disable_existing_loggers=False)
@@ -40,6 +41,12 @@ def read_root() -> Dict[str, str]:
     return {"FastAPI": "iliOS_AI_App"}
 
 
+@app.get("/metrics/db_pools", dependencies=[Depends(api_key_check)])
+def get_db_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return the connection pool usage of the shared database engines."""
+    return engine_registry.get_pool_metrics()
+
+
 def compare_key_value_pairs(
     key_value_pairs: List[CoterminousInputItem],
 ) -> CoterminousOutputPayload:
@@ -0,0 +1,204 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import google.cloud.storage as storage
+from google.api_core.exceptions import NotFound
+from google.cloud.documentai_v1 import Document
+
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentCache:
+    """
+    Content-addressed cache of the Document AI results, stored as serialized
+    Document protos on the local disk or in a GCS bucket ("gs://bucket/prefix").
+    Entries are keyed by the processed page batch and the processor (version), so
+    repeated processing of the same file skips Document AI calls. When the total size
+    exceeds the limit, the least recently used entries are evicted: local entries are
+    ordered by mtime and GCS entries by custom time, both refreshed on every hit.
+
+    The total size is tracked approximately from the writes of this instance, so the
+    cache is listed only on the first write, when the tracked size exceeds the limit,
+    or every EVICTION_INTERVAL_WRITES writes to account for the other writers.
+    """
+
+    FILE_SUFFIX = ".pb"
+    EVICTION_INTERVAL_WRITES = 100
+
+    def __init__(self, path: str | Path, max_size_bytes: int) -> None:
+        self.path: str = str(path).rstrip("/")
+        self.max_size_bytes: int = max_size_bytes
+        self.is_gcs: bool = self.path.startswith("gs://")
+        # approximate total size of the entries, unknown until the first listing
+        self.size_bytes: Optional[int] = None
+        self.writes_since_eviction: int = 0
+        self.lock = threading.Lock()
+        self.eviction_lock = threading.Lock()
+        if self.is_gcs:
+            split_path = self.path.split("gs://")[1].split("/")
+            self.bucket = storage.Client().bucket(split_path[0])
+            self.prefix = "/".join(split_path[1:])
+        else:
+            os.makedirs(self.path, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["DocumentCache"]:
+        """
+        Create the cache from the DOC_AI_CACHE_PATH and DOC_AI_CACHE_MAX_SIZE_MB
+        environment variables. Returns None if the cache is not configured.
+        """
+        path = os.environ.get("DOC_AI_CACHE_PATH")
+        if not path:
+            return None
+        max_size_mb = int(os.environ.get("DOC_AI_CACHE_MAX_SIZE_MB", "1024"))
+        logger.info(f"Using Document AI cache at {path} (max {max_size_mb} MB)")
+        return cls(path=path, max_size_bytes=max_size_mb * 1024 * 1024)
+
+    @staticmethod
+    def get_key(
+        content_hash: str,
+        pages: List[int],
+        processor_name: str,
+        field_mask: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key from the hash of the file content, the pages of the batch
+        and the processor (including its version) used to process them.
+        """
+        key_source = "|".join(
+            [processor_name, field_mask or "", content_hash, ",".join(map(str, pages))]
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Document]:
+        """Return the cached document or None if it is not cached."""
+        try:
+            data = self._read(key)
+        except Exception as e:
+            logger.warning(f"Failed to read Document AI cache entry {key}. Error: {e}")
+            return None
+        if data is None:
+            return None
+        logger.info(f"Document AI cache hit: {key}")
+        return Document.deserialize(data)
+
+    def set(self, key: str, document: Document) -> None:
+        """Store the document in the cache and evict entries over the size limit."""
+        try:
+            data = Document.serialize(document)
+            self._write(key, data)
+            if self._is_eviction_due(len(data)):
+                self._evict()
+        except Exception as e:
+            logger.warning(f"Failed to write Document AI cache entry {key}. Error: {e}")
+
+    def _is_eviction_due(self, written_bytes: int) -> bool:
+        with self.lock:
+            self.writes_since_eviction += 1
+            if self.size_bytes is not None:
+                self.size_bytes += written_bytes
+            return (
+                self.size_bytes is None
+                or self.size_bytes > self.max_size_bytes
+                or self.writes_since_eviction >= self.EVICTION_INTERVAL_WRITES
+            )
+
+    def _get_local_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{self.FILE_SUFFIX}")
+
+    def _get_blob_name(self, key: str) -> str:
+        return "/".join(filter(None, [self.prefix, f"{key}{self.FILE_SUFFIX}"]))
+
+    def _read(self, key: str) -> Optional[bytes]:
+        if self.is_gcs:
+            blob = self.bucket.blob(self._get_blob_name(key))
+            try:
+                data = blob.download_as_bytes()
+            except NotFound:
+                return None
+            # mark the entry as recently used for the eviction
+            try:
+                blob.custom_time = datetime.now(timezone.utc)
+                blob.patch()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to update Document AI cache entry {key}. Error: {e}"
+                )
+            return data
+        local_path = self._get_local_path(key)
+        try:
+            with open(local_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        # mark the entry as recently used for the eviction
+        os.utime(local_path)
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        if self.is_gcs:
+            blob = self.bucket.blob(self._get_blob_name(key))
+            blob.custom_time = datetime.now(timezone.utc)
+            blob.upload_from_string(data)
+            return
+        # write to a temporary file first, so concurrent readers never see partial data
+        fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, self._get_local_path(key))
+
+    def _list_entries(self) -> List[Tuple[float, int, str]]:
+        """Return (last used timestamp, size, name) of all the entries."""
+        if self.is_gcs:
+            return [
+                (
+                    (blob.custom_time or blob.time_created).timestamp(),
+                    blob.size,
+                    blob.name,
+                )
+                for blob in self.bucket.list_blobs(prefix=self.prefix or None)
+                if blob.name.endswith(self.FILE_SUFFIX)
+            ]
+        entries = []
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.endswith(self.FILE_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        # a single thread lists and evicts at a time, concurrent writes skip it
+        if not self.eviction_lock.acquire(blocking=False):
+            return
+        try:
+            with self.lock:
+                self.writes_since_eviction = 0
+            entries = self._list_entries()
+            total_size = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, name in sorted(entries):
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    if self.is_gcs:
+                        self.bucket.blob(name).delete()
+                    else:
+                        os.remove(name)
+                except (NotFound, FileNotFoundError):
+                    pass
+                total_size -= size
+                evicted += 1
+            with self.lock:
+                self.size_bytes = total_size
+            if evicted:
+                logger.info(f"Evicted {evicted} Document AI cache entries")
+        finally:
+            self.eviction_lock.release()
@@ -1,11 +1,11 @@
 from collections.abc import Sequence
 from itertools import chain
-from typing import Dict, List, Union, overload
+from typing import Any, Collection, Dict, List, Optional, Union, overload
 
 from google.cloud import documentai
 from google.cloud.documentai_v1 import Document
 
-from src.doc_ai.utils import get_form_fields, get_tables
+from src.doc_ai.utils import get_form_fields, get_tables, layout_to_text
 
 
 class DocumentSequence(Sequence[Document]):
@@ -33,32 +33,112 @@ class DocumentSequence(Sequence[Document]):
         """Return the document at the given index or the documents at the given slice"""
         return self.documents[index]
 
-    def __init__(self, documents: List[Document]) -> None:
-        """Initializes the DocumentSequence with a list of documents"""
+    def __init__(
+        self,
+        documents: List[Document],
+        source_pages: Optional[List[List[int]]] = None,
+        selected_pages: Optional[Collection[int]] = None,
+    ) -> None:
+        """
+        Initializes the DocumentSequence with a list of documents.
+
+        :param source_pages: indices of the original file pages each document was
+            processed from, used to select pages without processing them again.
+        :param selected_pages: indices of the original file pages this sequence is
+            restricted to. If None, all the pages are used.
+        """
         self.documents = documents
+        self.source_pages = (
+            source_pages
+            if source_pages is not None
+            else [[] for _ in range(len(documents))]
+        )
+        self.selected_pages = (
+            frozenset(selected_pages) if selected_pages is not None else None
+        )
 
     def __len__(self) -> int:
         """Returns the number of documents in the sequence"""
         return len(self.documents)
 
-    def append(self, document: Document) -> None:
-        """Adds a document to the sequence of documents"""
+    def append(self, document: Document, pages: Optional[List[int]] = None) -> None:
+        """Adds a document processed from the given file pages to the sequence"""
         self.documents.append(document)
+        self.source_pages.append(pages if pages is not None else [])
+
+    def select_pages(self, pages: Collection[int]) -> "DocumentSequence":
+        """
+        Return a view of the sequence restricted to the given original file pages.
+        The view is built from the already processed page-level output, so no
+        Document AI calls are made.
+        """
+        selected_pages = set(pages)
+        if self.selected_pages is not None:
+            selected_pages &= self.selected_pages
+        return DocumentSequence(
+            documents=self.documents,
+            source_pages=self.source_pages,
+            selected_pages=selected_pages,
+        )
+
+    def _is_page_selected(self, document_index: int, page_number: int) -> bool:
+        """Check if the page (1-based number within the document) is selected"""
+        if self.selected_pages is None:
+            return True
+        document_pages = self.source_pages[document_index]
+        if page_number > len(document_pages):
+            return False
+        return document_pages[page_number - 1] in self.selected_pages
+
+    def _get_document_text(self, document_index: int) -> str:
+        """Return the text of the selected pages of the document"""
+        document = self.documents[document_index]
+        if self.selected_pages is None:
+            return document.text
+        return "".join(
+            layout_to_text(page.layout, document.text)
+            for page in document.pages
+            if self._is_page_selected(document_index, page.page_number)
+        )
+
+    def _filter_selected_pages(
+        self, document_index: int, page_items: Dict[int, Any]
+    ) -> List[Any]:
+        """Return values of the {page_number: value} dict for the selected pages"""
+        return [
+            value
+            for page_number, value in page_items.items()
+            if self._is_page_selected(document_index, page_number)
+        ]
 
     def get_all_text(self) -> str:
         """Returns the text of all the documents"""
-        all_text = "\n".join([doc.text for doc in self.documents])
+        all_text = "\n".join(
+            [
+                self._get_document_text(document_index)
+                for document_index in range(len(self.documents))
+                if self.selected_pages is None
+                or any(
+                    page_index in self.selected_pages
+                    for page_index in self.source_pages[document_index]
+                )
+            ]
+        )
         return all_text
 
     def get_tables(self) -> List[str]:
         """Returns the list of all the tables in the documents as strings."""
-        parsed_tables = [get_tables(document).values() for document in self.documents]
+        parsed_tables = [
+            self._filter_selected_pages(document_index, get_tables(document))
+            for document_index, document in enumerate(self.documents)
+        ]
         return list(chain.from_iterable(list(chain.from_iterable(parsed_tables))))
 
     def get_form_fields(self) -> List[Dict[str, str]]:
         """Returns the list of all the tables in the documents as strings."""
         parsed_tables = [
-            get_form_fields(document).values() for document in self.documents
+            self._filter_selected_pages(document_index, get_form_fields(document))
+            for document_index, document in enumerate(self.documents)
         ]
         return list(chain.from_iterable(parsed_tables))
 
@@ -110,8 +190,10 @@ class DocumentSequence(Sequence[Document]):
         """Returns the list of all the tables in the documents as strings."""
         parsed_paragraphs = [
             paragraph
-            for document in self.documents
-            for paragraph in self._get_document_paragraphs(document).values()
+            for document_index, document in enumerate(self.documents)
+            for paragraph in self._filter_selected_pages(
+                document_index, self._get_document_paragraphs(document)
+            )
         ]
         return list(chain.from_iterable(parsed_paragraphs))
 
@@ -123,7 +205,9 @@ class DocumentSequence(Sequence[Document]):
         """Returns the list of all the tables in the documents as strings."""
         parsed_blocks = [
             paragraph
-            for document in self.documents
-            for paragraph in self._get_document_blocks(document).values()
+            for document_index, document in enumerate(self.documents)
+            for paragraph in self._filter_selected_pages(
+                document_index, self._get_document_blocks(document)
+            )
         ]
         return list(chain.from_iterable(parsed_blocks))
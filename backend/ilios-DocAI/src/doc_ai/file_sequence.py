@@ -31,6 +31,21 @@ class FileSequence(Sequence[File]):
         """Returns the number of documents in the sequence"""
         return len(self.documents)
 
+    def select_pages(self, pages: List[List[int]]) -> "FileSequence":
+        """
+        Return a view of the processed files restricted to the given pages per file,
+        without processing the files again.
+        """
+        assert len(self.documents) == len(
+            pages
+        ), "Number of pages must match number of documents"
+        return FileSequence(
+            [
+                doc.select_pages(document_pages)
+                for doc, document_pages in zip(self.documents, pages)
+            ]
+        )
+
     def get_all_text(self) -> str:
         """Returns the text of all the documents"""
         return "\n\n".join([doc.get_all_text() for doc in self.documents])
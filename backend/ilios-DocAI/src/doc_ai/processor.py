@@ -1,11 +1,17 @@
 import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional
 
+from google.api_core import exceptions as api_exceptions
 from google.api_core.client_options import ClientOptions
 from google.cloud import documentai
 from google.cloud.documentai_v1 import ProcessOptions
 
+from src.doc_ai.cache import DocumentCache
 from src.doc_ai.document_sequence import DocumentSequence
 from src.doc_ai.file import File
 from src.doc_ai.file_sequence import FileSequence
@@ -13,6 +19,32 @@ from src.doc_ai.file_sequence import FileSequence
 
 logger = logging.getLogger(__name__)
 
+RETRYABLE_EXCEPTIONS = (
+    api_exceptions.TooManyRequests,
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+)
+
+
+class RateLimiter:
+    """Spaces out calls shared by several threads to stay within the API quota."""
+
+    def __init__(self, max_calls_per_minute: int) -> None:
+        self.interval: float = 60 / max_calls_per_minute
+        self.next_call_time: float = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next call is allowed."""
+        with self.lock:
+            now = time.monotonic()
+            call_time = max(now, self.next_call_time)
+            self.next_call_time = call_time + self.interval
+        if call_time > now:
+            time.sleep(call_time - now)
+
 
 class DocAIProcessor:
     """Class used to process documents using the Document AI API."""
@@ -23,6 +55,10 @@ class DocAIProcessor:
         location: str,
         processor_id: str,
         processor_version_id: Optional[str] = None,
+        cache: Optional[DocumentCache] = None,
+        max_workers: int = 4,
+        max_requests_per_minute: int = 120,
+        max_attempts: int = 5,
     ):
         self.project_id: str = project_id
         self.location: str = location
@@ -38,6 +74,12 @@ class DocAIProcessor:
         self.processed_doc_history: List[FileSequence] = []
         self.DOC_AI_API_PAGE_LIMIT = 15
         self.DOCUMENT_SIZE_LIMIT = 20000000
+        self.cache: Optional[DocumentCache] = (
+            cache if cache is not None else DocumentCache.from_env()
+        )
+        self.max_workers: int = max_workers
+        self.max_attempts: int = max_attempts
+        self.rate_limiter = RateLimiter(max_requests_per_minute)
 
     def get_processor_name(self) -> str:
         """Define and setup Document AI processor"""
@@ -85,39 +127,107 @@ class DocAIProcessor:
             file: File = File(path=file_path, pages=pages)
         except Exception as e:
             raise ValueError(f"Failed to create File object. Error: {e}")
-        processed_document_chunks: DocumentSequence = DocumentSequence(documents=[])
         logger.info("PREPARING DOCUMENT BATCHES")
         page_sizes: List[int] = file.get_pdf_page_sizes()
         batches: List[List[int]] = list(self.create_batches(page_sizes, file.all_pages))
-        for batch in batches:
-            logger.info(
-                f"BATCH SIZE: "
-                f"{sum([page_sizes[i] for i in batch])}"  # noqa
-            )
-            try:
-                raw_document = documentai.RawDocument(
-                    content=file.get_pages(batch), mime_type=mime_type
-                )
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to create Document AI RawDocument object. Error: {e}"
+        # batches are submitted concurrently, but reassembled in the order of pages
+        documents: Dict[int, documentai.Document] = {}
+        futures: Dict[Future[documentai.Document], int] = {}
+        failed_batches: List[List[int]] = []
+
+        def collect(done_futures: set[Future[documentai.Document]]) -> None:
+            for future in done_futures:
+                batch_index = futures.pop(future)
+                try:
+                    documents[batch_index] = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to process pages {batches[batch_index]} "
+                        f"of {file.name}. Error: {e}"
+                    )
+                    failed_batches.append(batches[batch_index])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch_index, batch in enumerate(batches):
+                logger.info(
+                    f"BATCH SIZE: "
+                    f"{sum([page_sizes[i] for i in batch])}"  # noqa
                 )
-            try:
-                request = documentai.ProcessRequest(
-                    name=self.processor_name,
-                    raw_document=raw_document,
-                    field_mask=field_mask,
-                    process_options=None,
+                cache_key = DocumentCache.get_key(
+                    file.content_hash, batch, self.processor_name, field_mask
                 )
-                processed_document_chunks.append(
-                    self.client.process_document(request=request).document
+                if self.cache is not None:
+                    cached_document = self.cache.get(cache_key)
+                    if cached_document is not None:
+                        documents[batch_index] = cached_document
+                        continue
+                # the pages are extracted in this thread, as the PDF reader is not
+                # thread-safe; waiting for a free worker keeps memory bounded
+                if len(futures) >= self.max_workers:
+                    done_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    collect(done_futures)
+                try:
+                    raw_document = documentai.RawDocument(
+                        content=file.get_pages(batch), mime_type=mime_type
+                    )
+                except Exception as e:
+                    raise ValueError(
+                        f"Failed to create Document AI RawDocument object. Error: {e}"
+                    )
+                future = executor.submit(
+                    self._process_raw_document, raw_document, field_mask, cache_key
                 )
-            except Exception:
-                logger.info(f"Failed to process pages {batch}")
-                continue
+                futures[future] = batch_index
+            collect(wait(futures).done)
+
+        processed_document_chunks: DocumentSequence = DocumentSequence(documents=[])
+        for batch_index, batch in enumerate(batches):
+            if batch_index in documents:
+                processed_document_chunks.append(documents[batch_index], pages=batch)
+        if failed_batches:
+            logger.error(
+                f"Failed to process {len(failed_batches)} of {len(batches)} batches "
+                f"of {file.name}: {failed_batches}"
+            )
+        file.failed_pages = sorted(page for batch in failed_batches for page in batch)
         file.add_docai_representation(processed_document_chunks)
         return file
 
+    def _process_raw_document(
+        self,
+        raw_document: documentai.RawDocument,
+        field_mask: Optional[str],
+        cache_key: str,
+    ) -> documentai.Document:
+        """
+        Process one batch of pages with Document AI within the requests quota.
+        Transient errors (quota exceeded, unavailable, etc.) are retried with
+        the exponential backoff.
+        """
+        request = documentai.ProcessRequest(
+            name=self.processor_name,
+            raw_document=raw_document,
+            field_mask=field_mask,
+            process_options=None,
+        )
+        for attempt in range(1, self.max_attempts + 1):
+            self.rate_limiter.acquire()
+            try:
+                document = self.client.process_document(request=request).document
+                break
+            except RETRYABLE_EXCEPTIONS as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = min(2**attempt, 60) * random.uniform(0.5, 1.0)
+                logger.warning(
+                    f"Document AI request failed (attempt {attempt}), "
+                    f"retrying in {delay:.1f}s. Error: {e}"
+                )
+                time.sleep(delay)
+        if self.cache is not None:
+            self.cache.set(cache_key, document)
+        return document
+
     def create_batches(
         self, page_sizes: List[int], page_nums: List[int]
     ) -> Iterator[List[int]]:
@@ -126,7 +236,7 @@ class DocAIProcessor:
         batch_size = 0
         for page_num in page_nums:
             page_size = page_sizes[page_num]
-            if (
+            if batch and (
                 batch_size + page_size > self.DOCUMENT_SIZE_LIMIT
                 or len(batch) >= self.DOC_AI_API_PAGE_LIMIT
             ):
@@ -136,7 +246,8 @@ class DocAIProcessor:
             else:
                 batch.append(page_num)
                 batch_size += page_size
-        yield batch
+        if batch:
+            yield batch
 
     def check_size(self, page_sizes: List[float]) -> bool:
         """Check condition: if the pages exceed 20MB DocumentAI limit"""
@@ -0,0 +1,184 @@
+import hashlib
+import logging
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Protocol
+
+from langchain_core.embeddings import Embeddings
+
+from src.vectordb.pg_vector.embedding_store import PGEmbeddingStore
+
+
+logger = logging.getLogger(__name__)
+
+# maximum number of texts sent to the embedding API in one request
+MAX_EMBEDDING_BATCH_SIZE = 250
+
+
+class EmbeddingStore(Protocol):
+    """Persistent store for the embeddings, shared across processes."""
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]: ...
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None: ...
+
+
+class EmbeddingCache:
+    """
+    Embeddings keyed by the text hash, the model and the request parameters. The
+    recently used embeddings are kept in memory and, if a store is set, in a
+    persistent store shared across processes. Only the missing texts are sent to the
+    model, in batches of up to MAX_EMBEDDING_BATCH_SIZE texts.
+    """
+
+    def __init__(
+        self, max_entries: int = 4096, store: Optional[EmbeddingStore] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.store = store
+        # vectors are kept as arrays of doubles, a fraction of the size of lists
+        self.embeddings: OrderedDict[str, array] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingCache":
+        """
+        Create the cache from the EMBEDDING_CACHE_MAX_ENTRIES and
+        EMBEDDING_CACHE_PG_STORE environment variables.
+        """
+        store: Optional[EmbeddingStore] = None
+        if os.environ.get("EMBEDDING_CACHE_PG_STORE", "").lower() == "true":
+            store = PGEmbeddingStore.from_env()
+        return cls(
+            max_entries=int(os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES", "4096")),
+            store=store,
+        )
+
+    @staticmethod
+    def get_key(text: str, model: str, **params: Any) -> str:
+        """Build the cache key from the text, the model and the request parameters."""
+        key_hash = hashlib.sha256(f"{model}\x00".encode("utf-8"))
+        for name, value in sorted(params.items()):
+            key_hash.update(f"{name}={value}\x00".encode("utf-8"))
+        key_hash.update(text.encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return the hit and miss counters."""
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+    def embed(
+        self,
+        texts: List[str],
+        model: str,
+        embed_batch: Callable[[List[str]], List[List[float]]],
+        **params: Any,
+    ) -> List[List[float]]:
+        """
+        Return the embeddings of the texts, calling embed_batch only for the texts
+        missing from the cache.
+        """
+        keys = [self.get_key(text, model, **params) for text in texts]
+        embeddings = self._get_many(keys)
+        hits = sum(key in embeddings for key in keys)
+        with self.lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+        # the repeated texts are embedded once
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in embeddings:
+                missing.setdefault(key, text)
+
+        if missing:
+            missing_keys, missing_texts = list(missing), list(missing.values())
+            new_embeddings: Dict[str, List[float]] = {}
+            for start in range(0, len(missing_texts), MAX_EMBEDDING_BATCH_SIZE):
+                batch = missing_texts[start : start + MAX_EMBEDDING_BATCH_SIZE]
+                new_embeddings.update(
+                    zip(
+                        missing_keys[start : start + MAX_EMBEDDING_BATCH_SIZE],
+                        embed_batch(batch),
+                    )
+                )
+            self._set_many(model, new_embeddings)
+            embeddings.update(new_embeddings)
+
+        logger.info(
+            f"Embedding cache: {hits} hits, {len(keys) - hits} misses"
+            f" for {model}. Totals: {self.get_stats()}"
+        )
+        return [list(embeddings[key]) for key in keys]
+
+    def _get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        embeddings: Dict[str, List[float]] = {}
+        with self.lock:
+            for key in keys:
+                if key in self.embeddings:
+                    self.embeddings.move_to_end(key)
+                    embeddings[key] = self.embeddings[key].tolist()
+        missing_keys = [key for key in dict.fromkeys(keys) if key not in embeddings]
+        if self.store is not None and missing_keys:
+            try:
+                stored_embeddings = self.store.get_many(missing_keys)
+            except Exception as e:
+                logger.warning(f"Failed to read the embedding store. Error: {e}")
+                stored_embeddings = {}
+            self._remember(stored_embeddings)
+            embeddings.update(stored_embeddings)
+        return embeddings
+
+    def _set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        self._remember(embeddings)
+        if self.store is not None:
+            try:
+                self.store.set_many(model, embeddings)
+            except Exception as e:
+                logger.warning(f"Failed to write the embedding store. Error: {e}")
+
+    def _remember(self, embeddings: Dict[str, List[float]]) -> None:
+        with self.lock:
+            for key, embedding in embeddings.items():
+                self.embeddings[key] = array("d", embedding)
+                self.embeddings.move_to_end(key)
+            while len(self.embeddings) > self.max_entries:
+                self.embeddings.popitem(last=False)
+
+
+class CachedEmbeddings(Embeddings):
+    """LangChain embeddings served from the embedding cache."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model: str,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache or embedding_cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.cache.embed(
+            texts, self.model, self.embeddings.embed_documents, method="documents"
+        )
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.cache.embed(
+            [text],
+            self.model,
+            lambda texts: [self.embeddings.embed_query(texts[0])],
+            method="query",
+        )[0]
+
+
+embedding_cache = EmbeddingCache.from_env()
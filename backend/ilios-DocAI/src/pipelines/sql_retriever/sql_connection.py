@@ -5,11 +5,12 @@ from urllib.parse import quote
 
 import pandas as pd
 import yaml
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
 from src.deployment.cloud_run_job.key_value_extraction.env_enum import Env
 from src.deployment.fast_api.settings import settings
 from src.user_interface.auth import get_secret
+from src.utils.engine_registry import engine_registry
 
 
 logger = logging.getLogger(__name__)
@@ -35,11 +36,12 @@ class SQLEngine:
     @staticmethod
     def get_engine() -> Any:
         """
-        Get the engine for the SQL connection.
+        Get the engine for the SQL connection, shared by all the connectors to the
+        same database.
         :return:
         """
         if os.environ.get("ENV") == Env.LOCAL:
-            return create_engine(
+            return engine_registry.get_engine(
                 f"postgresql://{os.environ['DB_USER']}:"
                 f"{quote(os.environ['DB_PASSWORD'])}"
                 f"@{os.environ['DB_HOST']}/{os.environ['DB_NAME']}"
@@ -55,7 +57,7 @@ class SQLEngine:
         db_host = f"{config.project}:{config.region}:test-db"
         db_name = quote(parsed_data["env_variables"]["db_name"])
 
-        return create_engine(
+        return engine_registry.get_engine(
             f"postgresql+psycopg2://{db_user}:{db_password}"
             f"@/{db_name}?host=/cloudsql/{db_host}"
         )
@@ -63,7 +65,7 @@ class SQLEngine:
 
 class SQLConnector:
     def __init__(self) -> None:
-        self.engine = SQLEngine().get_engine()
+        self.engine = SQLEngine.get_engine()
 
     def execute_query(self, query: str) -> Any:
         """
@@ -1,6 +1,6 @@
 import logging.config
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 from langchain.chains import create_retrieval_chain
@@ -84,6 +84,7 @@ class Pipeline:
         self.reviewer = Reviewer(model_type=self.model_type)
         self.config = config
         self.postprocess_excluded_keys: List[str] | None = None
+        self.processed_files: Dict[Tuple[str, ...], FileSequence] = {}
 
         logger.info("Pipeline initialized with the following parameters:")
         logger.info(f"k: {k}")
@@ -135,6 +136,22 @@ class Pipeline:
         prompt = prompt_template(term, definition, examples=examples)
         return prompt
 
+    def _process_documents(
+        self, file_paths: List[str | Path], pages: List[List[int]] | None = None
+    ) -> FileSequence:
+        """
+        Process the files with Document AI once per run. All the chains built for the
+        same files share the processed output, and page subsets (e.g. first N pages)
+        are selected from it locally instead of being processed again.
+        """
+        key = tuple(str(file_path) for file_path in file_paths)
+        if key not in self.processed_files:
+            self.processed_files[key] = self.processor.process_documents(file_paths)
+        file_sequence = self.processed_files[key]
+        if pages is None:
+            return file_sequence
+        return file_sequence.select_pages(pages)
+
     def _build_a_chain(
         self, file_paths: List[str | Path], pages: List[List[int]] | None = None
     ) -> Any:
@@ -146,7 +163,7 @@ class Pipeline:
         logger.info(f"Preparing file for processing: {file_paths}")
         logger.info(f"Processing pages: {pages}")
         try:
-            file_sequence: FileSequence = self.processor.process_documents(
+            file_sequence: FileSequence = self._process_documents(
                 file_paths, pages=pages
             )
         except Exception as e:
@@ -168,10 +185,15 @@ class Pipeline:
         :return:
         """
         logger.info("Build a default chain")
-        chain = self._build_a_chain(file_paths)
-        logger.info(f"Building project preview for {file_paths}")
+        # processed files are shared by the chains of this run only
+        self.processed_files = {}
+        try:
+            chain = self._build_a_chain(file_paths)
+            logger.info(f"Building project preview for {file_paths}")
 
-        responses = self.build_responses(chain, file_paths)
+            responses = self.build_responses(chain, file_paths)
+        finally:
+            self.processed_files = {}
 
         logger.info(f"Finished batch processing for {file_paths}")
 
@@ -286,7 +308,7 @@ class PipelineLoanAgreement(Pipeline):
         logger.info(f"Preparing file for processing: {file_paths}")
         logger.info(f"Processing pages: {pages}")
         try:
-            file_sequence: FileSequence = self.processor.process_documents(
+            file_sequence: FileSequence = self._process_documents(
                 file_paths, pages=pages
             )
         except Exception as e:
@@ -368,7 +390,7 @@ class PipelinePVSyst(Pipeline):
         retrieval_qa_chat_prompt = rag_prompt_template_pvsyst()
         logger.info(f"Preparing file for processing: {file_paths}")
         try:
-            file_sequence: FileSequence = self.processor.process_documents(file_paths)
+            file_sequence: FileSequence = self._process_documents(file_paths)
         except Exception as e:
             raise ValueError(f"Failed to create FileSequence. Error: {e}")
         self.retriever = self.vectordb.retriever_from_file_sequence(file_sequence)
@@ -558,7 +580,7 @@ class PipelineSubscriberMgmt(Pipeline):
         logger.info(f"Preparing file for processing: {file_paths}")
         logger.info(f"Processing pages: {pages}")
         try:
-            file_sequence: FileSequence = self.processor.process_documents(
+            file_sequence: FileSequence = self._process_documents(
                 file_paths, pages=pages
             )
         except Exception as e:
@@ -581,7 +603,7 @@ class PipelineSubscriberMgmt(Pipeline):
         logger.info(f"Preparing file for processing: {file_paths}")
         logger.info(f"Processing pages: {pages}")
         try:
-            file_sequence: FileSequence = self.processor.process_documents(
+            file_sequence: FileSequence = self._process_documents(
                 file_paths, pages=pages
             )
         except Exception as e:
@@ -704,7 +726,7 @@ class PipelineOperatingAgreement(PipelineSubscriberMgmt):
         logger.info(f"Preparing file for processing: {file_paths}")
         logger.info(f"Processing pages: {pages}")
         try:
-            file_sequence: FileSequence = self.processor.process_documents(
+            file_sequence: FileSequence = self._process_documents(
                 file_paths, pages=pages
             )
         except Exception as e:
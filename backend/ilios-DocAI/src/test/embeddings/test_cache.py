@@ -0,0 +1,76 @@
+from typing import Dict, List
+
+from src.embeddings import cache as cache_module
+from src.embeddings.cache import EmbeddingCache
+
+
+class FakeStore:
+    """Embedding store kept in a dictionary"""
+
+    def __init__(self) -> None:
+        self.embeddings: Dict[str, List[float]] = {}
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        return {key: self.embeddings[key] for key in keys if key in self.embeddings}
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        self.embeddings.update(embeddings)
+
+
+def _embed_batch(calls: List[List[str]]):  # type: ignore
+    """Return an embedding function recording the texts of each call"""
+
+    def embed_batch(texts: List[str]) -> List[List[float]]:
+        calls.append(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    return embed_batch
+
+
+def test_get_key() -> None:
+    """Test that the key depends on the text, the model and the parameters"""
+    key = EmbeddingCache.get_key("text", "model", task="query")
+    assert key == EmbeddingCache.get_key("text", "model", task="query")
+    assert key != EmbeddingCache.get_key("other text", "model", task="query")
+    assert key != EmbeddingCache.get_key("text", "other model", task="query")
+    assert key != EmbeddingCache.get_key("text", "model", task="document")
+
+
+def test_embed_missing_texts_only() -> None:
+    """Test that only the texts missing from the cache are embedded, once"""
+    calls: List[List[str]] = []
+    cache = EmbeddingCache()
+    assert cache.embed(["a", "bb"], "model", _embed_batch(calls)) == [
+        [1.0, 1.0],
+        [2.0, 1.0],
+    ]
+    assert cache.embed(["bb", "ccc", "ccc"], "model", _embed_batch(calls)) == [
+        [2.0, 1.0],
+        [3.0, 1.0],
+        [3.0, 1.0],
+    ]
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert cache.get_stats() == {"hits": 1, "misses": 4, "hit_rate": 0.2}
+
+
+def test_embed_batches(monkeypatch) -> None:  # type: ignore
+    """Test that the missing texts are embedded in batches of the maximum size"""
+    monkeypatch.setattr(cache_module, "MAX_EMBEDDING_BATCH_SIZE", 2)
+    calls: List[List[str]] = []
+    EmbeddingCache().embed(["a", "b", "c"], "model", _embed_batch(calls))
+    assert calls == [["a", "b"], ["c"]]
+
+
+def test_lru_and_store() -> None:
+    """Test that evicted embeddings are read back from the store"""
+    calls: List[List[str]] = []
+    store = FakeStore()
+    cache = EmbeddingCache(max_entries=1, store=store)
+    cache.embed(["a"], "model", _embed_batch(calls))
+    cache.embed(["b"], "model", _embed_batch(calls))
+    assert len(cache.embeddings) == 1
+    assert cache.embed(["a"], "model", _embed_batch(calls)) == [[1.0, 1.0]]
+    assert EmbeddingCache(store=store).embed(["b"], "model", _embed_batch(calls)) == [
+        [1.0, 1.0]
+    ]
+    assert calls == [["a"], ["b"]]
@@ -0,0 +1,86 @@
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.cloud.documentai_v1 import Document
+
+from src.doc_ai.cache import DocumentCache
+
+
+def test_get_key() -> None:
+    """Test that the key depends on the content, pages and processor"""
+    key = DocumentCache.get_key("hash", [0, 1], "processor")
+    assert key == DocumentCache.get_key("hash", [0, 1], "processor")
+    assert key != DocumentCache.get_key("other_hash", [0, 1], "processor")
+    assert key != DocumentCache.get_key("hash", [0, 2], "processor")
+    assert key != DocumentCache.get_key("hash", [0, 1], "processor/versions/2")
+
+
+def test_get_set(tmp_path: Path) -> None:
+    """Test that the stored document is loaded back from the local cache"""
+    cache = DocumentCache(path=tmp_path, max_size_bytes=1024)
+    assert cache.get("key") is None
+    cache.set("key", Document(text="Test document text"))
+    assert cache.get("key").text == "Test document text"
+
+
+def test_evict(tmp_path: Path) -> None:
+    """Test that the least recently used entries are evicted over the size limit"""
+    document = Document(text="x" * 100)
+    cache = DocumentCache(path=tmp_path, max_size_bytes=250)
+    cache.set("first", document)
+    cache.set("second", document)
+    os.utime(tmp_path / "first.pb", (0, 0))
+    os.utime(tmp_path / "second.pb", (1, 1))
+    assert cache.get("first") is not None  # marks "first" as recently used
+    cache.set("third", document)
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+
+
+def test_evict_interval(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the entries are listed on first write, every N writes and over limit"""
+    monkeypatch.setattr(DocumentCache, "EVICTION_INTERVAL_WRITES", 3)
+    cache = DocumentCache(path=tmp_path, max_size_bytes=1024)
+    list_entries = MagicMock(wraps=cache._list_entries)
+    monkeypatch.setattr(cache, "_list_entries", list_entries)
+    for key in ["first", "second", "third", "fourth"]:
+        cache.set(key, Document(text="x" * 100))
+    assert list_entries.call_count == 2
+    cache.set("fifth", Document(text="x" * 1000))
+    assert list_entries.call_count == 3
+    assert cache.get("first") is None
+
+
+@patch("src.doc_ai.cache.storage.Client")
+def test_gcs_least_recently_used(client: MagicMock) -> None:
+    """Test that GCS hits refresh the custom time, which orders the eviction"""
+    bucket = client.return_value.bucket.return_value
+    cache = DocumentCache(path="gs://bucket/prefix", max_size_bytes=150)
+
+    blob = bucket.blob.return_value
+    blob.download_as_bytes.return_value = Document.serialize(Document(text="text"))
+    assert cache.get("key").text == "text"
+    bucket.blob.assert_called_with("prefix/key.pb")
+    assert isinstance(blob.custom_time, datetime)
+    blob.patch.assert_called_once()
+
+    used_blob = MagicMock(
+        size=100,
+        time_created=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        custom_time=datetime(2024, 1, 3, tzinfo=timezone.utc),
+    )
+    used_blob.name = "prefix/used.pb"
+    unused_blob = MagicMock(
+        size=100,
+        time_created=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        custom_time=datetime(2024, 1, 2, tzinfo=timezone.utc),
+    )
+    unused_blob.name = "prefix/unused.pb"
+    bucket.list_blobs.return_value = [used_blob, unused_blob]
+    cache.set("new", Document(text="x"))
+    bucket.blob.assert_called_with("prefix/unused.pb")
+    bucket.blob.return_value.delete.assert_called_once()
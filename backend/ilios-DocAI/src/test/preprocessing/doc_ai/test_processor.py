@@ -1,7 +1,9 @@
 from typing import List
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from google.api_core.exceptions import ResourceExhausted
+from google.cloud.documentai_v1 import Document
 
 from src.doc_ai.processor import DocAIProcessor
 
@@ -45,3 +47,50 @@ def test_get_process_options(
     """
     process_options = processor.get_process_options(pages=pages)
     assert len(process_options.individual_page_selector.pages) == expected_length
+
+
+@patch("src.doc_ai.processor.time.sleep")
+@patch("src.doc_ai.processor.File")
+def test_process_document_batches(
+    mock_file_cls: Mock, mock_sleep: Mock, processor: DocAIProcessor
+) -> None:
+    """
+    Test that the batches are processed concurrently, retried on transient errors,
+    reassembled in the order of pages, and that failed batches are reported
+    """
+    file = mock_file_cls.return_value
+    file.all_pages = [0, 1, 2, 3]
+    file.content_hash = "hash"
+    file.failed_pages = []
+    file.get_pdf_page_sizes.return_value = [10, 10, 10, 10]
+    file.get_pages.side_effect = lambda batch: str(batch[0]).encode()
+    processor.DOC_AI_API_PAGE_LIMIT = 1
+    processor.cache = None
+    attempts: List[bytes] = []
+
+    def process_document(request):  # type: ignore
+        content = request.raw_document.content
+        attempts.append(content)
+        if content == b"1" and attempts.count(content) == 1:
+            raise ResourceExhausted("quota")
+        if content == b"2":
+            raise ValueError("failure")
+        return Mock(document=Document(text=content.decode()))
+
+    with patch.object(processor.client, "process_document", process_document):
+        processed_file = processor.process_document("file.pdf")
+
+    document_sequence = file.add_docai_representation.call_args[0][0]
+    assert processed_file == file
+    assert [document.text for document in document_sequence] == ["0", "1", "3"]
+    assert document_sequence.source_pages == [[0], [1], [3]]
+    assert processed_file.failed_pages == [2]
+    assert attempts.count(b"1") == 2
+
+
+def test_create_batches_oversized_page(processor: DocAIProcessor) -> None:
+    """Test that a page over the size limit gets its own batch, never an empty one"""
+    limit = processor.DOCUMENT_SIZE_LIMIT
+    batches = list(processor.create_batches([limit + 1, 1, 1, limit + 1], [0, 1, 2, 3]))
+    assert batches == [[0], [1, 2], [3]]
+    assert list(processor.create_batches([1], [])) == []
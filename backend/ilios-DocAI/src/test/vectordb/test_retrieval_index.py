@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from langchain_community.retrievers import TFIDFRetriever
+from langchain_core.documents import Document
+
+from src.vectordb.retrieval_index import RetrievalIndex, RetrievalIndexStore
+
+
+def _index(key: str) -> RetrievalIndex:
+    """Create a RetrievalIndex with a TF-IDF retriever"""
+    return RetrievalIndex(
+        key=key,
+        text_retriever=TFIDFRetriever.from_documents(
+            [Document("rent"), Document("term")]
+        ),
+    )
+
+
+def test_get_key() -> None:
+    """Test that the key depends on the content, the model and the chunking params"""
+    key = RetrievalIndex.get_key("text", ["table"], "model", chunk_size=600)
+    assert key == RetrievalIndex.get_key("text", ["table"], "model", chunk_size=600)
+    assert key != RetrievalIndex.get_key("text", ["table"], "model", chunk_size=300)
+    assert key != RetrievalIndex.get_key("text", [], "model", chunk_size=600)
+    assert key != RetrievalIndex.get_key(
+        "other text", ["table"], "model", chunk_size=600
+    )
+    assert key != RetrievalIndex.get_key(
+        "text", ["table"], "other model", chunk_size=600
+    )
+
+
+def test_memory_store() -> None:
+    """Test that the least recently used indexes are evicted from memory"""
+    store = RetrievalIndexStore(max_entries=2)
+    first, second, third = _index("first"), _index("second"), _index("third")
+    store.set(first)
+    store.set(second)
+    assert store.get("first") is first
+    store.set(third)
+    assert store.get("second") is None
+    assert store.get("first") is first
+    assert store.get("third") is third
+
+
+def test_disk_store(tmp_path: Path) -> None:
+    """Test that the index is loaded back from disk by a new store"""
+    RetrievalIndexStore(path=str(tmp_path)).set(_index("key"))
+    index = RetrievalIndexStore(path=str(tmp_path)).get("key")
+    assert index is not None
+    assert index.text_retriever.invoke("rent")[0].page_content == "rent"
@@ -18,6 +18,14 @@ class PGVectorConfig:
     project: str = "prj-ilios-ai"
     host: str = "/cloudsql/prj-ilios-ai:us-west1:chatbot-vector-store"
     ip_type: str = "PUBLIC"
+    # set once scripts/sql/document_embeddings_hybrid_search.sql is applied
+    indexed_search: bool = (
+        os.environ.get("PG_VECTOR_INDEXED_SEARCH", "false").lower() == "true"
+    )
+    # set once scripts/sql/document_embeddings_chunk_index.sql is applied
+    chunk_upsert: bool = (
+        os.environ.get("PG_VECTOR_CHUNK_UPSERT", "false").lower() == "true"
+    )
 
     def get_project_id(self) -> str:
         """Get the project ID based on the environment."""
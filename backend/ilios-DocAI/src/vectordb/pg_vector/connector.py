@@ -1,17 +1,28 @@
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
-from sqlalchemy import create_engine, text
+from psycopg2.extras import execute_values
+from sqlalchemy import text
 from typing_extensions import LiteralString
 
 from src.user_interface.auth import get_secret
+from src.utils.engine_registry import engine_registry
 from src.vectordb.pg_vector.config import PGVectorConfig
-from src.vectordb.pg_vector.sql import insert_sql
+from src.vectordb.pg_vector.sql import (
+    delete_trailing_chunks_sql,
+    insert_sql,
+    insert_sql_template,
+    upsert_sql,
+    upsert_sql_template,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# rows sent in one INSERT statement
+STORE_DOCUMENTS_PAGE_SIZE = 500
+
 
 class PGVectorConnector:
     """Class used to connect to the PGVector database."""
@@ -24,7 +35,8 @@ class PGVectorConnector:
 
     def get_engine(self) -> Any:
         """
-        Get the engine for the SQL connection.
+        Get the engine for the SQL connection, shared by all the connectors to the
+        same database.
         :return:
         """
         db_user = quote(self.config.user)
@@ -34,7 +46,7 @@ class PGVectorConnector:
         db_host = quote(self.config.host)
         db_name = quote(self.config.database_name)
 
-        return create_engine(
+        return engine_registry.get_engine(
             f"postgresql+psycopg2://{db_user}:{db_password}"
             f"@/{db_name}?host={db_host}"
         )
@@ -57,17 +69,74 @@ class PGVectorConnector:
         return result
 
     def store_documents(
-        self, documents: List[Dict[str, Any]], sql_statement: LiteralString = insert_sql
+        self,
+        documents: List[Dict[str, Any]],
+        sql_statement: LiteralString = insert_sql,
+        template: LiteralString = insert_sql_template,
     ) -> None:
-        """Store the documents in the Vector Database."""
+        """
+        Store the documents in the Vector Database. The rows are sent with
+        execute_values, one statement per STORE_DOCUMENTS_PAGE_SIZE rows instead of
+        one round trip per row.
+        """
         try:
-            with self.engine.connect() as connection:
-                for document in documents:
-                    connection.execute(text(sql_statement), document)
-                connection.commit()
+            self._write_documents(documents, sql_statement, template)
         except Exception as e:
             print(f"An error occurred: {e}")
 
+    def upsert_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """
+        Store the file chunks, replacing the ones already stored for the same
+        (file_id, chunk_index), so a file can be re-indexed without duplicates. The
+        chunks left over from a longer previous version of the file, and the ones
+        stored without chunk_index before the migration, are deleted in the same
+        transaction.
+        """
+        chunks_counts: Dict[int, int] = {}
+        for document in documents:
+            chunks_counts[document["file_id"]] = max(
+                chunks_counts.get(document["file_id"], 0), document["chunk_index"] + 1
+            )
+        try:
+            self._write_documents(
+                documents,
+                upsert_sql,
+                upsert_sql_template,
+                [
+                    {"file_id": file_id, "chunks_count": chunks_count}
+                    for file_id, chunks_count in chunks_counts.items()
+                ],
+            )
+        except Exception:
+            logger.exception("Error upserting documents")
+            raise
+
+    def _write_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        sql_statement: LiteralString,
+        template: LiteralString,
+        trailing_chunks: Optional[List[Dict[str, int]]] = None,
+    ) -> None:
+        if not documents:
+            return
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    sql_statement,
+                    documents,
+                    template=template,
+                    page_size=STORE_DOCUMENTS_PAGE_SIZE,
+                )
+                if trailing_chunks:
+                    cursor.executemany(delete_trailing_chunks_sql, trailing_chunks)
+            connection.commit()
+        finally:
+            connection.close()
+        logger.info(f"Stored {len(documents)} rows.")
+
     def mark_actual(self, file_id: int, actual: bool) -> None:
         """Mark the file as actual or not actual."""
         try:
@@ -6,7 +6,12 @@ from src.embeddings.vertex import VertexAIEmbedder
 from src.pipelines.constants import AgreementType
 from src.vectordb.pg_vector.config import PGVectorConfig
 from src.vectordb.pg_vector.connector import PGVectorConnector
-from src.vectordb.pg_vector.sql import retriever_sql, retriever_sql_by_document_name
+from src.vectordb.pg_vector.sql import (
+    indexed_retriever_sql,
+    indexed_retriever_sql_by_document_name,
+    retriever_sql,
+    retriever_sql_by_document_name,
+)
 
 
 class PGVectorRetriever:
@@ -34,9 +39,17 @@ class PGVectorRetriever:
         filters["embedding"] = query_embedding
         filters["query"] = query
         if filters.get("document_name") is not None:
-            retriever_sql_adjusted = retriever_sql_by_document_name[::]
+            retriever_sql_adjusted = (
+                indexed_retriever_sql_by_document_name
+                if self.config.indexed_search
+                else retriever_sql_by_document_name[::]
+            )
         else:
-            retriever_sql_adjusted = retriever_sql[::]
+            retriever_sql_adjusted = (
+                indexed_retriever_sql
+                if self.config.indexed_search
+                else retriever_sql[::]
+            )
 
         result = self.db_connector.execute_retrieval_query(
             retriever_sql_adjusted, filters
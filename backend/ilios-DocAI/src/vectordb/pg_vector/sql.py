@@ -65,15 +65,63 @@ ORDER BY score DESC
 LIMIT 5
 """
 
+# Same hybrid search on the content_tsv column stored by
+# scripts/sql/document_embeddings_hybrid_search.sql, instead of computing the tsvector
+# of every candidate row at query time.
+indexed_retriever_sql = retriever_sql.replace(
+    "to_tsvector('english', content)", "content_tsv"
+)
+
+indexed_retriever_sql_by_document_name = retriever_sql_by_document_name.replace(
+    "to_tsvector('english', content)", "content_tsv"
+)
+
+# Bulk inserts, run with psycopg2.extras.execute_values: the VALUES %s placeholder is
+# expanded with one template per row, so a page of rows is sent in one statement.
 insert_sql = """
-    INSERT INTO document_embeddings (file_id, site_name, site_id, company_name, company_id, agreement_type, document_name, file_name, section_name, subsection_name, keywords, risks, summary, summary_embedding, document, content, embedding, actual) 
-    VALUES ( :file_id, :site_name, :site_id, :company_name, :company_id, :agreement_type, :document_name, :file_name, :section_name, :subsection_name, :keywords, :risks, :summary, :summary_embedding ::vector, :document, :content, :embedding ::vector, :actual)
+    INSERT INTO document_embeddings (file_id, site_name, site_id, company_name, company_id, agreement_type, document_name, file_name, section_name, subsection_name, keywords, risks, summary, summary_embedding, document, content, embedding, actual)
+    VALUES %s
+"""
+
+insert_sql_template = """(
+    %(file_id)s, %(site_name)s, %(site_id)s, %(company_name)s, %(company_id)s, %(agreement_type)s, %(document_name)s, %(file_name)s, %(section_name)s, %(subsection_name)s, %(keywords)s, %(risks)s, %(summary)s, %(summary_embedding)s ::vector, %(document)s, %(content)s, %(embedding)s ::vector, %(actual)s
+)"""
+
+# Re-indexing a file replaces its chunks instead of duplicating them. Requires the
+# unique index created by scripts/sql/document_embeddings_chunk_index.sql.
+upsert_sql = """
+    INSERT INTO document_embeddings (file_id, chunk_index, site_name, site_id, company_name, company_id, agreement_type, document_name, file_name, section_name, subsection_name, keywords, risks, summary, summary_embedding, document, content, embedding, actual)
+    VALUES %s
+    ON CONFLICT (file_id, chunk_index) DO UPDATE SET
+    site_name = EXCLUDED.site_name, site_id = EXCLUDED.site_id, company_name = EXCLUDED.company_name, company_id = EXCLUDED.company_id, agreement_type = EXCLUDED.agreement_type, document_name = EXCLUDED.document_name, file_name = EXCLUDED.file_name, section_name = EXCLUDED.section_name, subsection_name = EXCLUDED.subsection_name, keywords = EXCLUDED.keywords, risks = EXCLUDED.risks, summary = EXCLUDED.summary, summary_embedding = EXCLUDED.summary_embedding, document = EXCLUDED.document, content = EXCLUDED.content, embedding = EXCLUDED.embedding
+"""
+
+upsert_sql_template = insert_sql_template.replace(
+    "%(file_id)s, ", "%(file_id)s, %(chunk_index)s, ", 1
+)
+
+# Chunks of the previous version of a file past its new length, and the ones stored
+# before the chunk_index migration, which the upsert cannot match.
+delete_trailing_chunks_sql = """
+    DELETE FROM document_embeddings WHERE file_id = %(file_id)s AND (chunk_index >= %(chunks_count)s OR chunk_index IS NULL)
 """
 
 insert_sql_chatbot_history = """
     INSERT INTO chatbot_history (
     conversation_id, user_id, company_id, site_id, message, message_type, message_index
-) VALUES (
+) VALUES %s
+"""
+
+insert_sql_chatbot_history_template = """(
     %(conversation_id)s, %(user_id)s, %(company_id)s, %(site_id)s, %(message)s, %(message_type)s, %(message_index)s
-)
+)"""
+
+select_embedding_cache_sql = """
+    SELECT key, embedding::text FROM embedding_cache WHERE key = ANY(:keys)
+"""
+
+insert_embedding_cache_sql = """
+    INSERT INTO embedding_cache (key, model, embedding)
+    VALUES (:key, :model, :embedding ::vector)
+    ON CONFLICT (key) DO NOTHING
 """
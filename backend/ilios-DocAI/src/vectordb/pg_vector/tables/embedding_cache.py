@@ -0,0 +1,12 @@
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, DateTime, String, func
+
+from src.vectordb.pg_vector.tables.document_embeddings import Base
+
+
+class EmbeddingCacheModel(Base):  # type: ignore
+    __tablename__ = "embedding_cache"
+    key = Column(String, primary_key=True)
+    model = Column(String)
+    embedding = Column(Vector())
+    created_at = Column(DateTime, server_default=func.now())
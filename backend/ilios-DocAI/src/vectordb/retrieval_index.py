@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetrievalIndex:
+    """
+    Retrieval index built once per file content and chunking parameters: text chunks
+    with their TF-IDF retriever, and table documents with the embeddings of their
+    chunks, so chains built for the same file reuse them without vectorization and
+    embedding calls.
+    """
+
+    key: str
+    text_retriever: BaseRetriever
+    table_docs: List[Document] = field(default_factory=list)
+    table_docs_ids: List[str] = field(default_factory=list)
+    table_sub_docs: List[Document] = field(default_factory=list)
+    table_embeddings: List[List[float]] = field(default_factory=list)
+    # built lazily from the table embeddings, not serialized
+    tables_retriever: Optional[BaseRetriever] = field(default=None, compare=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["tables_retriever"] = None
+        return state
+
+    @staticmethod
+    def get_key(text: str, tables: List[str], model: str, **params: Any) -> str:
+        """
+        Build the index key from the file content, the embedding model of the table
+        chunks and the chunking parameters.
+        """
+        key_hash = hashlib.sha256(f"{model}\x00".encode("utf-8"))
+        for name, value in sorted(params.items()):
+            key_hash.update(f"{name}={value}\x00".encode("utf-8"))
+        for content in [text, *tables]:
+            key_hash.update(content.encode("utf-8"))
+            key_hash.update(b"\x00")
+        return key_hash.hexdigest()
+
+
+class PrecomputedEmbeddings(Embeddings):
+    """Embeddings served from the precomputed vectors, falling back to the model."""
+
+    def __init__(self, embeddings: Embeddings, vectors: Dict[str, List[float]]):
+        self.embeddings = embeddings
+        self.vectors = vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        missing_texts = [text for text in texts if text not in self.vectors]
+        if missing_texts:
+            self.vectors.update(
+                zip(missing_texts, self.embeddings.embed_documents(missing_texts))
+            )
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+
+class RetrievalIndexStore:
+    """
+    Keeps the recently used retrieval indexes in memory and, if the path is set
+    (RETRIEVAL_INDEX_CACHE_PATH environment variable), serialized on the local disk
+    to reuse them across runs.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 8) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.indexes: OrderedDict[str, RetrievalIndex] = OrderedDict()
+        self.lock = threading.Lock()
+        if self.path:
+            os.makedirs(self.path, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> "RetrievalIndexStore":
+        """Create the store from the RETRIEVAL_INDEX_CACHE_PATH environment variable."""
+        return cls(path=os.environ.get("RETRIEVAL_INDEX_CACHE_PATH") or None)
+
+    def get(self, key: str) -> Optional[RetrievalIndex]:
+        """Return the index from memory or disk, or None if it was not built yet."""
+        with self.lock:
+            if key in self.indexes:
+                self.indexes.move_to_end(key)
+                return self.indexes[key]
+        if not self.path:
+            return None
+        try:
+            with open(self._get_index_path(key), "rb") as f:
+                index: RetrievalIndex = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load retrieval index {key}. Error: {e}")
+            return None
+        logger.info(f"Loaded retrieval index {key}")
+        self._remember(index)
+        return index
+
+    def set(self, index: RetrievalIndex) -> None:
+        """Store the index in memory and on disk."""
+        self._remember(index)
+        if not self.path:
+            return
+        try:
+            # write to a temporary file first, so readers never see partial data
+            fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(index, f)
+            os.replace(temp_path, self._get_index_path(index.key))
+        except Exception as e:
+            logger.warning(f"Failed to save retrieval index {index.key}. Error: {e}")
+
+    def _remember(self, index: RetrievalIndex) -> None:
+        with self.lock:
+            self.indexes[index.key] = index
+            self.indexes.move_to_end(index.key)
+            while len(self.indexes) > self.max_entries:
+                self.indexes.popitem(last=False)
+
+    def _get_index_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.pkl")  # type: ignore
+
+
+retrieval_index_store = RetrievalIndexStore.from_env()
@@ -0,0 +1,33 @@
+"""make alerts external id unique
+
+Revision ID: 5646796ee4c6
+Revises: cca6e036f390
+Create Date: 2026-10-17 18:40:12.317205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5646796ee4c6'
+down_revision: Union[str, None] = 'cca6e036f390'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # keep the earliest alert for the device external ID, tasks of removed duplicates are unlinked (SET NULL)
+    op.execute(
+        "DELETE FROM alerts AS duplicate USING alerts AS original "
+        "WHERE duplicate.device_id = original.device_id "
+        "AND duplicate.external_id = original.external_id "
+        "AND duplicate.id > original.id"
+    )
+    op.create_unique_constraint('u_alert_device_id_external_id', 'alerts', ['device_id', 'external_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('u_alert_device_id_external_id', 'alerts', type_='unique')
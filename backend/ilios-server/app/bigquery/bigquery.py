@@ -1,32 +1,98 @@
 import logging
 import textwrap
+import threading
 from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date
 from typing import Any
 
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
 
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+class BigQueryClientRegistry:
+    """
+    Process-wide, thread-safe registry of BigQuery clients.
+    Credentials are loaded once and the client with its pooled HTTP session is created once per project,
+    then shared by all the engines, so there is no per-request client setup and TLS handshake.
+    """
+
+    _lock = threading.Lock()
+    _clients: dict[str, bigquery.Client] = {}
+    # counters for monitoring purposes
+    clients_created = 0
+    queries_in_flight = 0
+
+    @classmethod
+    def get_client(cls, project_id: str) -> bigquery.Client:
+        client = cls._clients.get(project_id)
+        if client is None:
+            with cls._lock:
+                # double-checked, since other thread might create the client while we were waiting for the lock
+                client = cls._clients.get(project_id)
+                if client is None:
+                    client = cls._create_client(project_id)
+                    cls._clients[project_id] = client
+                    cls.clients_created += 1
+                    logger.info(f"BigQuery client created for project={project_id}, total={cls.clients_created}")
+        return client
+
+    @staticmethod
+    def _create_client(project_id: str) -> bigquery.Client:
+        credentials = service_account.Credentials.from_service_account_file(
+            settings.service_account_key_file_path, scopes=bigquery.Client.SCOPE
+        )
+        # keep-alive connections pool shared by all the threads using the client
+        http_session = AuthorizedSession(credentials)
+        http_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.bq_http_pool_maxsize)
+        http_session.mount("https://", http_adapter)
+        return bigquery.Client(project=project_id, credentials=credentials, _http=http_session)
+
+    @classmethod
+    @contextmanager
+    def track_query(cls):
+        """Keep count of queries being executed at the moment across the process"""
+        with cls._lock:
+            cls.queries_in_flight += 1
+        try:
+            yield
+        finally:
+            with cls._lock:
+                cls.queries_in_flight -= 1
+
+    @classmethod
+    def reset(cls) -> None:
+        """Close and forget all the registered clients"""
+        with cls._lock:
+            for client in cls._clients.values():
+                client.close()
+            cls._clients.clear()
+
+
 class BigQueryReadEngine:
 
     def __init__(self) -> None:
         self.query_job_id_prefix = settings.telemetry_bq_job_id_prefix
-        credentials = service_account.Credentials.from_service_account_file(settings.service_account_key_file_path)
-        self._client = bigquery.Client(project=settings.telemetry_bq_project_id, credentials=credentials)
+        self._client = BigQueryClientRegistry.get_client(settings.telemetry_bq_project_id)
         self.bq_dataset_name = f"platform_{settings.environment_name}"
 
     def execute_query(self, query: str) -> Iterator[dict[str, Any]]:
         query = textwrap.dedent(query).strip()
-        query_job = self._client.query(query, job_id_prefix=self.query_job_id_prefix)
+        with BigQueryClientRegistry.track_query():
+            query_job = self._client.query(query, job_id_prefix=self.query_job_id_prefix)
 
-        logger.info(f"Executing query in BigQuery query={query}")
+            logger.info(
+                f"Executing query in BigQuery query={query}, "
+                f"queries_in_flight={BigQueryClientRegistry.queries_in_flight}"
+            )
 
-        row_iterator = query_job.result()
+            row_iterator = query_job.result()
 
         # TODO thinking about return list on this level, rather than wrap each and every call into list
         return map(self._row_to_dict, row_iterator)
@@ -75,9 +141,10 @@ class BigQueryWriteEngine(BigQueryReadEngine):
         query_params = self._generate_query_params(record, is_update=False)
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
-        query_job = self._client.query(query, job_config=job_config)
-        # wait BQ job to complete, to return results directly to user
-        query_job.result()
+        with BigQueryClientRegistry.track_query():
+            query_job = self._client.query(query, job_config=job_config)
+            # wait BQ job to complete, to return results directly to user
+            query_job.result()
 
     def update_bq_record(self, table_id: str, record: dict, condition: str):
         """Update BQ record. Uses similar to the <insert_bq_record> method query-parametrized job approach,
@@ -89,8 +156,9 @@ class BigQueryWriteEngine(BigQueryReadEngine):
         job_config = bigquery.QueryJobConfig()
         job_config.query_parameters = query_params
 
-        query_job = self._client.query(query, job_config=job_config)
-        query_job.result()
+        with BigQueryClientRegistry.track_query():
+            query_job = self._client.query(query, job_config=job_config)
+            query_job.result()
 
     def _generate_query_params(self, record, is_update=False):
         query_params = []
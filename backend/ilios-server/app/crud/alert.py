@@ -1,6 +1,7 @@
 from typing import Optional, Set
 
 from sqlalchemy import String, asc, case, cast, desc, func
+from sqlalchemy.dialects.postgresql import insert
 
 from app import static
 from app.crud.base_crud import BaseCRUD
@@ -233,3 +234,21 @@ class AlertCRUD(BaseCRUD):
             self.model.device_id == device_id, self.model.external_id == external_id
         )
         return query.one_or_none()
+
+    def create_items_skip_existing(self, items: list[dict]) -> set[tuple[int, str]]:
+        """Insert alerts with the single statement skipping the ones already existing for the device external ID.
+
+        :param items: list of dicts with full alert bodies
+        :return: set of (device_id, external_id) of the created alerts
+        """
+        if not items:
+            return set()
+        query = (
+            insert(self.model)
+            .values(items)
+            .on_conflict_do_nothing(constraint="u_alert_device_id_external_id")
+            .returning(self.model.device_id, self.model.external_id)
+        )
+        created_alerts = {(device_id, external_id) for device_id, external_id in self.db_session.execute(query)}
+        self.db_session.commit()
+        return created_alerts
@@ -8,6 +8,7 @@ from sqlalchemy import case, func, or_
 import app.static as static
 from app.crud.base_crud import BaseCRUD
 from app.db.base_class import Base
+from app.helpers.principal_cache import mark_principals_changed
 from app.models.company import Company
 from app.models.site import Site, SiteAdditionalFieldList, SiteStatuses
 from app.schema.common import OrderDirectionEnum
@@ -21,6 +22,11 @@ class CompanyCRUD(BaseCRUD):
     def __init__(self, db_session):
         super().__init__(model=Company, db_session=db_session)
 
+    def delete_by_id(self, target_id) -> int:
+        # user projects of the company are deleted by the DB cascade
+        mark_principals_changed(self.db_session)
+        return super().delete_by_id(target_id)
+
     @staticmethod
     def _build_system_size_clause(field_name):
         """Build statement to sum input system size attr only for sites which have <Placed in Service> status"""
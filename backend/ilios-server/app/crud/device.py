@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 from fastapi_filter.contrib.sqlalchemy import Filter
 from sqlalchemy.orm import Session
@@ -40,3 +40,8 @@ class DeviceCRUD(BaseCRUD):
             query = search_filter.filter(query)
         query = self._add_order_by(query, None, None)
         return query.all()
+
+    def get_existing_ids(self, ids: Iterable[int]) -> set[int]:
+        """Return the subset of provided IDs that belong to existing devices"""
+        query = self.db_session.query(self.model.id).filter(self.model.id.in_(set(ids)))
+        return {device_id for (device_id,) in query}
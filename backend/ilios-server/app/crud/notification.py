@@ -1,11 +1,14 @@
 from sqlalchemy import asc, desc
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 import app.static as static
 from app.db.base import Notification
 
-from ..models.board import Board, BoardModuleEnum
+from ..models.board import Board, BoardModuleEnum, BoardRelatedEntity
+from ..models.comment import Comment, CommentedEntity
+from ..models.document import Document, DocumentKey
 from ..models.notification import NotificationSubject, NotificationSubjectsEnum
+from ..models.site import Site
 from ..models.task import Task
 from .base_crud import BaseCRUD
 
@@ -46,4 +49,42 @@ class NotificationCRUD(BaseCRUD):
         unread_count = query.filter(self.model.seen == False).count()  # noqa: E712
         query = query.order_by(asc(self.model.seen), desc(self.model.created_at))
         total = query.count()
+        query = query.options(selectinload(self.model.subject), selectinload(self.model.actor))
         return total, unread_count, query.offset(skip).limit(limit).all()
+
+    def get_task_subjects(self, tasks_ids):
+        """Return tasks by IDs with boards, statuses and related entities needed to render the notifications"""
+        if not tasks_ids:
+            return []
+        board_loader = selectinload(Task.board)
+        related_entity_loader = board_loader.selectinload(Board.related_entity)
+        return (
+            self.db_session.query(Task)
+            .filter(Task.id.in_(tasks_ids))
+            .options(
+                board_loader.selectinload(Board.statuses),
+                related_entity_loader.selectinload(BoardRelatedEntity.parent_entity_company),
+                related_entity_loader.selectinload(BoardRelatedEntity.parent_entity_site).selectinload(Site.company),
+            )
+            .all()
+        )
+
+    def get_comment_subjects(self, comments_ids):
+        """Return comments by IDs with commented documents and document keys needed to render the notifications.
+        Commented tasks are expected to be loaded with get_task_subjects"""
+        if not comments_ids:
+            return []
+        commented_entity_loader = selectinload(Comment.commented_entity)
+        document_loader = commented_entity_loader.selectinload(CommentedEntity.parent_entity_document)
+        document_key_loader = commented_entity_loader.selectinload(CommentedEntity.parent_entity_documentkey)
+        return (
+            self.db_session.query(Comment)
+            .filter(Comment.id.in_(comments_ids))
+            .options(
+                document_loader.selectinload(Document.site).selectinload(Site.company),
+                document_key_loader.selectinload(DocumentKey.document)
+                .selectinload(Document.site)
+                .selectinload(Site.company),
+            )
+            .all()
+        )
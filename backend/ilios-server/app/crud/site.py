@@ -8,6 +8,7 @@ from sqlalchemy import or_
 import app.static as static
 from app.crud.base_crud import BaseCRUD
 from app.db.base_class import Base
+from app.helpers.principal_cache import mark_principals_changed
 from app.models.company import Company
 from app.models.site import Site
 from app.schema.common import OrderDirectionEnum
@@ -20,6 +21,11 @@ class SiteCRUD(BaseCRUD):
     def __init__(self, db_session):
         super().__init__(model=Site, db_session=db_session)
 
+    def delete_by_id(self, target_id) -> int:
+        # user projects of the site are deleted by the DB cascade
+        mark_principals_changed(self.db_session)
+        return super().delete_by_id(target_id)
+
     def filter(
         self,
         sites_ids: set | None,
@@ -3,11 +3,14 @@
 from typing import List, Optional, Tuple
 
 from fastapi_filter.contrib.sqlalchemy import Filter
+from sqlalchemy.orm import joinedload
 
 import app.static as static
 from app.crud.base_crud import BaseCRUD
 from app.db.base_class import Base
+from app.helpers.principal_cache import mark_principals_changed
 from app.models.role import Role
+from app.models.session import Session
 from app.models.user import User
 from app.schema.user import UserOrderByFieldEnum
 
@@ -18,6 +21,19 @@ class UserCRUD(BaseCRUD):
     def __init__(self, db_session):
         super().__init__(model=User, db_session=db_session)
 
+    def update_by_id(self, target_id, item: dict) -> int:
+        mark_principals_changed(self.db_session)
+        return super().update_by_id(target_id, item)
+
+    def delete_by_id(self, target_id) -> int:
+        mark_principals_changed(self.db_session)
+        return super().delete_by_id(target_id)
+
+    def get_by_session_id(self, session_id):
+        """Get user of the auth session together with the role, in a single query."""
+        query = self.db_session.query(self.model).join(Session, Session.user_id == self.model.id)
+        return query.options(joinedload(self.model.role)).filter(Session.id == session_id).first()
+
     def get_by_email(self, email):
         """Get user by email."""
         return self.db_session.query(self.model).filter_by(email=email).first()
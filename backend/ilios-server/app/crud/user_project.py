@@ -6,6 +6,7 @@ from fastapi_filter.contrib.sqlalchemy import Filter
 from sqlalchemy import String, and_, cast, or_
 
 from app.crud.base_crud import BaseCRUD
+from app.helpers.principal_cache import AccessScope, mark_principals_changed
 from app.models.role import Role
 from app.models.user import User, UserProject
 
@@ -16,6 +17,22 @@ class UserProjectCRUD(BaseCRUD):
     def __init__(self, db_session):
         super().__init__(model=UserProject, db_session=db_session)
 
+    def update_by_id(self, target_id, item: dict) -> int:
+        mark_principals_changed(self.db_session)
+        return super().update_by_id(target_id, item)
+
+    def delete_by_id(self, target_id) -> int:
+        mark_principals_changed(self.db_session)
+        return super().delete_by_id(target_id)
+
+    def get_access_scope(self, user_id: int) -> AccessScope:
+        """Return IDs of sites and companies given to the user via projects"""
+        projects = self.db_session.query(self.model.site_id, self.model.company_id).filter_by(user_id=user_id).all()
+        return AccessScope(
+            sites_ids=frozenset(project.site_id for project in projects),
+            companies_ids=frozenset(project.company_id for project in projects),
+        )
+
     def create_items(self, items: Iterable, autocommit: bool = True):
         """Create multiple items
 
@@ -25,6 +42,7 @@ class UserProjectCRUD(BaseCRUD):
         """
         objects = [self.model(**item) for item in items]
         self.db_session.bulk_save_objects(objects)
+        mark_principals_changed(self.db_session)
 
         if autocommit:
             self.db_session.commit()
@@ -48,6 +66,7 @@ class UserProjectCRUD(BaseCRUD):
         )
 
         deleted_count = self.db_session.query(self.model).filter(where_condition).delete()
+        mark_principals_changed(self.db_session)
 
         if autocommit:
             self.db_session.commit()
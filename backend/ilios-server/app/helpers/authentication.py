@@ -11,8 +11,10 @@ from sqlalchemy.orm import Session
 
 from app.crud.session import SessionCRUD
 from app.crud.user import UserCRUD
+from app.crud.user_project import UserProjectCRUD
 from app.db.session import get_session
 from app.dependencies import validate_auth_header
+from app.helpers.principal_cache import principal_cache
 from app.schema import Token
 from app.schema.message import BadRequestError
 from app.settings import settings
@@ -92,9 +94,9 @@ def get_current_user(
         logger.error("JWT payload doesn't have the 'sub' key.")
         raise credentials_exception
 
-    auth_session = None
+    user = None
     try:
-        auth_session = SessionCRUD(db_session).get_by_id(session_id)
+        user = UserCRUD(db_session).get_by_session_id(session_id)
     except DataError:
         # handle the case of JWT transition, otherwise old tokens will raise 500, for example
         #   (psycopg2.errors.InvalidTextRepresentation) invalid input syntax for type integer: "admin@admin.com"
@@ -102,11 +104,18 @@ def get_current_user(
         # since before <sub> was email, and now it's ID
         # TODO can be removed in a couple of sprints
         logger.error(f"Data error occurred while getting session by session_id <{session_id}>")
-    if auth_session is None:
+    if user is None:
         logger.error(f"No auth session found by session_id <{session_id}>")
         raise credentials_exception
 
-    user = auth_session.user
+    if not user.is_system_user:
+        # take the version before reading projects, so the scope isn't cached if they are changed meanwhile
+        scope_version = principal_cache.get_version()
+        access_scope = principal_cache.get(user.id, scope_version)
+        if access_scope is None:
+            access_scope = UserProjectCRUD(db_session).get_access_scope(user.id)
+            principal_cache.set(user.id, access_scope, scope_version)
+        user.access_scope = access_scope
 
     user_id = user.id
     request.state.current_user_id = user_id
@@ -55,12 +55,12 @@ class GetAuthorizedEntity:
             return
 
         if self.permission_type == PermissionType.company:
-            user_data = [company.id for company in self.current_user.companies]
+            user_data = [*self.current_user.get_limited_companies_ids()]
             # TODO think about rewrite it with <additional_company_site_id_access> usage,
             #  rather than provide full access for the company management
             user_data.append(self.current_user.parent_company_id)
         else:
-            user_data = [site.id for site in self.current_user.sites]
+            user_data = [*self.current_user.get_limited_sites_ids()]
 
         if self.additional_company_site_id_access:
             user_data.append(self.additional_company_site_id_access)
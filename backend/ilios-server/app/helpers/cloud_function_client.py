@@ -1,8 +1,8 @@
 import logging
-import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import google.auth.transport.requests
-import google.oauth2.id_token
 import requests
 from google.auth.transport.requests import AuthorizedSession
 from google.oauth2 import service_account
@@ -14,33 +14,89 @@ from app.settings import settings
 logger = logging.getLogger(__name__)
 
 
+class CloudFuncSessionRegistry:
+    """Process-wide credentials, HTTP sessions and ID tokens for the Cloud Functions calls.
+
+    A session is kept per function URL, so the following calls to the same function reuse its pooled connections.
+    ID tokens are kept per function URL as well and are minted again only shortly before they expire.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._authorized_sessions = {}
+        self._sessions = {}
+        self._id_token_credentials = {}
+
+    def get_authorized_session(self, func_url) -> AuthorizedSession:
+        """Session authorized by the service account access token"""
+        with self._lock:
+            if func_url not in self._authorized_sessions:
+                if self._credentials is None:
+                    self._credentials = service_account.Credentials.from_service_account_file(
+                        settings.service_account_key_file_path,
+                        scopes=["https://www.googleapis.com/auth/cloud-platform"],
+                    )
+                self._authorized_sessions[func_url] = AuthorizedSession(self._credentials)
+            return self._authorized_sessions[func_url]
+
+    def get_session(self, func_url) -> requests.Session:
+        """Session without authorization, credentials are passed with the request"""
+        with self._lock:
+            if func_url not in self._sessions:
+                self._sessions[func_url] = requests.Session()
+            return self._sessions[func_url]
+
+    def get_id_token(self, func_url) -> str:
+        """Service account ID token with the function URL as audience"""
+        with self._lock:
+            credentials = self._id_token_credentials.get(func_url)
+            if credentials is None:
+                credentials = service_account.IDTokenCredentials.from_service_account_file(
+                    settings.service_account_key_file_path, target_audience=func_url
+                )
+                self._id_token_credentials[func_url] = credentials
+            # credentials become invalid a few minutes before the token expiry
+            if not credentials.valid:
+                credentials.refresh(google.auth.transport.requests.Request())
+            return credentials.token
+
+    def clear(self):
+        with self._lock:
+            for session in [*self._authorized_sessions.values(), *self._sessions.values()]:
+                session.close()
+            self._credentials = None
+            self._authorized_sessions.clear()
+            self._sessions.clear()
+            self._id_token_credentials.clear()
+
+
+cloud_func_sessions = CloudFuncSessionRegistry()
+# bounds the number of Cloud Functions calls dispatched in the background at the same time
+cloud_func_dispatcher = ThreadPoolExecutor(
+    max_workers=settings.cloud_function_dispatch_max_workers, thread_name_prefix="cloud-func-dispatch"
+)
+
+
 class BaseCloudFuncHTTPClient:
     def __init__(self, func_url):
         self.func_url = func_url
-        credentials = service_account.Credentials.from_service_account_file(
-            settings.service_account_key_file_path, scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        self.authorized_session = AuthorizedSession(credentials)
-        # Setup env variable for token authentication
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = settings.service_account_key_file_path
 
     def post(self, payload=None, params=None, headers=None, use_token=False, use_api_key=False):
         headers = {"Content-Type": "application/json", **(headers if headers else {})}
         if use_token:
             # Some cloud functions require token authorization
-            auth_req = google.auth.transport.requests.Request()
-            id_token = google.oauth2.id_token.fetch_id_token(auth_req, self.func_url)
-            headers["Authorization"] = f"Bearer {id_token}"
-            session = requests
+            headers["Authorization"] = f"Bearer {cloud_func_sessions.get_id_token(self.func_url)}"
+            session = cloud_func_sessions.get_session(self.func_url)
         elif use_api_key:
             # ML-services are publicly accessible, and they required api_key as param
-            session = requests
+            session = cloud_func_sessions.get_session(self.func_url)
             # ensure param is a valid dict
             if not params:
                 params = {}
             params.update({"api_key": settings.ml_api_key})
         else:
-            session = self.authorized_session
+            session = cloud_func_sessions.get_authorized_session(self.func_url)
 
         response = session.post(
             self.func_url,
@@ -55,6 +111,29 @@ class BaseCloudFuncHTTPClient:
             logger.exception("Got an error while trying to call Cloud Function")
         return response
 
+    def dispatch(self, payload=None, params=None, headers=None, use_token=False, use_api_key=False) -> Future:
+        """Fire-and-forget call: the request is sent in the background and the caller does not wait for the response.
+
+        Error responses are logged by 'post', exceptions are logged on completion.
+        """
+        func_url = self.func_url
+        # bind the call to the current URL, as some clients switch 'func_url' between the calls
+        future = cloud_func_dispatcher.submit(
+            BaseCloudFuncHTTPClient(func_url).post,
+            payload=payload,
+            params=params,
+            headers=headers,
+            use_token=use_token,
+            use_api_key=use_api_key,
+        )
+
+        def log_exception(done_future: Future):
+            if done_future.exception() is not None:
+                logger.error(f"Cloud Function {func_url} call failed: {str(done_future.exception())}")
+
+        future.add_done_callback(log_exception)
+        return future
+
 
 class FileParseFuncHTTPClient(BaseCloudFuncHTTPClient):
     def __init__(self, func_url=None):
@@ -1,5 +1,3 @@
-from concurrent.futures import ThreadPoolExecutor
-
 from app.crud.company import CompanyCRUD
 from app.helpers.telemetry.bigquery import TelemetryCompanyBigQuery, TelemetrySiteBigQuery
 from app.helpers.telemetry.sites_helper import get_production_chart_data_per_company_sites
@@ -67,18 +65,12 @@ def get_company_actual_vs_expected_production_section_with_telemetry(company, si
 def extend_company_sites_with_energy_attributes(sites: list[Site]):
     """Extend site object with energy data fetched from telemetry"""
     if sites:
-        user_site_ids = {site.id for site in sites}
         telemetry_bq = TelemetrySiteBigQuery()
-        # execute BigQuery calls in threads to speedup almost x2
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            actual_expected_performance_task = executor.submit(
-                telemetry_bq.get_site_actual_expected_performance, user_site_ids
-            )
-            cumulative_energy_task = executor.submit(telemetry_bq.get_site_cumulative_energy, user_site_ids)
-        telemetry_sites_actual_expected = actual_expected_performance_task.result()
-        telemetry_sites_cumulative = cumulative_energy_task.result()
+        # power and energy metrics are served by the single sites snapshot (one BigQuery job on cold cache)
+        sites_snapshot = telemetry_bq.get_sites_dashboard_snapshot({site.id for site in sites})
         for site in sites:
-            site.actual_kw, site.expected_kw = telemetry_sites_actual_expected.get(site.id)
+            site_snapshot = sites_snapshot.get(site.id)
+            site.actual_kw, site.expected_kw = telemetry_bq.get_snapshot_power(site_snapshot)
             site.cumulative_vs_expected, site.cumulative_7_days_vs_expected, site.cumulative_30_days_vs_expected = (
-                telemetry_sites_cumulative.get(site.id)
+                telemetry_bq.get_snapshot_cumulative_energy(site_snapshot)
             )
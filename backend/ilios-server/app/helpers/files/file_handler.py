@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException, status
@@ -13,6 +15,57 @@ from app.static.files import FILE_PREVIEW_CONTENT_TYPE_MAPPING, FILE_UPLOAD_CONT
 logger = logging.getLogger(__name__)
 
 
+class StorageRegistry:
+    """Process-wide Google Cloud Storage client, buckets and recently signed URLs.
+
+    The service account key file is read and the client is built once per process, handlers only look up
+    the bucket. Signed download and preview URLs are reused for 'file_signed_url_cache_seconds', so they
+    are always valid for most of 'file_download_link_expiration_minutes'.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._buckets = {}
+        self._signed_urls = {}
+
+    def get_bucket(self, bucket_name: str):
+        with self._lock:
+            if self._client is None:
+                credentials = service_account.Credentials.from_service_account_file(
+                    settings.service_account_key_file_path
+                )
+                self._client = storage.Client(credentials=credentials)
+            if bucket_name not in self._buckets:
+                self._buckets[bucket_name] = self._client.bucket(bucket_name)
+            return self._buckets[bucket_name]
+
+    def get_signed_url(self, key: tuple):
+        with self._lock:
+            signed_url, expires_at = self._signed_urls.get(key, (None, 0))
+            if expires_at > time.monotonic():
+                return signed_url
+            self._signed_urls.pop(key, None)
+            return None
+
+    def set_signed_url(self, key: tuple, signed_url: str):
+        now = time.monotonic()
+        with self._lock:
+            # drop expired URLs to keep the cache bounded by the links signed within the cache period
+            for expired_key in [k for k, (_, expires_at) in self._signed_urls.items() if expires_at <= now]:
+                del self._signed_urls[expired_key]
+            self._signed_urls[key] = (signed_url, now + settings.file_signed_url_cache_seconds)
+
+    def clear(self):
+        with self._lock:
+            self._client = None
+            self._buckets.clear()
+            self._signed_urls.clear()
+
+
+storage_registry = StorageRegistry()
+
+
 class FileHandler:
     """Class to handle actions related to Google Cloud Storage.
 
@@ -23,9 +76,7 @@ class FileHandler:
     """
 
     def __init__(self, bucket_name: str):
-        credentials = service_account.Credentials.from_service_account_file(settings.service_account_key_file_path)
-        storage_client = storage.Client(credentials=credentials)
-        self.bucket = storage_client.bucket(bucket_name)
+        self.bucket = storage_registry.get_bucket(bucket_name)
 
     @staticmethod
     def _generate_name(filename):
@@ -53,18 +104,27 @@ class FileHandler:
             logger.error(f"Cannot remove file {filepath}, an error {str(exc)}")
             return json.loads(exc.response.content)["error"]
 
+    def _generate_cached_signed_url(self, filepath, disposition, **kwargs):
+        """Generates a v4 signed Google Storage URL for reading a file, reusing the recently signed one."""
+
+        key = (self.bucket.name, filepath, disposition)
+        signed_url = storage_registry.get_signed_url(key)
+        if signed_url is None:
+            signed_url = self.bucket.blob(filepath).generate_signed_url(
+                version="v4",
+                expiration=timedelta(minutes=settings.file_download_link_expiration_minutes),
+                method="GET",
+                response_disposition=disposition,
+                **kwargs,
+            )
+            storage_registry.set_signed_url(key, signed_url)
+        return signed_url
+
     def generate_download_signed_url(self, filepath, filename):
         """Generates a v4 signed Google Storage URL for downloading a file."""
 
-        blob = self.bucket.blob(filepath)
-        signed_download_url = blob.generate_signed_url(
-            version="v4",
-            expiration=timedelta(minutes=settings.file_download_link_expiration_minutes),
-            method="GET",
-            # Save file with initial file name from upload
-            response_disposition=f"attachment;filename={filename}",
-        )
-        return signed_download_url
+        # Save file with initial file name from upload
+        return self._generate_cached_signed_url(filepath, f"attachment;filename={filename}")
 
     def generate_signed_url_for_upload(self, filepath, file_extension):
         content_type = FILE_UPLOAD_CONTENT_TYPE_MAPPING.get(file_extension)
@@ -86,17 +146,13 @@ class FileHandler:
                 status.HTTP_400_BAD_REQUEST, detail=f"Only {available_extensions} files are available to preview."
             )
 
-        blob = self.bucket.blob(filepath)
-        signed_preview_url = blob.generate_signed_url(
-            version="v4",
-            expiration=timedelta(minutes=settings.file_download_link_expiration_minutes),
-            method="GET",
+        return self._generate_cached_signed_url(
+            filepath,
             # Save file with initial file name from upload
-            response_disposition=f"filename={filename}",
+            f"filename={filename}",
             # use pdf response type for preview
             response_type=FILE_PREVIEW_CONTENT_TYPE_MAPPING.get(file_extension),
         )
-        return signed_preview_url
 
 
 class TaskAttachmentHandler(FileHandler):
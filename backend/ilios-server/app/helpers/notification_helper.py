@@ -1,4 +1,5 @@
 import logging
+from typing import Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -6,8 +7,10 @@ from app.crud.notification import NotificationCRUD
 from app.crud.notification_subject import NotificationSubjectCRUD
 from app.crud.user import UserCRUD
 from app.models.board import BoardRelatedEntityTypeEnum
-from app.models.comment import CommentedEntityTypeEnum
+from app.models.comment import Comment, CommentedEntityTypeEnum
 from app.models.notification import Notification, NotificationKindsEnum, NotificationSubjectsEnum
+from app.models.task import Task
+from app.models.user import User
 from app.schema.user import CurrentUserSchema
 from app.static import TASK_DELETED_USER, TASK_UNDEFINED_STATUS
 
@@ -55,20 +58,28 @@ class NotificationHandler:
 class NotificationReadHandler:
     """Process notification to populate additional fields before the Pydantic serialization"""
 
-    def __init__(self, notification: Notification, db_session: Session):
+    def __init__(
+        self,
+        notification: Notification,
+        db_session: Session,
+        subject_object: Optional[Union[Task, Comment]] = None,
+        users: Optional[dict[int, User]] = None,
+    ):
+        """Subject object and users can be preloaded for a page of notifications by the
+        NotificationsBulkReadHandler, otherwise they are retrieved from the DB per notification"""
         self.notification = notification
         self.db_session = db_session
-        self.notification_subject = self._retrieve_notification_subject()
+        self.users = users
+        self.notification_subject = self._retrieve_notification_subject(subject_object)
 
-    def _retrieve_notification_subject(self):
+    def _retrieve_notification_subject(self, subject_object: Optional[Union[Task, Comment]] = None):
         """As part of notification init, retrieve related object"""
-        subject_object = None
         if self.notification.subject.entity_type == NotificationSubjectsEnum.task:
-            subject_object = self.notification.subject.parent_entity_task
+            subject_object = subject_object or self.notification.subject.parent_entity_task
             subject_object.module = subject_object.board.module
             self.notification.task = subject_object
         elif self.notification.subject.entity_type == NotificationSubjectsEnum.comment:
-            subject_object = self.notification.subject.parent_entity_comment
+            subject_object = subject_object or self.notification.subject.parent_entity_comment
             # for comment, explicitly set commented entity attributes
             subject_object.entity_id = subject_object.commented_entity.entity_id
             subject_object.entity_type = subject_object.commented_entity.entity_type
@@ -136,7 +147,11 @@ class NotificationReadHandler:
 
     def _get_user_details(self, extra_key_name):
         """Get DB user first/last name or return Deleted User if cannot lookup user"""
-        user_obj = UserCRUD(self.db_session).get_by_id(self.notification.extra[extra_key_name])
+        user_id = self.notification.extra[extra_key_name]
+        if self.users is not None:
+            user_obj = self.users.get(user_id)
+        else:
+            user_obj = UserCRUD(self.db_session).get_by_id(user_id)
         return f"{user_obj.first_name} {user_obj.last_name}" if user_obj else TASK_DELETED_USER
 
     def set_extras(self):
@@ -158,3 +173,64 @@ class NotificationReadHandler:
         """To support templates, set additional fields for the notification"""
         self.set_related_entity()
         self.set_extras()
+
+
+class NotificationsBulkReadHandler:
+    """Process a page of notifications with a fixed number of DB queries: subjects are grouped by type and loaded
+    with their boards, statuses, documents and related entities, users mentioned in the extras are loaded at once"""
+
+    USER_EXTRA_KEYS = ("previous_assignee_id", "new_assignee_id")
+
+    def __init__(self, notifications: list[Notification], db_session: Session):
+        self.notifications = notifications
+        self.db_session = db_session
+
+    def _get_subjects_ids(self, entity_type: NotificationSubjectsEnum):
+        return {
+            notification.subject.entity_id
+            for notification in self.notifications
+            if notification.subject.entity_type == entity_type
+        }
+
+    def _load_subjects(self):
+        """Retrieve all notification subjects, grouped by the subject type"""
+        notification_crud = NotificationCRUD(self.db_session)
+        comments = notification_crud.get_comment_subjects(self._get_subjects_ids(NotificationSubjectsEnum.comment))
+        # commented tasks are loaded together with the task subjects and then resolved from the session
+        commented_tasks_ids = {
+            comment.commented_entity.entity_id
+            for comment in comments
+            if comment.commented_entity.entity_type == CommentedEntityTypeEnum.task
+        }
+        tasks = notification_crud.get_task_subjects(
+            self._get_subjects_ids(NotificationSubjectsEnum.task) | commented_tasks_ids
+        )
+        return {
+            NotificationSubjectsEnum.task: {task.id: task for task in tasks},
+            NotificationSubjectsEnum.comment: {comment.id: comment for comment in comments},
+        }
+
+    def _load_users(self):
+        """Retrieve all users mentioned in the notifications extras"""
+        users_ids = {
+            notification.extra[key]
+            for notification in self.notifications
+            if notification.extra
+            for key in self.USER_EXTRA_KEYS
+            if notification.extra.get(key) is not None
+        }
+        if not users_ids:
+            return {}
+        return {user.id: user for user in UserCRUD(self.db_session).bulk_get_by_id(users_ids)}
+
+    def extend_with_additional_fields(self):
+        """To support templates, set additional fields for all the notifications"""
+        subjects = self._load_subjects()
+        users = self._load_users()
+        for notification in self.notifications:
+            NotificationReadHandler(
+                notification,
+                self.db_session,
+                subject_object=subjects[notification.subject.entity_type].get(notification.subject.entity_id),
+                users=users,
+            ).extend_with_additional_fields()
@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import pickle
+from collections.abc import AsyncIterator
 
-import requests
+import httpx
 from fastapi import HTTPException, status
 
 from app.redis_cache.cache import get_cache
@@ -12,6 +14,26 @@ logger = logging.getLogger(__name__)
 
 
 class PowerBIHandler:
+    # process-wide client with its keep-alive connections pool, created on first use within the app event loop
+    _http_client: httpx.AsyncClient | None = None
+    # only one request at a time refreshes the access token, the others wait and take it from the cache
+    _token_lock = asyncio.Lock()
+
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None:
+            cls._http_client = httpx.AsyncClient(
+                timeout=settings.pbi_request_timeout_seconds,
+                limits=httpx.Limits(max_keepalive_connections=settings.pbi_http_max_keepalive_connections),
+            )
+        return cls._http_client
+
+    @classmethod
+    async def close_http_client(cls):
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
     def __init__(self):
         self.cache = get_cache()
         self.access_token_expiration = settings.pbi_access_token_expiration_seconds
@@ -32,18 +54,22 @@ class PowerBIHandler:
     def set_cache(self, key_name, value, expiration_seconds):
         self.cache.set(key_name, pickle.dumps(value), ex=expiration_seconds)
 
-    @staticmethod
-    def _make_api_call(url, method, data=None, params=None, headers=None, json=None):
-        """Wrapper around requests lib to log request details and handle errors"""
+    async def _make_api_call(self, url, method, data=None, params=None, headers=None, json=None, stream=False):
+        """Wrapper around httpx client to log request details and handle errors.
+
+        Content of the streamed response is not loaded, the caller has to read and close the response."""
         logger.debug(f"Making a PowerBI request: {method=}, {url=}, {data=}, {params=}, {headers=}")
-        response = requests.request(url=url, method=method, params=params, data=data, headers=headers, json=json)
+        http_client = self.get_http_client()
+        request = http_client.build_request(method, url, params=params, data=data, headers=headers, json=json)
+        response = await http_client.send(request, stream=stream)
         logger.debug(f"Got PowerBI response for {method=} {url=}: {response.status_code=}")
-        if not response.ok:
+        if not response.is_success:
+            await response.aclose()
             logger.error(f"An error occured while making PowerBI request: {url=}, {response.status_code=}")
             raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=PowerBIMessages.service_unavailable)
         return response
 
-    def _generate_access_token(self):
+    async def _generate_access_token(self):
         """Get access token for the application.
 
         docs: https://learn.microsoft.com/en-us/entra/identity-platform/v2-oauth2-client-creds-grant-flow#get-a-token"""
@@ -52,30 +78,35 @@ class PowerBIHandler:
         cached_token = self.get_from_cache(token_cache_key)
         if cached_token:
             return cached_token
-        # make an API call if no cached token found
-        token_payload = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": self.scope,
-        }
-        response = self._make_api_call(url=self.token_url, method="POST", data=token_payload)
-        access_token = response.json().get("access_token")
-        self.set_cache(token_cache_key, access_token, self.access_token_expiration)
-        return access_token
-
-    def list_reports(self):
+        async with self._token_lock:
+            # other request might refresh the token while we were waiting for the lock
+            cached_token = self.get_from_cache(token_cache_key)
+            if cached_token:
+                return cached_token
+            # make an API call if no cached token found
+            token_payload = {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": self.scope,
+            }
+            response = await self._make_api_call(url=self.token_url, method="POST", data=token_payload)
+            access_token = response.json().get("access_token")
+            self.set_cache(token_cache_key, access_token, self.access_token_expiration)
+            return access_token
+
+    async def list_reports(self):
         """Returns a list of reports for specific group (aka workspace):
 
         docs: https://learn.microsoft.com/en-us/rest/api/power-bi/reports/get-reports-in-group"""
-        access_token = self._generate_access_token()
+        access_token = await self._generate_access_token()
         url = f"{self.power_bi_api_url}/groups/{self.power_bi_workspace_id}/reports"
 
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = self._make_api_call(url=url, method="GET", headers=headers)
+        response = await self._make_api_call(url=url, method="GET", headers=headers)
         return response.json()["value"]
 
-    def generate_embed_token(self, report_id: str):
+    async def generate_embed_token(self, report_id: str):
         """Generate embedding token for the specified report id,
         cache value to limit PBI calls
 
@@ -85,56 +116,64 @@ class PowerBIHandler:
         cached_token = self.get_from_cache(embed_token_cache_key)
         if cached_token:
             return cached_token
-        access_token = self._generate_access_token()
+        access_token = await self._generate_access_token()
         url = f"{self.power_bi_api_url}/groups/{self.power_bi_workspace_id}/reports/{report_id}/GenerateToken"
         headers = {"Authorization": f"Bearer {access_token}"}
         payload = {"accessLevel": "View"}
-        response = self._make_api_call(url=url, method="POST", headers=headers, data=payload)
+        response = await self._make_api_call(url=url, method="POST", headers=headers, data=payload)
         embed_token = response.json()["token"]
         self.set_cache(embed_token_cache_key, embed_token, self.embed_token_expiration)
         return embed_token
 
-    def get_report_pages(self, report_id: str):
+    async def get_report_pages(self, report_id: str):
         """Returns specific report pages
 
         docs: https://learn.microsoft.com/en-us/rest/api/power-bi/reports/get-pages-in-group"""
-        access_token = self._generate_access_token()
+        access_token = await self._generate_access_token()
         url = f"{self.power_bi_api_url}/groups/{self.power_bi_workspace_id}/reports/{report_id}/pages"
 
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = self._make_api_call(url=url, method="GET", headers=headers)
+        response = await self._make_api_call(url=url, method="GET", headers=headers)
         return response.json()
 
-    def export_report_to_file(self, report_id: str, payload: dict):
+    async def export_report_to_file(self, report_id: str, payload: dict):
         """Export specified report to the file with various input settings.
 
         docs: https://learn.microsoft.com/en-us/rest/api/power-bi/reports/export-to-file-in-group
         """
-        access_token = self._generate_access_token()
+        access_token = await self._generate_access_token()
         url = f"{self.power_bi_api_url}/groups/{self.power_bi_workspace_id}/reports/{report_id}/ExportTo"
         headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json; odata.metadata=minimal"}
-        response = self._make_api_call(url=url, method="POST", headers=headers, json=payload)
+        response = await self._make_api_call(url=url, method="POST", headers=headers, json=payload)
         return response.json()
 
-    def get_export_status(self, report_id: str, export_id: str):
+    async def get_export_status(self, report_id: str, export_id: str):
         """Retrieve specified export status.
 
         docs: https://learn.microsoft.com/en-us/rest/api/power-bi/reports/get-export-to-file-status-in-group
         """
-        access_token = self._generate_access_token()
+        access_token = await self._generate_access_token()
         url = f"{self.power_bi_api_url}/groups/{self.power_bi_workspace_id}/reports/{report_id}/exports/{export_id}"
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = self._make_api_call(url=url, method="GET", headers=headers)
+        response = await self._make_api_call(url=url, method="GET", headers=headers)
         return response.json()
 
-    def get_export_file(self, report_id: str, export_id: str):
-        """Retrieve content of exported file.
+    async def get_export_file(self, report_id: str, export_id: str) -> tuple[AsyncIterator[bytes], str]:
+        """Retrieve content of exported file, the content is streamed by chunks without loading the whole file.
 
         docs: https://learn.microsoft.com/en-us/rest/api/power-bi/reports/get-file-of-export-to-file-in-group
         """
-        access_token = self._generate_access_token()
+        access_token = await self._generate_access_token()
         url = f"{self.power_bi_api_url}/groups/{self.power_bi_workspace_id}/reports/{report_id}/exports/{export_id}/file"
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = self._make_api_call(url=url, method="GET", headers=headers)
+        response = await self._make_api_call(url=url, method="GET", headers=headers, stream=True)
         content_type = response.headers.get(PBI_CONTENT_TYPE_HEADER, "application/octet-stream")
-        return response.content, content_type
+        return self._iter_content(response), content_type
+
+    @staticmethod
+    async def _iter_content(response: httpx.Response) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes(settings.pbi_export_chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
@@ -0,0 +1,133 @@
+"""Cache of the users access scope: IDs of sites and companies given to the user via projects.
+
+Each authenticated request needs the scope to limit the data, so it is resolved once per user and reused until the
+TTL is over or until users or projects are changed. Changes are tracked with the version counter kept in Redis, so it
+is shared by all the processes: it is incremented when the DB transaction which changed them is committed, and each
+request reads it to drop the scopes cached under the previous version. The scopes themselves are kept per process.
+When Redis is unavailable, the scopes are resolved from the DB on every request and not cached.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.company import Company
+from app.models.site import Site
+from app.models.user import User, UserProject
+from app.redis_cache.cache import get_cache
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PRINCIPALS_CHANGED_KEY = "principals_changed"
+PRINCIPALS_VERSION_CACHE_KEY = "principals-version"
+
+
+@dataclass(frozen=True)
+class AccessScope:
+    sites_ids: frozenset[int]
+    companies_ids: frozenset[int]
+
+
+class PrincipalCache:
+    """Process-wide, thread-safe LRU cache of the users access scope with TTL"""
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # version of users and projects the cached scopes were resolved at
+        self.version = None
+        self._lock = threading.Lock()
+        self._scopes: OrderedDict[int, tuple[float, AccessScope]] = OrderedDict()
+
+    @staticmethod
+    def get_version() -> int | None:
+        """Current version of users and projects, shared by all the processes, None if it can't be read"""
+        try:
+            version = get_cache().get(PRINCIPALS_VERSION_CACHE_KEY)
+        except redis.RedisError:
+            logger.warning("Failed to read the principals version, the access scope is not cached", exc_info=True)
+            return None
+        return int(version) if version else 0
+
+    def get(self, user_id: int, version: int | None) -> AccessScope | None:
+        """Return the scope cached at the given version, the scopes cached at another one are dropped"""
+        if version is None:
+            return None
+        with self._lock:
+            if version != self.version:
+                self.version = version
+                self._scopes.clear()
+                return None
+            cached_scope = self._scopes.get(user_id)
+            if cached_scope is None:
+                return None
+            expires_at, access_scope = cached_scope
+            if expires_at <= time.monotonic():
+                del self._scopes[user_id]
+                return None
+            self._scopes.move_to_end(user_id)
+            return access_scope
+
+    def set(self, user_id: int, access_scope: AccessScope, version: int | None):
+        """Store the scope resolved at the given version, unless users or projects were changed since then"""
+        with self._lock:
+            if version is None or version != self.version:
+                return
+            self._scopes[user_id] = (time.monotonic() + self.ttl_seconds, access_scope)
+            self._scopes.move_to_end(user_id)
+            while len(self._scopes) > self.max_entries:
+                self._scopes.popitem(last=False)
+
+    def invalidate(self):
+        """Drop the scopes cached by all the processes"""
+        try:
+            get_cache().incr(PRINCIPALS_VERSION_CACHE_KEY)
+        except redis.RedisError:
+            # the DB transaction is already committed, the other processes drop their scopes once the TTL is over
+            logger.exception("Failed to increment the principals version")
+            self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.version = None
+            self._scopes.clear()
+
+
+principal_cache = PrincipalCache(settings.principal_cache_ttl_seconds, settings.principal_cache_max_entries)
+
+
+def mark_principals_changed(db_session: Session):
+    """Invalidate the cache once the current transaction of the DB session is committed"""
+    db_session.info[PRINCIPALS_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _track_principals_changes(db_session, flush_context, instances):  # noqa: U100
+    # changes made through ORM objects, for example, update of the user sites collection
+    for instance in (*db_session.new, *db_session.dirty, *db_session.deleted):
+        if isinstance(instance, (User, UserProject)):
+            mark_principals_changed(db_session)
+            return
+    # user projects of the deleted sites and companies are deleted by the DB cascade
+    for instance in db_session.deleted:
+        if isinstance(instance, (Site, Company)):
+            mark_principals_changed(db_session)
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(db_session):
+    if db_session.info.pop(PRINCIPALS_CHANGED_KEY, False):
+        principal_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(db_session):
+    db_session.info.pop(PRINCIPALS_CHANGED_KEY, None)
@@ -1,10 +1,14 @@
 import pickle
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
+from datetime import timezone as datetime_timezone
+from functools import partial
 
 import pytz
 
 from app.bigquery.bigquery import BigQueryReadEngine
 from app.redis_cache.cache import get_cache
+from app.settings import settings
 
 
 class BaseTelemetryBigQuery:
@@ -43,6 +47,60 @@ class BaseTelemetryBigQuery:
     def set_cache(self, key_name, value, expires_seconds):
         self.cache.set(key_name, pickle.dumps(value), ex=expires_seconds)
 
+    def get_many_from_cache(self, keys_names: dict) -> dict:
+        """Fetch several cached values with the single MGET call.
+        Receives mapping {object_id: key_name}, returns {object_id: value} only for the found keys."""
+        objects_ids = list(keys_names.keys())
+        cached_values = self.cache.mget([keys_names[object_id] for object_id in objects_ids])
+        return {
+            object_id: pickle.loads(cached_value)
+            for object_id, cached_value in zip(objects_ids, cached_values)
+            if cached_value is not None
+        }
+
+    def set_many_cache(self, values: dict, expires_seconds):
+        """Set several cached values within one pipeline round trip. Receives mapping {key_name: value}"""
+        if not values:
+            return
+        pipeline = self.cache.pipeline()
+        for key_name, value in values.items():
+            pipeline.set(key_name, pickle.dumps(value), ex=expires_seconds)
+        pipeline.execute()
+
+    def get_per_object_data(
+        self,
+        cache_prefix: str,
+        objects_ids: Iterable,
+        interval_start: str,
+        interval_end: str,
+        fetch_missing: Callable[[list], dict],
+        expires_seconds: int,
+    ) -> dict:
+        """
+        Per-object cache layer for the telemetry data.
+        Each object (site/device) is cached under its own key for the specific interval, so requests for the
+        different but overlapping sets of objects share the same cached entries.
+        Only objects missing in cache are passed to the <fetch_missing> callable (single BigQuery call),
+        which should return {object_id: value} for every requested ID, including the ones without telemetry data,
+        so that empty results are cached as well.
+
+        Returns: dict -> {object_id: value}
+        """
+        objects_ids = sorted(set(objects_ids))
+        keys_names = {
+            object_id: f"{cache_prefix}-{object_id}-{interval_start}-{interval_end}" for object_id in objects_ids
+        }
+        objects_data = self.get_many_from_cache(keys_names)
+        missing_objects_ids = [object_id for object_id in objects_ids if object_id not in objects_data]
+        if missing_objects_ids:
+            fetched_data = fetch_missing(missing_objects_ids)
+            missing_objects_data = {object_id: fetched_data.get(object_id) for object_id in missing_objects_ids}
+            self.set_many_cache(
+                {keys_names[object_id]: value for object_id, value in missing_objects_data.items()}, expires_seconds
+            )
+            objects_data.update(missing_objects_data)
+        return objects_data
+
     def execute_bq_function(
         self,
         function_name: str,
@@ -62,3 +120,101 @@ class BaseTelemetryBigQuery:
         )
         bq_site_data = list(self.bq_engine.execute_query(query))
         return bq_site_data
+
+    def _fetch_sites_dashboard_snapshot(
+        self,
+        power_interval: tuple[str, str],
+        energy_interval: tuple[str, str],
+        energy_timezone: str,
+        last_report_interval: tuple[str, str],
+        site_ids: list,
+    ) -> dict:
+        """
+        Retrieve sites dashboard snapshot with the single multi-statement BigQuery job: the latest 15 minutes power,
+        today/7 days/30 days energy and last reported timestamp are read by its statements and joined per site.
+        Sites without telemetry data are returned with None value.
+        """
+        object_ids = ", ".join(map(str, site_ids))
+        dataset_name = self.bq_engine.bq_dataset_name
+        query = f"""
+            DECLARE snapshot_site_ids ARRAY<INT64> DEFAULT [{object_ids}];
+
+            CREATE TEMP TABLE site_power AS
+            SELECT
+                site_id,
+                TRUE AS power_reported,
+                site_power_actual[SAFE_OFFSET(0)].value AS actual_kw,
+                site_power_expected[SAFE_OFFSET(0)].value AS expected_kw
+            FROM {dataset_name}.site_power_actual_vs_expected('{power_interval[0]}', '{power_interval[1]}', 'UTC')
+            WHERE site_id IN UNNEST(snapshot_site_ids);
+
+            CREATE TEMP TABLE site_energy AS
+            SELECT
+                site_id,
+                (SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_actual, 30, 30)) AS point_data)
+                AS site_energy_actual_today,
+                (SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_expected, 30, 30)) AS point_data)
+                AS site_energy_expected_today,
+                (SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_actual, 23, 29)) AS point_data)
+                AS site_energy_actual_last_7_days,
+                (SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_expected, 23, 29)) AS point_data)
+                AS site_energy_expected_last_7_days,
+                (SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_actual, 0, 29)) AS point_data)
+                AS site_energy_actual_last_30_days,
+                (SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_expected, 0, 29)) AS point_data)
+                AS site_energy_expected_last_30_days
+            FROM {dataset_name}.site_energy_actual_vs_expected_daily(
+                '{energy_interval[0]}', '{energy_interval[1]}', '{energy_timezone}'
+            )
+            WHERE site_id IN UNNEST(snapshot_site_ids);
+
+            CREATE TEMP TABLE site_last_report AS
+            SELECT
+                site_id,
+                site_last_report_ts
+            FROM {dataset_name}.site_last_report_ts('{last_report_interval[0]}', '{last_report_interval[1]}', 'UTC')
+            WHERE site_id IN UNNEST(snapshot_site_ids);
+
+            SELECT *
+            FROM site_power
+            FULL OUTER JOIN site_energy USING (site_id)
+            FULL OUTER JOIN site_last_report USING (site_id);
+        """
+        sites_snapshot = dict.fromkeys(site_ids)
+        for site in self.bq_engine.execute_query(query):
+            sites_snapshot[int(site["site_id"])] = {key: value for key, value in site.items() if key != "site_id"}
+        return sites_snapshot
+
+    def get_sites_dashboard_snapshot(self, site_ids: Iterable) -> dict:
+        """
+        Fetch sites telemetry snapshot shared by the O&M and investor dashboards using the per-site cache,
+        so any dashboard requested within the same 15 minutes period reuses it without BigQuery calls.
+        Power and last reported timestamp are calculated in UTC, energy - in UTC-6 timezone.
+
+        Returns: dict -> {site_id1: {"power_reported": True, "actual_kw": 1.2, "expected_kw": 1.5,
+                                     "site_energy_actual_today": 10, ..., "site_last_report_ts": datetime(...)},
+                          site_id2: None if no telemetry data, ...}
+        """
+        power_interval = self._get_current_time_period("UTC")
+        last_report_start = datetime.strptime(power_interval[1], self.time_format) - timedelta(days=7)
+        last_report_interval = (last_report_start.strftime(self.time_format), power_interval[1])
+
+        energy_timezone = "-6"
+        datetime_now = datetime.now(datetime_timezone(timedelta(hours=int(energy_timezone))))
+        datetime_now = datetime_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        # daterange should be 1 day ahead to pick up cumulative data for today properly
+        energy_interval = (str(datetime_now - timedelta(days=30)), str(datetime_now + timedelta(days=1)))
+
+        return self.get_per_object_data(
+            "site-dashboard-snapshot",
+            site_ids,
+            *power_interval,
+            partial(
+                self._fetch_sites_dashboard_snapshot,
+                power_interval,
+                energy_interval,
+                energy_timezone,
+                last_report_interval,
+            ),
+            settings.site_dashboard_expiration_seconds,
+        )
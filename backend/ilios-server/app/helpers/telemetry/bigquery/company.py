@@ -53,38 +53,20 @@ class TelemetryCompanyBigQuery(BaseTelemetryBigQuery):
         )
         return total_actual_kw, total_expected_kw
 
-    def get_companies_list_actual_production(self, site_ids: list, timezone: str = "UTC") -> list:
-        """Fetch sites actual_kw for the companies list table population.
-        Put data for past 15 minutes period in cache to save time for query execution."""
-
-        interval_start_time, interval_end_time = self._get_current_time_period(timezone)
-        # add unique cache name part for group of sites,
-        # sort sites_ids to be sure cache is unique per same set of sites
-        site_ids = sorted(site_ids)
-        sites_str = "-".join(map(str, site_ids))
-        cache_name = f"actual-production-companies-sites-{sites_str}-interval-{interval_start_time}-{interval_end_time}"
-        cached_data = self.get_from_cache(cache_name)
-        if cached_data is not None:
-            return cached_data
-
-        bq_sites_data = self.execute_bq_function(
-            "site_power_actual_vs_expected", "site_id", site_ids, interval_start_time, interval_end_time, timezone
-        )
-
-        sites_actual_production_response = []
-        if bq_sites_data:
-            for site in bq_sites_data:
-                sites_actual_production_response.append(
-                    {
-                        "site_id": site["site_id"],
-                        "actual_kw": site["site_power_actual"][0]["value"] or 0,
-                        "expected_kw": site["site_power_expected"][0]["value"] or 0,
-                    }
-                )
-
-        # update cache with new interval BigQuery data and expiration time 15 minutes
-        self.set_cache(cache_name, sites_actual_production_response, settings.site_dashboard_expiration_seconds)
-        return sites_actual_production_response
+    def get_companies_list_actual_production(self, site_ids: list) -> list:
+        """Fetch sites actual_kw for the companies list table population from the sites dashboard snapshot."""
+        sites_snapshot = self.get_sites_dashboard_snapshot(site_ids)
+
+        # return only sites which have power telemetry data
+        return [
+            {
+                "site_id": site_id,
+                "actual_kw": site_snapshot["actual_kw"] or 0,
+                "expected_kw": site_snapshot["expected_kw"] or 0,
+            }
+            for site_id, site_snapshot in sites_snapshot.items()
+            if site_snapshot and site_snapshot["power_reported"]
+        ]
 
     def get_company_loses(self, site_ids: list | set, timezone: str = "-6") -> dict:
         """Retrieve company cumulative info for today in timezone UTC-6 to get actual loses"""
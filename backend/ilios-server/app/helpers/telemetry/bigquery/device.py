@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from functools import partial
 
 from app.helpers.telemetry.bigquery.base import BaseTelemetryBigQuery
 from app.schema.common import calculate_actual_vs_expected
@@ -9,40 +10,43 @@ class TelemetryDeviceBigQuery(BaseTelemetryBigQuery):
     def __init__(self) -> None:
         super().__init__()
 
+    def _fetch_devices_performance(
+        self, interval_start: str, interval_end: str, timezone: str, devices_ids: list
+    ) -> dict:
+        """Retrieve devices actual and expected production with the single BigQuery call.
+        Devices without telemetry data are returned with None value."""
+        bq_data = self.execute_bq_function(
+            "device_power_actual_vs_expected", "device_id", devices_ids, interval_start, interval_end, timezone
+        )
+
+        devices_production = dict.fromkeys(devices_ids)
+        for device_response in bq_data or []:
+            actual_kw = device_response["device_power_actual"][0]["value"] or 0
+            expected_kw = device_response["device_power_expected"][0]["value"] or 0
+            devices_production[int(device_response["device_id"])] = {
+                "device_id": device_response["device_id"],
+                "performance": calculate_actual_vs_expected(actual_kw, expected_kw),
+                "actual": actual_kw,
+                "expected": expected_kw,
+            }
+        return devices_production
+
     def get_devices_performance(self, devices_ids: list, timezone: str = "UTC"):
         """
         Fetch device actual and expected production details from telemetry bigquery and calculate device performance.
+        Each device data is cached separately, so only devices missing in cache are requested from BigQuery.
         """
         interval_start_time, interval_end_time = self._get_current_time_period(timezone)
-        # sort IDs to be sure cache is unique per same set of devices
-        devices_ids = sorted(devices_ids)
-        devices_ids_str = "-".join(map(str, devices_ids))
-        cache_name = f"devices-production-{devices_ids_str}-{interval_start_time}-{interval_end_time}"
-        cached_data = self.get_from_cache(cache_name)
-        if cached_data is not None:
-            return cached_data
-
-        bq_data = self.execute_bq_function(
-            "device_power_actual_vs_expected", "device_id", devices_ids, interval_start_time, interval_end_time, timezone
+        devices_production = self.get_per_object_data(
+            "device-production",
+            devices_ids,
+            interval_start_time,
+            interval_end_time,
+            partial(self._fetch_devices_performance, interval_start_time, interval_end_time, timezone),
+            settings.site_dashboard_expiration_seconds,
         )
-
-        devices_production_response = []
-        if bq_data:
-            for device_response in bq_data:
-                actual_kw = device_response["device_power_actual"][0]["value"] or 0
-                expected_kw = device_response["device_power_expected"][0]["value"] or 0
-                devices_production_response.append(
-                    {
-                        "device_id": device_response["device_id"],
-                        "performance": calculate_actual_vs_expected(actual_kw, expected_kw),
-                        "actual": actual_kw,
-                        "expected": expected_kw,
-                    }
-                )
-
-        # update cache with new interval BigQuery data and expiration time 15 minutes
-        self.set_cache(cache_name, devices_production_response, settings.site_dashboard_expiration_seconds)
-        return devices_production_response
+        # return only devices which have telemetry data
+        return [device_production for device_production in devices_production.values() if device_production]
 
     def get_device_last_reported(self, devices_ids: list, timezone: str = "UTC"):
         """Retrieve detail when device data was successfully retrieved last time"""
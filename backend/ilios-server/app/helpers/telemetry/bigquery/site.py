@@ -12,28 +12,6 @@ class TelemetrySiteBigQuery(BaseTelemetryBigQuery):
     def __init__(self) -> None:
         super().__init__()
 
-    def _get_site_cumulative_data(self, site_ids: list, interval_start: str, interval_end: str, timezone: str):
-        object_ids = ", ".join(map(str, site_ids))
-        query = (
-            f"SELECT   site_id,"
-            "(SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_actual, 30, 30)) AS point_data) "
-            "AS site_energy_actual_today,"
-            "(SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_expected, 30, 30)) AS point_data) "
-            "AS site_energy_expected_today,"
-            "(SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_actual, 23, 29)) AS point_data) "
-            "AS site_energy_actual_last_7_days,"
-            "(SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_expected, 23, 29)) AS point_data) "
-            "AS site_energy_expected_last_7_days,"
-            "(SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_actual, 0, 29)) AS point_data) "
-            "AS site_energy_actual_last_30_days,"
-            "(SELECT SUM(point_data.value) FROM UNNEST(ARRAY_SLICE(site_energy_expected, 0, 29)) AS point_data) "
-            "AS site_energy_expected_last_30_days "
-            f"FROM {self.bq_engine.bq_dataset_name}.site_energy_actual_vs_expected_daily("
-            f"'{interval_start}', '{interval_end}', '{timezone}') WHERE site_id IN ({object_ids})"
-        )
-        bq_site_data = list(self.bq_engine.execute_query(query))
-        return bq_site_data
-
     def _get_site_cumulative_data_today(self, site_ids: list, interval_start: str, interval_end: str, timezone: str):
         object_ids = ", ".join(map(str, site_ids))
         query = (
@@ -45,49 +23,32 @@ class TelemetrySiteBigQuery(BaseTelemetryBigQuery):
         bq_site_data = list(self.bq_engine.execute_query(query))
         return bq_site_data
 
-    def get_site_actual_expected_performance(self, site_ids: list | set, timezone: str = "UTC") -> dict:
+    @staticmethod
+    def get_snapshot_power(site_snapshot: dict | None) -> tuple:
+        """Extract (actual_kw, expected_kw) from the site dashboard snapshot, zero values if no telemetry data"""
+        site_snapshot = site_snapshot or {}
+        return site_snapshot.get("actual_kw") or 0, site_snapshot.get("expected_kw") or 0
+
+    @staticmethod
+    def get_snapshot_cumulative_energy(site_snapshot: dict | None) -> tuple:
+        """Calculate (today, last 7 days, last 30 days) energy actual vs expected from the site dashboard snapshot"""
+        site_snapshot = site_snapshot or {}
+        return tuple(
+            calculate_actual_vs_expected(
+                site_snapshot.get(f"site_energy_actual_{period}"), site_snapshot.get(f"site_energy_expected_{period}")
+            )
+            for period in ("today", "last_7_days", "last_30_days")
+        )
+
+    def get_site_actual_expected_performance(self, site_ids: list | set) -> dict:
         """
-        Fetch site actual_kw, expected_kw, performance_index from telemetry bigquery.
-        Put site data for past 15 minutes period in cache to save time for query execution.
+        Fetch site actual_kw, expected_kw for past 15 minutes period from the sites dashboard snapshot.
 
         Returns: dict -> {'site_id1': (actual_kw, expected_kw),
                           'site_id2': (actual_kw, expected_kw), ...}
         """
-
-        interval_start_time, interval_end_time = self._get_current_time_period(timezone)
-        cache_sites = "-".join(map(str, sorted(site_ids)))
-        sites_cache_name = f"actual-production-site-{cache_sites}-{interval_start_time}-{interval_end_time}"
-        cached_site_data = self.get_from_cache(sites_cache_name)
-        if cached_site_data:
-            return cached_site_data
-
-        bq_site_data = self.execute_bq_function(
-            "site_power_actual_vs_expected", "site_id", site_ids, interval_start_time, interval_end_time, timezone
-        )
-
-        telemetry_response = {}
-        for site in bq_site_data:
-            actual_kw = site["site_power_actual"][0]["value"] or 0
-            expected_kw = site["site_power_expected"][0]["value"] or 0
-            telemetry_response[int(site["site_id"])] = (actual_kw, expected_kw)
-
-        for site_id in site_ids:
-            if not telemetry_response.get(site_id):
-                telemetry_response[site_id] = (0, 0)
-            # set individual site cache to be used on site actual production chart
-            # create unique site cache only if method was called for more than 1 site
-            if len(site_ids) > 1:
-                individual_site_cache_name = (
-                    f"actual-production-site-{site_id}-{interval_start_time}-{interval_end_time}"
-                )
-                self.set_cache(
-                    individual_site_cache_name,
-                    {site_id: telemetry_response[site_id]},
-                    settings.site_dashboard_expiration_seconds,
-                )
-        # update cache with new interval BigQuery data and expiration time 15 minutes
-        self.set_cache(sites_cache_name, telemetry_response, settings.site_dashboard_expiration_seconds)
-        return telemetry_response
+        sites_snapshot = self.get_sites_dashboard_snapshot(site_ids)
+        return {site_id: self.get_snapshot_power(site_snapshot) for site_id, site_snapshot in sites_snapshot.items()}
 
     def get_site_today_actual_expected_performance(self, site_ids: list | set, timezone: str = "UTC") -> dict:
         """
@@ -212,49 +173,13 @@ class TelemetrySiteBigQuery(BaseTelemetryBigQuery):
         )
         return site_power_actual_vs_expected
 
-    def get_site_cumulative_energy(self, site_ids: list | set, timezone: str = "-6") -> dict:
-        """Retrieve telemetry site cumulative energy data in timezone UTC-6"""
-        utc_minus_6 = datetime_timezone(timedelta(hours=int(timezone)))
-        datetime_now = datetime.now(utc_minus_6).replace(hour=0, minute=0, second=0, microsecond=0)
-        # daterange should be 1 day ahead to pick up cumulative data for today properly
-        interval_end_date = datetime_now + timedelta(days=1)
-        interval_start_date = datetime_now - timedelta(days=30)
-
-        cache_sites = "-".join(map(str, sorted(site_ids)))
-        site_cache_name = f"cumulative-energy-site-{cache_sites}-{interval_start_date}-{interval_end_date}"
-        cached_site_data = self.get_from_cache(site_cache_name)
-        if cached_site_data:
-            return cached_site_data
-
-        bq_site_data = self._get_site_cumulative_data(
-            site_ids,
-            str(interval_start_date),
-            str(interval_end_date),
-            timezone,
-        )
-
-        telemetry_response = {}
-        for site in bq_site_data:
-            cumulative_vs_expected = calculate_actual_vs_expected(
-                site.get("site_energy_actual_today", 0), site.get("site_energy_expected_today", 0)
-            )
-            cumulative_7_days_vs_expected = calculate_actual_vs_expected(
-                site.get("site_energy_actual_last_7_days", 0), site.get("site_energy_expected_last_7_days", 0)
-            )
-            cumulative_30_days_vs_expected = calculate_actual_vs_expected(
-                site.get("site_energy_actual_last_30_days", 0), site.get("site_energy_expected_last_30_days", 0)
-            )
-
-            telemetry_response[int(site["site_id"])] = (
-                cumulative_vs_expected,
-                cumulative_7_days_vs_expected,
-                cumulative_30_days_vs_expected,
-            )
-
-        for site_id in site_ids:
-            if not telemetry_response.get(site_id):
-                telemetry_response[site_id] = (0, 0, 0)
+    def get_site_cumulative_energy(self, site_ids: list | set) -> dict:
+        """Retrieve telemetry site cumulative energy vs expected in timezone UTC-6 from the sites dashboard snapshot.
 
-        # update cache with new interval BigQuery data and expiration time 15 minutes
-        self.set_cache(site_cache_name, telemetry_response, settings.site_dashboard_expiration_seconds)
-        return telemetry_response
+        Returns: dict -> {'site_id1': (today_vs_expected, last_7_days_vs_expected, last_30_days_vs_expected), ...}
+        """
+        sites_snapshot = self.get_sites_dashboard_snapshot(site_ids)
+        return {
+            site_id: self.get_snapshot_cumulative_energy(site_snapshot)
+            for site_id, site_snapshot in sites_snapshot.items()
+        }
@@ -7,6 +7,7 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.db.session import get_session
 from app.helpers.initial_setup_helper import AppInitHelper
+from app.helpers.powerbi import PowerBIHandler
 from app.middlewares.logging_middleware import RequestsLoggerMiddleware
 
 from . import __version__
@@ -75,6 +76,7 @@ async def lifespan(app: FastAPI):  # noqa: U100
     db = next(get_session())
     AppInitHelper(db).set_predefined_data()
     yield
+    await PowerBIHandler.close_http_client()
 
 
 def ilios_api() -> FastAPI:  # noqa: CFQ001
@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import VARCHAR, Boolean, Column, DateTime, Enum, ForeignKey, Identity, Integer
+from sqlalchemy import VARCHAR, Boolean, Column, DateTime, Enum, ForeignKey, Identity, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -33,3 +33,5 @@ class Alert(Base):
     # setting up the server_default value, that will be filled on the database side
     created_at = Column(DateTime, server_default=utcnow())
     updated_at = Column(DateTime, server_default=utcnow())
+
+    __table_args__ = (UniqueConstraint(device_id, external_id, name="u_alert_device_id_external_id"),)
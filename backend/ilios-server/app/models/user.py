@@ -60,13 +60,20 @@ class User(Base):
     password_recovery = relationship("UserPasswordRecovery", back_populates="user")
     sessions = relationship("Session", back_populates="user")
 
+    # not mapped, access scope of the authenticated user resolved from the projects, see get_current_user
+    access_scope = None
+
     def get_limited_sites_ids(self):
         """Return IDs of sites user has access to. If user is system - return None"""
-        return None if self.is_system_user else {site.id for site in self.sites}
+        if self.is_system_user:
+            return None
+        return self.access_scope.sites_ids if self.access_scope else {site.id for site in self.sites}
 
     def get_limited_companies_ids(self):
         """Return IDs of companies user has access to. If user is system - return None"""
-        return None if self.is_system_user else {company.id for company in self.companies}
+        if self.is_system_user:
+            return None
+        return self.access_scope.companies_ids if self.access_scope else {company.id for company in self.companies}
 
 
 class UserProject(Base):
@@ -8,7 +8,7 @@ from app.crud.notification import NotificationCRUD
 from app.db.session import get_session
 from app.helpers.authentication import get_current_user
 from app.helpers.authorization import get_authorized_notification
-from app.helpers.notification_helper import NotificationReadHandler
+from app.helpers.notification_helper import NotificationsBulkReadHandler
 from app.helpers.pagination import pagination_details
 from app.helpers.query_params_validator import validate_skip_and_limit
 from app.models.notification import Notification
@@ -43,18 +43,9 @@ async def get_notifications(
     total, unread_count, items = NotificationCRUD(db_session).get_notifications_by_user(
         current_user.id, skip=skip, limit=limit
     )
-    for item in items:
-        # NOTE! For the future developers:
-        # currently post-processing makes additional DB call to retrieve notification subject from DB
-        # (because we unlink notification from a task and notifications are related to other entities via extra-table,
-        # which doesn't have FK to the related object)
-        # it's fine, since we have notifications list paginated and UI requests only 5 items per dashboard.
-        # If you face with the performance degradation - it can be optimized from DB calls perspective
-        # by retrieving full list of subjects for notifications which we should serve and
-        # then filter out proper object: for example, if you have 3 comment notification and 3 task notifications,
-        # rather than making 6 DB calls in the notification handler
-        # you can retrieve it by 2 DB calls to corresponding tables
-        NotificationReadHandler(item, db_session).extend_with_additional_fields()
+    # subjects of the notifications are related via extra-table without FK to the related objects,
+    # so they are loaded in bulk per subject type rather than per notification
+    NotificationsBulkReadHandler(items, db_session).extend_with_additional_fields()
 
     return {"items": items, "unread_count": unread_count, **pagination_details(skip, limit, total)}
 
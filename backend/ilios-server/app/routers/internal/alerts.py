@@ -7,9 +7,14 @@ from app.crud.alert import AlertCRUD
 from app.crud.device import DeviceCRUD
 from app.db.session import get_session
 from app.helpers.authentication import api_key_check
-from app.schema.alert import AlertCreateSchema, AlertCreationSuccess
+from app.schema.alert import (
+    AlertBatchCreateSchema,
+    AlertBatchCreationSuccess,
+    AlertCreateSchema,
+    AlertCreationSuccess,
+)
 from app.static import AlertMessages, DeviceMessages
-from app.static.responses import HTTP_403_RESPONSE, HTTP_404_RESPONSE
+from app.static.responses import HTTP_403_RESPONSE, HTTP_404_RESPONSE, HTTP_422_RESPONSE
 
 logger = logging.getLogger(__name__)
 internal_alerts_router = APIRouter()
@@ -35,3 +40,37 @@ async def create_device_alert(
     alert_payload = alert.model_dump()
     alert_crud.create_item(alert_payload)
     return {"code": status.HTTP_201_CREATED, "message": AlertMessages.alert_create_success}
+
+
+@internal_alerts_router.post(
+    "/alerts:batch",
+    response_model=AlertBatchCreationSuccess,
+    status_code=status.HTTP_200_OK,
+    responses={**HTTP_403_RESPONSE, **HTTP_422_RESPONSE},
+    dependencies=[Depends(api_key_check)],
+    description="API to create alerts by telemetry in bulk. Alerts that already exist or refer to unknown devices are "
+    "skipped and reported in the response, so the caller can acknowledge every alert of the batch.",
+)
+async def create_device_alerts_batch(
+    batch: AlertBatchCreateSchema,
+    db_session: Session = Depends(get_session),
+):
+    existing_devices_ids = DeviceCRUD(db_session).get_existing_ids(alert.device_id for alert in batch.alerts)
+    alerts_to_create = [alert for alert in batch.alerts if alert.device_id in existing_devices_ids]
+    created_alerts = AlertCRUD(db_session).create_items_skip_existing([alert.model_dump() for alert in alerts_to_create])
+
+    response = {"created": [], "already_exist": [], "device_not_found": []}
+    reported_alerts = set()
+    for alert in batch.alerts:
+        alert_key = (alert.device_id, alert.external_id)
+        if alert_key in reported_alerts:
+            continue
+        reported_alerts.add(alert_key)
+        alert_reference = {"device_id": alert.device_id, "external_id": alert.external_id}
+        if alert.device_id not in existing_devices_ids:
+            response["device_not_found"].append(alert_reference)
+        elif alert_key in created_alerts:
+            response["created"].append(alert_reference)
+        else:
+            response["already_exist"].append(alert_reference)
+    return response
@@ -1,4 +1,3 @@
-import io
 import logging
 
 from fastapi import APIRouter, Body, Depends, responses
@@ -20,7 +19,7 @@ reports_router = APIRouter()
     dependencies=[Depends(AuthorizedUser(ReportingPermissions(PermissionsActions.view)))],
 )
 async def get_reports_list():
-    return {"items": PowerBIHandler().list_reports()}
+    return {"items": await PowerBIHandler().list_reports()}
 
 
 @reports_router.get(
@@ -30,7 +29,7 @@ async def get_reports_list():
     dependencies=[Depends(AuthorizedUser(ReportingPermissions(PermissionsActions.view)))],
 )
 async def generate_report_embedding_token(report_id: str):
-    token = PowerBIHandler().generate_embed_token(report_id)
+    token = await PowerBIHandler().generate_embed_token(report_id)
     return {"embed_token": token}
 
 
@@ -40,7 +39,7 @@ async def generate_report_embedding_token(report_id: str):
     dependencies=[Depends(AuthorizedUser(ReportingPermissions(PermissionsActions.view)))],
 )
 async def retrieve_report_pages(report_id: str):
-    return PowerBIHandler().get_report_pages(report_id)
+    return await PowerBIHandler().get_report_pages(report_id)
 
 
 @reports_router.post(
@@ -49,7 +48,7 @@ async def retrieve_report_pages(report_id: str):
     dependencies=[Depends(AuthorizedUser(ReportingPermissions(PermissionsActions.view)))],
 )
 async def export_report_to_file(report_id: str, export_params: dict = Body({"format": "PDF"})):
-    return PowerBIHandler().export_report_to_file(report_id, export_params)
+    return await PowerBIHandler().export_report_to_file(report_id, export_params)
 
 
 @reports_router.get(
@@ -58,7 +57,7 @@ async def export_report_to_file(report_id: str, export_params: dict = Body({"for
     dependencies=[Depends(AuthorizedUser(ReportingPermissions(PermissionsActions.view)))],
 )
 async def get_export_report_status(report_id: str, export_id: str):
-    return PowerBIHandler().get_export_status(report_id, export_id)
+    return await PowerBIHandler().get_export_status(report_id, export_id)
 
 
 @reports_router.get(
@@ -67,7 +66,7 @@ async def get_export_report_status(report_id: str, export_id: str):
     dependencies=[Depends(AuthorizedUser(ReportingPermissions(PermissionsActions.view)))],
 )
 async def get_export_report_file_content(report_id: str, export_id: str):
-    file_content, content_type = PowerBIHandler().get_export_file(report_id, export_id)
+    content_chunks, content_type = await PowerBIHandler().get_export_file(report_id, export_id)
     # TODO experiment with different media types: "application/octet-stream" proved to return a file,
     #  but need to align with FE
-    return responses.StreamingResponse(io.BytesIO(file_content), media_type=content_type)
+    return responses.StreamingResponse(content_chunks, media_type=content_type)
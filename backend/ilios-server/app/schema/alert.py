@@ -110,5 +110,22 @@ class AlertCreateSchema(BaseModel):
     external_id: str = Field(examples=["121w2DFw"])
 
 
+class AlertBatchCreateSchema(BaseModel):
+    alerts: list[AlertCreateSchema] = Field(min_length=1, max_length=1000)
+
+
+class AlertReferenceSchema(BaseModel):
+    device_id: int = Field(examples=[2])
+    external_id: str = Field(examples=["121w2DFw"])
+
+
+class AlertBatchCreationSuccess(BaseModel):
+    """Outcome of the batch creation per alert, each provided alert is listed in exactly one of the lists"""
+
+    created: list[AlertReferenceSchema]
+    already_exist: list[AlertReferenceSchema]
+    device_not_found: list[AlertReferenceSchema]
+
+
 class OMAlertSchema(AlertBaseSchema):
     type: str
@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     secret_key: str
     api_key: str
     access_token_expire_minutes: Optional[int] = 60 * 24
+    # users access scope is reused within this period unless users or projects are changed
+    principal_cache_ttl_seconds: Optional[int] = 60
+    principal_cache_max_entries: Optional[int] = 10000
     invitation_link_expire_days: Optional[int] = 1
     invitation_url: str
     reset_password_expires_minutes: Optional[int] = 30
@@ -76,6 +79,8 @@ class Settings(BaseSettings):
     sa_uploads_allowed_extensions: Optional[str] = "jpeg,jpg,png"
     allowed_filesize: Optional[int] = 100 * 1024 * 1024  # Max file size in bytes. Default 100 MB.
     file_download_link_expiration_minutes: Optional[int] = 60 * 2  # 2 hours
+    # signed download and preview links are reused within this period, keep it well below the link expiration
+    file_signed_url_cache_seconds: Optional[int] = 5 * 60  # 5 minutes
     service_account_key_file_path: Optional[str] = "key.json"
 
     # AI integration settings
@@ -86,6 +91,7 @@ class Settings(BaseSettings):
     chatbot_mark_actual_function_url: str
     chatbot_delete_file_function_url: str
     chatbot_session_token_function_url: str
+    cloud_function_dispatch_max_workers: Optional[int] = 4
     ml_api_key: str
 
     # Telemetry integration settings
@@ -114,6 +120,8 @@ class Settings(BaseSettings):
     # BigQuery settings
     telemetry_bq_project_id: Optional[str] = "prj-ilios-telemetry"
     telemetry_bq_job_id_prefix: Optional[str] = "platform-query-job-"
+    # max keep-alive connections of the shared BigQuery client, aligned with the default FastAPI threadpool size
+    bq_http_pool_maxsize: Optional[int] = 40
     # tables for characteristics sync, the same for all the envs
     bq_device_characteristics_table: Optional[str] = "device_characteristics"
     bq_site_characteristics_table: Optional[str] = "site_characteristics"
@@ -133,6 +141,10 @@ class Settings(BaseSettings):
     pbi_client_id: str
     pbi_client_secret: str
     pbi_workspace_id: str
+    pbi_request_timeout_seconds: Optional[int] = 60
+    # keep-alive connections of the shared PowerBI client
+    pbi_http_max_keepalive_connections: Optional[int] = 20
+    pbi_export_chunk_size: Optional[int] = 64 * 1024  # exported files are streamed to the client by 64 KB
 
     # Other configurables
     device_no_respond_threshold: Optional[int] = 30 * 60  # 30 minutes as default
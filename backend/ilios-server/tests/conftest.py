@@ -56,8 +56,10 @@ pytest_plugins = [
     "tests.fixtures.users",
     "tests.fixtures.notifications",
     "tests.fixtures.gcs",
+    "tests.fixtures.cloud_functions",
     "tests.fixtures.site_visits",
     "tests.fixtures.power_bi",
+    "tests.fixtures.principal_cache",
 ]
 
 
@@ -1,5 +1,7 @@
 import pytest
 
+from app.bigquery.bigquery import BigQueryClientRegistry
+
 
 @pytest.fixture(scope="function")
 def ignore_bq_sync(mocker):
@@ -10,9 +12,12 @@ def ignore_bq_sync(mocker):
 @pytest.fixture(scope="function")
 def bq_client_mock(mocker):
     """Mock BQ client to track all raw calls"""
+    # the client is shared across the process, so drop the one created by previous tests
+    BigQueryClientRegistry.reset()
     mocker.patch("app.bigquery.bigquery.service_account.Credentials.from_service_account_file")
     bq_client_mock = mocker.patch("app.bigquery.bigquery.bigquery.Client", autospec=True)
 
     yield bq_client_mock
 
     bq_client_mock().reset_mock()
+    BigQueryClientRegistry.reset()
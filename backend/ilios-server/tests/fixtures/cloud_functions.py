@@ -0,0 +1,11 @@
+import pytest
+
+from app.helpers.cloud_function_client import cloud_func_sessions
+
+
+@pytest.fixture(scope="function", autouse=True)
+def cloud_func_session_registry():
+    """Drop the sessions and tokens cached by the previous test, so every test sees its own mocks"""
+    cloud_func_sessions.clear()
+    yield
+    cloud_func_sessions.clear()
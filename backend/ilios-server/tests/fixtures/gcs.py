@@ -1,8 +1,17 @@
 import pytest
 
+from app.helpers.files.file_handler import storage_registry
 from tests.unit import samples
 
 
+@pytest.fixture(scope="function", autouse=True)
+def gcs_storage_registry():
+    """Drop the storage client and signed URLs cached by the previous test, so every test sees its own mocks"""
+    storage_registry.clear()
+    yield
+    storage_registry.clear()
+
+
 @pytest.fixture(scope="function")
 def gcs_signed_url_generation(mocker):
     """Applicable only for the O&M site level tasks"""
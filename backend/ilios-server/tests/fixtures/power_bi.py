@@ -1,36 +1,44 @@
 import pickle
 
+import httpx
 import pytest
 
 import tests.unit.samples as samples
+from app.helpers.powerbi import PowerBIHandler
 from app.static import PBI_CONTENT_TYPE_HEADER
-from tests.utils import create_file_response, create_response
+
+
+def mock_pbi_api(mocker, *responses: httpx.Response):
+    """Serve PowerBI API calls with the responses in the given order, the last one is returned for the rest calls"""
+    api_mock = mocker.Mock(side_effect=lambda request: responses[min(api_mock.call_count, len(responses)) - 1])
+    mocker.patch.object(
+        PowerBIHandler, "get_http_client", return_value=httpx.AsyncClient(transport=httpx.MockTransport(api_mock))
+    )
+    return api_mock
 
 
 @pytest.fixture(scope="function")
 def pbi_token_reports_mock_200(mocker):
     """Mock APIs for token getting and reports list retrieval"""
-    requests_mock = mocker.patch("app.helpers.powerbi.requests")
-    requests_mock.request.side_effect = [
-        create_response(200, samples.POWER_BI_ACCESS_TOKEN_RESPONSE),
-        create_response(200, samples.POWER_BI_REPORTS_RESPONSE),
-    ]
+    mock_pbi_api(
+        mocker,
+        httpx.Response(200, json=samples.POWER_BI_ACCESS_TOKEN_RESPONSE),
+        httpx.Response(200, json=samples.POWER_BI_REPORTS_RESPONSE),
+    )
 
     yield
 
 
 @pytest.fixture(scope="function")
 def pbi_reports_mock_200(mocker):
-    requests_mock = mocker.patch("app.helpers.powerbi.requests")
-    requests_mock.request.return_value = create_response(200, samples.POWER_BI_REPORTS_RESPONSE)
+    mock_pbi_api(mocker, httpx.Response(200, json=samples.POWER_BI_REPORTS_RESPONSE))
 
     yield
 
 
 @pytest.fixture(scope="function")
 def pbi_token_mock_400(mocker):
-    requests_mock = mocker.patch("app.helpers.powerbi.requests")
-    requests_mock.request.return_value = create_response(400, {})
+    mock_pbi_api(mocker, httpx.Response(400, json={}))
     yield
 
 
@@ -51,11 +59,11 @@ def pbi_with_cache(mocker):
 @pytest.fixture(scope="function")
 def pbi_token_embed_mock_200(mocker):
     """Mock APIs for token getting and embedding token generation"""
-    requests_mock = mocker.patch("app.helpers.powerbi.requests")
-    requests_mock.request.side_effect = [
-        create_response(200, samples.POWER_BI_ACCESS_TOKEN_RESPONSE),
-        create_response(200, samples.POWER_BI_EMBED_TOKEN_RESPONSE),
-    ]
+    mock_pbi_api(
+        mocker,
+        httpx.Response(200, json=samples.POWER_BI_ACCESS_TOKEN_RESPONSE),
+        httpx.Response(200, json=samples.POWER_BI_EMBED_TOKEN_RESPONSE),
+    )
 
     yield
 
@@ -63,18 +71,12 @@ def pbi_token_embed_mock_200(mocker):
 @pytest.fixture(scope="function")
 def pbi_generic_json_mock_200(mocker):
     """Mock APIs for token getting and any generic response"""
-    requests_mock = mocker.patch("app.helpers.powerbi.requests")
-    requests_mock.request.return_value = create_response(200, samples.POWER_BI_GENERIC_RESPONSE)
-
-    yield requests_mock
+    yield mock_pbi_api(mocker, httpx.Response(200, json=samples.POWER_BI_GENERIC_RESPONSE))
 
 
 @pytest.fixture(scope="function")
 def pbi_response_pdf_mock_200(mocker):
     """Mock APIs for token getting and any generic response"""
-    requests_mock = mocker.patch("app.helpers.powerbi.requests")
-    requests_mock.request.return_value = create_file_response(
-        200, b"", headers={PBI_CONTENT_TYPE_HEADER: "application/pdf"}
-    )
+    mock_pbi_api(mocker, httpx.Response(200, content=b"", headers={PBI_CONTENT_TYPE_HEADER: "application/pdf"}))
 
     yield
@@ -0,0 +1,31 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.helpers.principal_cache import principal_cache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def principal_cache_versions():
+    """Keep the version of users and projects in memory instead of Redis"""
+    versions = {}
+    cache_mock = Mock()
+    cache_mock.get.side_effect = versions.get
+    cache_mock.incr.side_effect = lambda key: versions.update({key: versions.get(key, 0) + 1})
+    with patch("app.helpers.principal_cache.get_cache", return_value=cache_mock):
+        yield versions
+
+
+@pytest.fixture(scope="function", autouse=True)
+def principal_cache_registry():
+    """Drop the access scopes cached by the previous test"""
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture(scope="function")
+def principal_cache_disabled(monkeypatch):
+    """Resolve the access scope on every request, so the number of DB queries of a request doesn't depend on the
+    requests made before it"""
+    monkeypatch.setattr(principal_cache, "ttl_seconds", 0)
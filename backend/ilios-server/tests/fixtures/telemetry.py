@@ -45,7 +45,7 @@ def mocked_big_query_site_data(mocker):
     cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
     cache_mock.return_value.get.return_value = None
     telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
-    telemetry_bq_engine.return_value.execute_query.return_value = samples.SITE_DASHBOARD_BIGQUERY_RESPONSE
+    telemetry_bq_engine.return_value.execute_query.return_value = samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE
 
 
 @pytest.fixture(scope="function")
@@ -53,28 +53,27 @@ def mocked_big_query_site_actual_production_data(mocker, site_id):
     cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
     cache_mock.return_value.get.return_value = None
     telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
-    site_response = deepcopy(samples.SITE_DASHBOARD_BIGQUERY_RESPONSE)
+    site_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
     site_response[0].update({"site_id": site_id})
-    telemetry_bq_engine.return_value.execute_query.side_effect = [
-        site_response,
-        samples.SITE_TODAY_CUMULATIVE_BQ_RESPONSE,
-    ]
+    # snapshot and today cumulative queries are executed in parallel threads, so respond based on the query
+    telemetry_bq_engine.return_value.execute_query.side_effect = lambda query: (
+        site_response if "site_last_report_ts" in query else samples.SITE_TODAY_CUMULATIVE_BQ_RESPONSE
+    )
 
 
 @pytest.fixture(scope="function")
 def mocked_big_query_site_actual_production_data_from_cache(mocker, site_id):
     cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
-    cache_mock.return_value.get.side_effect = [
-        pickle.dumps({site_id: (42.00, 13.000)}),
-        pickle.dumps(samples.SITE_TODAY_CUMULATIVE_CACHED_RESPONSE),
-    ]
+    # ongoing production is cached per site as part of dashboard snapshot, today cumulative - per sites set
+    cache_mock.return_value.mget.return_value = [pickle.dumps({"actual_kw": 42.00, "expected_kw": 13.000})]
+    cache_mock.return_value.get.return_value = pickle.dumps(samples.SITE_TODAY_CUMULATIVE_CACHED_RESPONSE)
     mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
 
 
 @pytest.fixture(scope="function")
 def mocked_big_query_company_site(mocker, company_id, site_id):
-    bq_response = deepcopy(samples.SITE_DASHBOARD_BIGQUERY_RESPONSE)
-    bq_response[0].update({"site_id": site_id, "company_id": company_id})
+    bq_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
+    bq_response[0].update({"site_id": site_id})
     cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
     cache_mock.return_value.get.return_value = None
     telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
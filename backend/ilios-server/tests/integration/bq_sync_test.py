@@ -3,6 +3,7 @@ from unittest.mock import ANY
 import pytest
 from google.cloud import bigquery
 
+from app.bigquery.bigquery import BigQueryClientRegistry, BigQueryReadEngine, BigQueryWriteEngine
 from app.settings import settings
 from app.static.default_site_documents_enum import SiteDocumentsEnum
 from app.static.due_diligence_bq_keys import DD_BQ_ESTIMATED_GENERATION_FIELD_NAME, DueDiligenceBQKeys
@@ -443,3 +444,12 @@ class TestBQSyncProcess:
         logger_mock.warning.assert_any_call(f"Cannot transform to KWh: input_value='{key_value}'")
         bq_client_mock().query.assert_called()
         assert upsert_query_parameter_value in actual_job_config.query_parameters
+
+    def test_bq_client_shared_between_engines(self, bq_client_mock):
+        """Validate BQ client is created once per process and reused by all the engines"""
+        first_engine, second_engine = BigQueryReadEngine(), BigQueryWriteEngine()
+        first_engine.execute_query("SELECT 1")
+
+        assert first_engine._client is second_engine._client
+        bq_client_mock.assert_called_once_with(project=settings.telemetry_bq_project_id, credentials=ANY, _http=ANY)
+        assert BigQueryClientRegistry.queries_in_flight == 0
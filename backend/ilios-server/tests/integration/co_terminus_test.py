@@ -90,8 +90,7 @@ class TestCoTerminusProcess:
 
         # On the 1st iteration, GCP returns error
         mocker.patch("app.helpers.cloud_function_client.service_account.Credentials.from_service_account_file")
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token.fetch_id_token")
-        mocker.patch("app.helpers.cloud_function_client.requests.post", return_value=response_400)
+        mocker.patch("app.helpers.cloud_function_client.requests.Session.post", return_value=response_400)
         init_failed_response = client.post(
             self._generate_check_endpoint(api_site.id), headers=company_member_user_auth_header
         )
@@ -101,7 +100,7 @@ class TestCoTerminusProcess:
         init_failed_status_response_json = init_failed_status_response.json()
 
         # Then, AI call is successful
-        mocker.patch("app.helpers.cloud_function_client.requests.post", return_value=response_200)
+        mocker.patch("app.helpers.cloud_function_client.requests.Session.post", return_value=response_200)
 
         # partial processing - some values processed by our BE, some sent to the AI processing
         init_success_response = client.post(
@@ -918,10 +918,11 @@ class TestDevices:
         mocker.patch("app.helpers.telemetry.firestore_client.firestore.Client")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.device_helper.TelemetryDeviceBigQuery")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = create_response(200, samples.TELEMETRY_STATIC_DEVICE_DATA_RESPONSE)
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(
+            200, samples.TELEMETRY_STATIC_DEVICE_DATA_RESPONSE
+        )
         update_response = client.put(
             self._generate_device_telemetry_details_endpoint(site_id, device_id),
             headers=company_member_user_auth_header,
@@ -943,9 +944,8 @@ class TestDevices:
         mocker.patch("app.helpers.telemetry.firestore_client.firestore.Client")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = create_response(200, {})
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(200, {})
         update_response = client.put(
             self._generate_device_telemetry_details_endpoint(site_id, device_id),
             headers=company_member_user_auth_header,
@@ -1013,12 +1013,11 @@ class TestDevices:
         mocker.patch("app.helpers.telemetry.firestore_client.firestore.Client")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
         logger_mock = mocker.patch("app.schema.om_device.logger")
         telemetry_response = deepcopy(samples.TELEMETRY_STATIC_DEVICE_DATA_RESPONSE)
         telemetry_response[field_name] = invalid_value
-        mock_telemetry_requests.post.return_value = create_response(200, telemetry_response)
+        mock_telemetry_requests.return_value.post.return_value = create_response(200, telemetry_response)
 
         update_response = client.put(
             self._generate_device_telemetry_details_endpoint(site_id, device_id),
@@ -2,12 +2,21 @@
 
 from datetime import datetime, timedelta, timezone
 from time import sleep
+from unittest.mock import Mock
 
 import pytest
+import redis
+from sqlalchemy import event, insert
 
 import tests.unit.samples as samples
 from app.crud.session import SessionCRUD
+from app.crud.site import SiteCRUD
+from app.crud.user_project import UserProjectCRUD
+from app.helpers.authentication import get_current_user
+from app.helpers.principal_cache import principal_cache
+from app.models.user import UserProject
 from app.settings import settings
+from tests.conftest import engine
 from tests.utils import gen_jwt
 
 
@@ -185,3 +194,104 @@ class TestAuthDependency:
 
         assert response.status_code == 200
         assert response.json() == {"message": "test"}
+
+    def test_auth_access_scope_cached(self, client, company_member_user_auth_header, site_id):
+        """User with the role is loaded by a single query, the access scope is resolved once and then reused"""
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):  # noqa: U100
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+        queries_count = []
+        for _ in range(2):
+            statements.clear()
+            response = client.get(self.AUTH_TEST_ENDPOINT, headers=company_member_user_auth_header)
+            assert response.status_code == 200
+            queries_count.append(len(statements))
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert queries_count == [2, 1]
+
+    def test_auth_access_scope_invalidated(
+        self, db_session, company_member_user, company_member_user_jwt, company_id, site_id
+    ):
+        """Access given via the projects CRUD is visible on the next request"""
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        assert current_user.get_limited_sites_ids() == {site_id}
+
+        new_site = SiteCRUD(db_session).create_item({**samples.TEST_SITE_BODY, "company_id": company_id})
+        UserProjectCRUD(db_session).create_items(
+            [{"user_id": company_member_user.id, "company_id": company_id, "site_id": new_site.id}]
+        )
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        assert current_user.get_limited_sites_ids() == {site_id, new_site.id}
+        assert current_user.get_limited_companies_ids() == {company_id}
+
+        # the user project is deleted by the DB cascade
+        SiteCRUD(db_session).delete_by_id(new_site.id)
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        assert current_user.get_limited_sites_ids() == {site_id}
+
+    def test_auth_access_scope_invalidated_by_other_process(
+        self, db_session, company_member_user, company_member_user_jwt, company_id, site_id
+    ):
+        """Access changed by another process is visible once it increments the shared version"""
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        assert current_user.get_limited_sites_ids() == {site_id}
+
+        new_site = SiteCRUD(db_session).create_item({**samples.TEST_SITE_BODY, "company_id": company_id})
+        # not tracked by the session of this process
+        db_session.execute(
+            insert(UserProject).values(user_id=company_member_user.id, company_id=company_id, site_id=new_site.id)
+        )
+        db_session.commit()
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        assert current_user.get_limited_sites_ids() == {site_id}
+
+        principal_cache.invalidate()
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        SiteCRUD(db_session).delete_by_id(new_site.id)
+
+        assert current_user.get_limited_sites_ids() == {site_id, new_site.id}
+
+    def test_auth_access_scope_redis_unavailable(self, client, company_member_user_auth_header, site_id, mocker):
+        """Access scope is resolved from the DB and not cached while the version can't be read from Redis"""
+        mocker.patch("app.helpers.principal_cache.get_cache").return_value.get.side_effect = redis.ConnectionError
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):  # noqa: U100
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+        queries_count = []
+        for _ in range(2):
+            statements.clear()
+            response = client.get(self.AUTH_TEST_ENDPOINT, headers=company_member_user_auth_header)
+            assert response.status_code == 200
+            queries_count.append(len(statements))
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert queries_count == [2, 2]
+
+    def test_auth_access_scope_invalidation_redis_unavailable(
+        self, db_session, company_member_user, company_member_user_jwt, company_id, site_id, mocker
+    ):
+        """Failure to increment the version doesn't fail the committed change, the scopes of this process are dropped"""
+        logger_mock = mocker.patch("app.helpers.principal_cache.logger")
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        assert current_user.get_limited_sites_ids() == {site_id}
+
+        cache_mock = mocker.patch("app.helpers.principal_cache.get_cache")
+        cache_mock.return_value.get.return_value = None
+        cache_mock.return_value.incr.side_effect = redis.ConnectionError
+        new_site = SiteCRUD(db_session).create_item({**samples.TEST_SITE_BODY, "company_id": company_id})
+        UserProjectCRUD(db_session).create_items(
+            [{"user_id": company_member_user.id, "company_id": company_id, "site_id": new_site.id}]
+        )
+        logger_mock.exception.assert_called_once_with("Failed to increment the principals version")
+
+        current_user = get_current_user(Mock(), company_member_user_jwt, db_session)
+        SiteCRUD(db_session).delete_by_id(new_site.id)
+
+        assert current_user.get_limited_sites_ids() == {site_id, new_site.id}
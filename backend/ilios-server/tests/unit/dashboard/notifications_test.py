@@ -1,5 +1,19 @@
-from app.models.notification import NotificationKindsEnum
+import copy
+
+from sqlalchemy import event
+
+from app.crud.comment import CommentCRUD
+from app.crud.commented_entity import CommentedEntityCRUD
+from app.crud.notification import NotificationCRUD
+from app.crud.notification_subject import NotificationSubjectCRUD
+from app.crud.task import TaskCRUD
+from app.crud.user import UserCRUD
+from app.helpers.notification_helper import NotificationsBulkReadHandler
+from app.models.comment import CommentedEntityTypeEnum
+from app.models.notification import NotificationKindsEnum, NotificationSubjectsEnum
 from app.static import TASK_UNDEFINED_STATUS, NotificationMessages
+from tests.conftest import engine
+from tests.unit import samples
 
 
 class TestNotificationsDashboard:
@@ -296,3 +310,103 @@ class TestNotificationsDashboard:
             headers=non_system_user_auth_header,
         )
         assert response.status_code == 404
+
+    def test_get_notifications_list_queries_count(
+        self, client, db_session, company_member_notifications, company_member_user_auth_header, principal_cache_disabled
+    ):
+        """Notifications are hydrated in bulk, so the number of DB queries doesn't depend on the page size"""
+
+        def get_queries_count():
+            statements = []
+
+            def count_statement(conn, cursor, statement, *args):  # noqa: U100
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", count_statement)
+            response = client.get(f"{self._generate_list_endpoint()}?limit=100", headers=company_member_user_auth_header)
+            event.remove(engine, "before_cursor_execute", count_statement)
+            return len(response.json()["items"]), len(statements)
+
+        items_count, queries_count = get_queries_count()
+
+        # add the same notifications for other tasks and comments, with other actors and assignees, so none of
+        # the subjects and users is already loaded when the page is hydrated
+        user_crud = UserCRUD(db_session)
+        task_crud = TaskCRUD(db_session)
+        comment_crud = CommentCRUD(db_session)
+        notification_crud = NotificationCRUD(db_session)
+        users, tasks, comments, notifications = [], [], [], []
+
+        def create_task(board_id, status_id, user_id):
+            task_payload = copy.deepcopy(samples.TEST_TASK_PAYLOAD)
+            task_payload.update(
+                {
+                    "board_id": board_id,
+                    "status_id": status_id,
+                    "creator_id": user_id,
+                    "assignee_id": user_id,
+                    "external_id": f"NTF-{len(tasks) + 1}",
+                }
+            )
+            task = task_crud.create_item(task_payload)
+            tasks.append(task)
+            return task
+
+        for index, notification in enumerate(company_member_notifications):
+            user = user_crud.create_item(
+                {
+                    "first_name": f"Assignee {index}",
+                    "last_name": "Notification",
+                    "email": f"notification-assignee-{index}@test.com",
+                    "is_registered": True,
+                    "phone": "1234567890",
+                }
+            )
+            users.append(user)
+            if notification.subject.entity_type == NotificationSubjectsEnum.task:
+                subject_task = notification.subject.parent_entity_task
+                subject_id = create_task(subject_task.board_id, subject_task.status_id, user.id).id
+            else:
+                commented_entity = notification.subject.parent_entity_comment.commented_entity
+                entity_id = commented_entity.entity_id
+                if commented_entity.entity_type == CommentedEntityTypeEnum.task:
+                    commented_task = commented_entity.parent_entity_task
+                    entity_id = create_task(commented_task.board_id, commented_task.status_id, user.id).id
+                comment = comment_crud.create_item({"text": f"Mention {index}"})
+                CommentedEntityCRUD(db_session).create_item(
+                    {"comment_id": comment.id, "entity_type": commented_entity.entity_type, "entity_id": entity_id}
+                )
+                comments.append(comment)
+                subject_id = comment.id
+            extra = dict(notification.extra) if notification.extra else None
+            for key in NotificationsBulkReadHandler.USER_EXTRA_KEYS:
+                if extra and key in extra:
+                    extra[key] = user.id
+            new_notification = notification_crud.create_item(
+                {
+                    "actor_id": user.id,
+                    "recipient_id": notification.recipient_id,
+                    "kind": notification.kind,
+                    "extra": extra,
+                }
+            )
+            NotificationSubjectCRUD(db_session).create_item(
+                {
+                    "entity_type": notification.subject.entity_type,
+                    "entity_id": subject_id,
+                    "notification_id": new_notification.id,
+                }
+            )
+            notifications.append(new_notification)
+
+        try:
+            assert get_queries_count() == (2 * items_count, queries_count)
+        finally:
+            for crud, items in (
+                (notification_crud, notifications),
+                (comment_crud, comments),
+                (task_crud, tasks),
+                (user_crud, users),
+            ):
+                for item in items:
+                    crud.delete_by_id(item.id)
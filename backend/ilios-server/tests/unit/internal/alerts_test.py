@@ -9,6 +9,7 @@ from tests.unit import samples
 class TestAlerts:
     INTERNAL_PATH = "/api/internal"
     ALERTS_ENDPOINT = f"{INTERNAL_PATH}/alerts"
+    ALERTS_BATCH_ENDPOINT = f"{INTERNAL_PATH}/alerts:batch"
 
     def test_create_device_alert(
         self,
@@ -66,3 +67,44 @@ class TestAlerts:
             json=payload,
         )
         assert response.status_code == 403
+
+    def test_create_device_alerts_batch(
+        self,
+        client,
+        device_id,
+        db_session,
+    ):
+        existing_alert = deepcopy(samples.TEST_ALERT_BODY)
+        existing_alert.update({"device_id": device_id, "severity": "critical"})
+        AlertCRUD(db_session).create_item(existing_alert)
+        new_alert = deepcopy(samples.TEST_ALERT_BODY)
+        new_alert.update({"device_id": device_id, "external_id": "new-external-id"})
+        duplicated_alert = deepcopy(samples.TEST_ALERT_BODY)
+        duplicated_alert["device_id"] = device_id
+        unknown_device_alert = deepcopy(samples.TEST_ALERT_BODY)
+        unknown_device_alert["device_id"] = 999
+
+        response = client.post(
+            self.ALERTS_BATCH_ENDPOINT,
+            params={"api_key": settings.api_key},
+            json={"alerts": [new_alert, duplicated_alert, unknown_device_alert, new_alert]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "created": [{"device_id": device_id, "external_id": "new-external-id"}],
+            "already_exist": [{"device_id": device_id, "external_id": samples.TEST_ALERT_BODY["external_id"]}],
+            "device_not_found": [{"device_id": 999, "external_id": samples.TEST_ALERT_BODY["external_id"]}],
+        }
+        assert AlertCRUD(db_session).get_by_external_id(device_id, "new-external-id")
+        assert AlertCRUD(db_session).total() == 2
+
+    def test_create_device_alerts_batch_empty(self, client):
+        response = client.post(self.ALERTS_BATCH_ENDPOINT, params={"api_key": settings.api_key}, json={"alerts": []})
+        assert response.status_code == 422
+
+    def test_create_device_alerts_batch_403(self, client, device_id):
+        payload = deepcopy(samples.TEST_ALERT_BODY)
+        payload["device_id"] = device_id
+        response = client.post(self.ALERTS_BATCH_ENDPOINT, params={"api_key": "invalid_key"}, json={"alerts": [payload]})
+        assert response.status_code == 403
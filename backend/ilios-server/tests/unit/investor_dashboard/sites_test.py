@@ -11,17 +11,11 @@ class TestInvestorDashboardSites:
         return "/api/investor-dashboard/sites"
 
     def test_get_sites(self, client, site_id, company_member_user_auth_header, mocker):
-        bq_response_site_actual_response = deepcopy(samples.SITE_DASHBOARD_BIGQUERY_RESPONSE)
-        bq_response_site_actual_response[0].update({"site_id": site_id})
-        bq_response_site_cumulative_response = deepcopy(samples.TELEMETRY_SITE_CUMULATIVE_ENERGY_RESPONSE)
-        bq_response_site_cumulative_response[0].update({"site_id": site_id})
-        cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
-        cache_mock.return_value.get.side_effect = [None, None]
+        bq_response_site_snapshot_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
+        bq_response_site_snapshot_response[0].update({"site_id": site_id})
+        mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
         telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
-        telemetry_bq_engine.return_value.execute_query.side_effect = [
-            bq_response_site_actual_response,
-            bq_response_site_cumulative_response,
-        ]
+        telemetry_bq_engine.return_value.execute_query.return_value = bq_response_site_snapshot_response
 
         response = client.get(self._generate_sites_list_endpoint(), headers=company_member_user_auth_header)
 
@@ -41,15 +35,11 @@ class TestInvestorDashboardSites:
         ]
 
     def test_get_sites_cached_telemetry(self, client, site_id, company_member_user_auth_header, mocker):
-        bq_response_site_actual_response = pickle.dumps(
-            {site_id: (samples.TEST_BQ_ACTUAL_KW, samples.TEST_BQ_EXPECTED_KW)}
-        )
-        bq_response_site_cumulative_response = pickle.dumps({site_id: (86, 99, 97)})
+        cached_site_snapshot = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE[0])
+        cached_site_snapshot.update({"actual_kw": samples.TEST_BQ_ACTUAL_KW, "expected_kw": samples.TEST_BQ_EXPECTED_KW})
         cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
-        cache_mock.return_value.get.side_effect = [
-            bq_response_site_actual_response,
-            bq_response_site_cumulative_response,
-        ]
+        # telemetry is cached per site as dashboard snapshot
+        cache_mock.return_value.mget.return_value = [pickle.dumps(cached_site_snapshot)]
         mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
 
         response = client.get(self._generate_sites_list_endpoint(), headers=company_member_user_auth_header)
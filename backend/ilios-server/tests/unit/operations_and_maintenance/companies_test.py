@@ -171,10 +171,10 @@ class TestOMCompanies:
         cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
         cache_mock.return_value.get.return_value = None
         telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
-        bq_response = deepcopy(samples.SITE_DASHBOARD_BIGQUERY_RESPONSE)
+        bq_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
         bq_response[0]["site_id"] = site.id
-        bq_response[0]["site_power_actual"][0]["value"] = 10.34432101423413
-        bq_response[0]["site_power_expected"][0]["value"] = 7.545151545151
+        bq_response[0]["actual_kw"] = 10.34432101423413
+        bq_response[0]["expected_kw"] = 7.545151545151
         telemetry_bq_engine.return_value.execute_query.return_value = bq_response
 
         response = client.get(
@@ -227,17 +227,11 @@ class TestOMCompanies:
 
     def test_get_company_sites(self, client, company_id, site_id, company_member_user_auth_header, mocker):
         """Test that get company sites return list of sites if access was provided."""
-        bq_response_site_actual_response = deepcopy(samples.SITE_DASHBOARD_BIGQUERY_RESPONSE)
-        bq_response_site_actual_response[0].update({"site_id": site_id})
-        bq_response_site_cumulative_response = deepcopy(samples.TELEMETRY_SITE_CUMULATIVE_ENERGY_RESPONSE)
-        bq_response_site_cumulative_response[0].update({"site_id": site_id})
-        cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
-        cache_mock.return_value.get.side_effect = [None, None]
+        bq_response_site_snapshot_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
+        bq_response_site_snapshot_response[0].update({"site_id": site_id})
+        mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
         telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
-        telemetry_bq_engine.return_value.execute_query.side_effect = [
-            bq_response_site_actual_response,
-            bq_response_site_cumulative_response,
-        ]
+        telemetry_bq_engine.return_value.execute_query.return_value = bq_response_site_snapshot_response
         response = client.get(
             f"{self.COMPANIES_API_ENDPOINT}/{company_id}/sites", headers=company_member_user_auth_header
         )
@@ -267,15 +261,11 @@ class TestOMCompanies:
         self, client, company_id, site_id, company_member_user_auth_header, mocker
     ):
         """Test that get company sites return list of sites with cached data from telemetry if access was provided."""
-        bq_response_site_actual_response = pickle.dumps(
-            {site_id: (samples.TEST_BQ_ACTUAL_KW, samples.TEST_BQ_EXPECTED_KW)}
-        )
-        bq_response_site_cumulative_response = pickle.dumps({site_id: (86, 99, 97)})
+        cached_site_snapshot = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE[0])
+        cached_site_snapshot.update({"actual_kw": samples.TEST_BQ_ACTUAL_KW, "expected_kw": samples.TEST_BQ_EXPECTED_KW})
         cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
-        cache_mock.return_value.get.side_effect = [
-            bq_response_site_actual_response,
-            bq_response_site_cumulative_response,
-        ]
+        # telemetry is cached per site as dashboard snapshot
+        cache_mock.return_value.mget.return_value = [pickle.dumps(cached_site_snapshot)]
         mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
         response = client.get(
             f"{self.COMPANIES_API_ENDPOINT}/{company_id}/sites", headers=company_member_user_auth_header
@@ -291,6 +281,65 @@ class TestOMCompanies:
         assert items[0]["cumulative_7_days_vs_expected"] == 99
         assert items[0]["cumulative_30_days_vs_expected"] == 97
 
+    def test_get_company_sites_telemetry_single_bq_job(
+        self, client, company_id, site_id, company_member_user_auth_header, mocker
+    ):
+        """Test that sites missing in cache are requested from BigQuery with single job and cached back per site."""
+        bq_response_site_snapshot_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
+        bq_response_site_snapshot_response[0].update({"site_id": site_id})
+        cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
+        cache_mock.return_value.mget.return_value = [None]
+        telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
+        telemetry_bq_engine.return_value.execute_query.return_value = bq_response_site_snapshot_response
+
+        response = client.get(
+            f"{self.COMPANIES_API_ENDPOINT}/{company_id}/sites", headers=company_member_user_auth_header
+        )
+        items = response.json()["items"]
+
+        assert items[0]["actual_kw"] == samples.TEST_BQ_ACTUAL_KW
+        assert items[0]["cumulative_vs_expected"] == 86
+        # power, energy and last reported timestamp are retrieved with the single multi-statement BigQuery job
+        telemetry_bq_engine.return_value.execute_query.assert_called_once()
+        query = telemetry_bq_engine.return_value.execute_query.call_args.args[0]
+        assert f"DECLARE snapshot_site_ids ARRAY<INT64> DEFAULT [{site_id}];" in query
+        for function_name in [
+            "site_power_actual_vs_expected",
+            "site_energy_actual_vs_expected_daily",
+            "site_last_report_ts",
+        ]:
+            assert f".{function_name}(" in query
+        # missing site data is cached under its own key
+        cached_key, cached_value = cache_mock.return_value.pipeline.return_value.set.call_args.args
+        assert cached_key.startswith(f"site-dashboard-snapshot-{site_id}-")
+        assert pickle.loads(cached_value) == {
+            key: value for key, value in bq_response_site_snapshot_response[0].items() if key != "site_id"
+        }
+        cache_mock.return_value.pipeline.return_value.execute.assert_called_once()
+
+    def test_get_companies_telemetry_shared_snapshot(
+        self, client, system_user_auth_header, company_id, site_id, sites_placed_in_service, mocker
+    ):
+        """Test that companies list reads the sites power from the per-site snapshot shared with the sites views."""
+        bq_response_site_snapshot_response = deepcopy(samples.SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE)
+        bq_response_site_snapshot_response[0].update({"site_id": site_id})
+        cache_mock = mocker.patch("app.helpers.telemetry.bigquery.base.get_cache")
+        cache_mock.return_value.get.return_value = None
+        cache_mock.return_value.mget.side_effect = lambda keys: [None] * len(keys)
+        telemetry_bq_engine = mocker.patch("app.helpers.telemetry.bigquery.base.BigQueryReadEngine")
+        telemetry_bq_engine.return_value.execute_query.return_value = bq_response_site_snapshot_response
+
+        response = client.get(self.COMPANIES_API_ENDPOINT, headers=system_user_auth_header)
+
+        assert response.status_code == 200
+        queries = [call.args[0] for call in telemetry_bq_engine.return_value.execute_query.call_args_list]
+        assert any("site_last_report_ts" in query for query in queries)
+        assert all(
+            "site_power_actual_vs_expected" not in query for query in queries if "site_last_report_ts" not in query
+        )
+        cached_keys = [call.args[0] for call in cache_mock.return_value.pipeline.return_value.set.call_args_list]
+        assert f"site-dashboard-snapshot-{site_id}-" in " ".join(cached_keys)
+
     def test_get_company_sites_403(self, client, non_system_user_auth_header, company_id):
         """Test that user with no sites access receives forbidden."""
         response = client.get(f"{self.COMPANIES_API_ENDPOINT}/{company_id}/sites", headers=non_system_user_auth_header)
@@ -1,7 +1,14 @@
-from unittest.mock import ANY
+import asyncio
+import json
+import pickle
+
+import httpx
 
 import tests.unit.samples as samples
+from app.helpers.powerbi import PowerBIHandler
+from app.settings import settings
 from app.static import PBI_CONTENT_TYPE_HEADER, PowerBIMessages
+from tests.fixtures.power_bi import mock_pbi_api
 
 
 class TestReports:
@@ -94,9 +101,10 @@ class TestReports:
 
         assert response.status_code == 200
         assert response.json() == samples.POWER_BI_GENERIC_RESPONSE
-        pbi_generic_json_mock_200.request.assert_called_once_with(
-            data=None, json=samples.PBI_EXPORT_REQUEST_BODY, headers=ANY, method="POST", params=None, url=ANY
-        )
+        pbi_generic_json_mock_200.assert_called_once()
+        pbi_request = pbi_generic_json_mock_200.call_args.args[0]
+        assert pbi_request.method == "POST"
+        assert json.loads(pbi_request.content) == samples.PBI_EXPORT_REQUEST_BODY
 
     def test_export_status_success(
         self, client, company_member_user_auth_header, pbi_generic_json_mock_200, pbi_with_cache
@@ -113,3 +121,49 @@ class TestReports:
 
         assert response.status_code == 200
         assert response.headers[PBI_CONTENT_TYPE_HEADER] == "application/pdf"
+
+    def test_export_file_streamed(self, client, company_member_user_auth_header, mocker, pbi_with_cache):
+        """Exported file is read and passed to the client by chunks"""
+        file_content = b"%PDF" * 100_000
+        mock_pbi_api(
+            mocker,
+            httpx.Response(200, content=file_content, headers={PBI_CONTENT_TYPE_HEADER: "application/pdf"}),
+        )
+        response = client.get(self._gen_export_file_endpoint(), headers=company_member_user_auth_header)
+
+        assert response.status_code == 200
+        assert response.content == file_content
+
+        async def read_export_file():
+            content_chunks, _ = await PowerBIHandler().get_export_file("report_id_", "export_id_")
+            return [chunk async for chunk in content_chunks]
+
+        chunks = asyncio.run(read_export_file())
+        assert max(len(chunk) for chunk in chunks) == settings.pbi_export_chunk_size
+        assert b"".join(chunks) == file_content
+
+    def test_export_file_request_error(
+        self, client, company_member_user_auth_header, pbi_token_mock_400, pbi_with_cache
+    ):
+        response = client.get(self._gen_export_file_endpoint(), headers=company_member_user_auth_header)
+
+        assert response.status_code == 400
+        assert response.json()["message"] == PowerBIMessages.service_unavailable.value
+
+    def test_access_token_single_flight(self, mocker):
+        """Concurrent requests with no cached token make a single token request"""
+        cache = {}
+        cache_mock = mocker.patch("app.helpers.powerbi.get_cache")
+        cache_mock.return_value.get.side_effect = cache.get
+        cache_mock.return_value.set.side_effect = lambda key_name, value, ex: cache.update({key_name: value})
+        mocker.patch.object(PowerBIHandler, "_token_lock", asyncio.Lock())
+        pbi_api_mock = mock_pbi_api(mocker, httpx.Response(200, json=samples.POWER_BI_ACCESS_TOKEN_RESPONSE))
+
+        async def generate_access_tokens():
+            return await asyncio.gather(*[PowerBIHandler()._generate_access_token() for _ in range(5)])
+
+        access_tokens = asyncio.run(generate_access_tokens())
+
+        assert access_tokens == [samples.POWER_BI_ACCESS_TOKEN_RESPONSE["access_token"]] * 5
+        pbi_api_mock.assert_called_once()
+        assert pickle.loads(cache["powerbi-token"]) == samples.POWER_BI_ACCESS_TOKEN_RESPONSE["access_token"]
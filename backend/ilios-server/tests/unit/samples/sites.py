@@ -619,12 +619,19 @@ SITE_DETAILS_UPDATE_INVALID_SECTION_NAME_ERROR = (
     "vegetation_vendor, offtaker, compliance"
 )
 
-SITE_DASHBOARD_BIGQUERY_RESPONSE = [
+SITE_DASHBOARD_SNAPSHOT_BIGQUERY_RESPONSE = [
     {
-        "company_id": 8,
         "site_id": 268,
-        "site_power_actual": [{"value": 10.341, "ts": datetime.datetime(2024, 12, 9, 13, 15)}],
-        "site_power_expected": [{"value": 7.551, "ts": datetime.datetime(2024, 12, 9, 13, 15)}],
+        "power_reported": True,
+        "actual_kw": 10.341,
+        "expected_kw": 7.551,
+        "site_energy_actual_today": 120,
+        "site_energy_expected_today": 140,
+        "site_energy_actual_last_7_days": 1123,
+        "site_energy_expected_last_7_days": 1137,
+        "site_energy_actual_last_30_days": 6789,
+        "site_energy_expected_last_30_days": 7000,
+        "site_last_report_ts": datetime.datetime(2024, 12, 9, 13, 15),
     }
 ]
 
@@ -787,17 +794,6 @@ SITE_ACTUAL_VS_EXPECTED_RESPONSE = [
     {"period": "2025-01-12T23:00:00", "actual": 0, "expected": 0, "irradiance": 0},
 ]
 
-TELEMETRY_SITE_CUMULATIVE_ENERGY_RESPONSE = [
-    {
-        "site_energy_actual_today": 120,
-        "site_energy_expected_today": 140,
-        "site_energy_actual_last_7_days": 1123,
-        "site_energy_expected_last_7_days": 1137,
-        "site_energy_actual_last_30_days": 6789,
-        "site_energy_expected_last_30_days": 7000,
-    }
-]
-
 SITE_TODAY_CUMULATIVE_BQ_RESPONSE = [
     {
         "company_energy_actual_today": 4,
@@ -46,11 +46,10 @@ class TestDASConnection:
         get_document_mock = fs_document_mock.return_value.get
         fs_document_mock.return_value.get.return_value.to_dict = MagicMock(return_value=None)
 
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = response_200
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = response_200
         mock_requests = mocker.patch("app.helpers.telemetry.secrets_manager.SecretManagerServiceClient")
         mock_requests.return_value.create_secret.return_value = MagicMock(name="telemetry-secret")
         response = client.post(
@@ -80,11 +79,10 @@ class TestDASConnection:
         set_document_mock = fs_document_mock.return_value.set
         get_document_mock = fs_document_mock.return_value.get
 
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = response_200
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = response_200
         mock_requests = mocker.patch("app.helpers.telemetry.secrets_manager.SecretManagerServiceClient")
         mock_requests.return_value.create_secret.return_value = MagicMock(name="telemetry-secret")
         response = client.post(
@@ -127,11 +125,10 @@ class TestDASConnection:
         response_400,
     ):
         """Test create new DAS connection with invalid token value."""
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = response_400
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = response_400
         mock_requests = mocker.patch("app.helpers.telemetry.secrets_manager.SecretManagerServiceClient")
         mock_requests.return_value.create_secret.return_value = MagicMock(name="telemetry-secret")
         response = client.post(
@@ -236,14 +233,13 @@ class TestDASConnection:
         payload,
     ):
         """Test update company connection credentials success."""
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
         mock_requests = mocker.patch(
             "app.helpers.telemetry.secrets_manager.SecretManagerServiceClient.add_secret_version"
         )
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = response_200
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = response_200
         response = client.put(
             self._generate_connection_endpoint(company_id, das_connection.id),
             headers=company_member_user_auth_header,
@@ -259,12 +255,11 @@ class TestDASConnection:
         self, client, company_member_user_auth_header, company_id, das_connection, mocker, response_400
     ):
         """Test update company connection token with invalid token value."""
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         mocker.patch("app.helpers.cloud_function_client.service_account")
         mocker.patch("app.helpers.telemetry.secrets_manager.SecretManagerServiceClient.add_secret_version")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = response_400
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = response_400
         response = client.put(
             self._generate_connection_endpoint(company_id, das_connection.id),
             headers=company_member_user_auth_header,
@@ -399,10 +394,9 @@ class TestDASConnection:
         """Test get connection sites list from telemetry."""
         external_site_id = "8nfavWSrpi"
         external_site_name = "Pequawket Trail Baldwin"
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = create_response(
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(
             200, [{"id": external_site_id, "name": external_site_name}]
         )
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
@@ -547,10 +541,9 @@ class TestDASConnection:
         mocker,
     ):
         """Test get connection sites list return user-friendly error if telemetry call fails"""
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = create_response(401, {})
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(401, {})
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
         response = client.get(
             self._generate_connection_sites_endpoint(company_id, das_connection.id),
@@ -173,6 +173,25 @@ class TestAttachments:
         assert response.status_code == 200
         assert response.json()["download_url"] == download_url
 
+    def test_get_download_url_cached(
+        self, site_default_board_id, site_task_id, mocker, client, attachment, system_user_auth_header
+    ):
+        """Test that the storage client is built once and the signed URL is reused by the following requests"""
+        download_url = "https://storage.googleapis.com/"
+        mocker.patch("app.helpers.files.file_handler.service_account")
+        mock_storage = mocker.patch("app.helpers.files.file_handler.storage.Client")
+        mock_blob = mock_storage.return_value.bucket.return_value.blob.return_value
+        mock_blob.generate_signed_url.return_value = download_url
+        for _ in range(3):
+            response = client.get(
+                self._generate_attachment_endpoint(site_default_board_id, site_task_id, attachment.id),
+                headers=system_user_auth_header,
+            )
+            assert response.status_code == 200
+            assert response.json()["download_url"] == download_url
+        mock_storage.assert_called_once()
+        mock_blob.generate_signed_url.assert_called_once()
+
     def test_get_download_url_404(self, site_default_board_id, site_task_id, client, system_user_auth_header):
         response = client.get(
             self._generate_attachment_endpoint(site_default_board_id, site_task_id, 1234),
@@ -1,4 +1,5 @@
 from app.crud.telemetry_mapping import TelemetrySiteMappingCRUD
+from app.helpers.telemetry.telemetry_cloud_function_client import TelemetryFuncHTTPClient
 from app.static import TelemetryMessages
 from tests.utils import create_response
 
@@ -147,10 +148,9 @@ class TestTelemetry:
         """Test get site devices list from telemetry."""
         external_device_id = "8nfavWSrpi"
         external_device_name = "Pequawket Trail Baldwin"
-        mocker.patch("app.helpers.cloud_function_client.google.oauth2.id_token")
         mocker.patch("app.helpers.cloud_function_client.service_account")
-        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests")
-        mock_telemetry_requests.post.return_value = create_response(
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(
             200, [{"id": external_device_id, "name": external_device_name}]
         )
         mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
@@ -165,6 +165,47 @@ class TestTelemetry:
         assert telemetry_device["name"] == external_device_name
         assert telemetry_device["id"] == external_device_id
 
+    def test_get_telemetry_site_devices_session_reused(
+        self,
+        client,
+        company_member_user_auth_header,
+        site_id,
+        telemetry_site_mapping,
+        mocker,
+    ):
+        """Test that the session and the ID token are reused by the following telemetry calls."""
+        mock_service_account = mocker.patch("app.helpers.cloud_function_client.service_account")
+        mock_id_token_credentials = mock_service_account.IDTokenCredentials.from_service_account_file
+        mock_id_token_credentials.return_value.valid = False
+        mock_id_token_credentials.return_value.refresh.side_effect = lambda request: setattr(
+            mock_id_token_credentials.return_value, "valid", True
+        )
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(200, [])
+        mocker.patch("app.helpers.telemetry.secrets_manager.service_account")
+        for _ in range(2):
+            response = client.get(
+                self._generate_sites_devices_endpoint(site_id),
+                headers=company_member_user_auth_header,
+            )
+            assert response.status_code == 200
+
+        assert mock_telemetry_requests.return_value.post.call_count == 2
+        mock_id_token_credentials.assert_called_once()
+        mock_id_token_credentials.return_value.refresh.assert_called_once()
+
+    def test_dispatch_telemetry_call(self, mocker):
+        """Test that the dispatched call is sent in the background to the URL set on dispatch."""
+        mocker.patch("app.helpers.cloud_function_client.service_account")
+        mock_telemetry_requests = mocker.patch("app.helpers.cloud_function_client.requests.Session")
+        mock_telemetry_requests.return_value.post.return_value = create_response(200, {})
+        telemetry_client = TelemetryFuncHTTPClient(func_url="http://telemetry")
+        future = telemetry_client.dispatch(payload={"site_id": 1}, use_token=True)
+        telemetry_client.func_url = "http://other-telemetry"
+
+        assert future.result().status_code == 200
+        assert mock_telemetry_requests.return_value.post.call_args.args == ("http://telemetry",)
+
     def test_get_telemetry_site_devices_no__das_connection(
         self,
         client,
@@ -53,15 +53,6 @@ def create_response(status_code, content_dict):
     return response
 
 
-def create_file_response(status_code, content_bytes, headers=None):
-    response = Response()
-    response.status_code = status_code
-    response._content = content_bytes
-    if headers:
-        response.headers = headers
-    return response
-
-
 def get_document_by_name(documents, document_name):
     """Return document by specified name"""
     return [document for document in documents if document.name == document_name][0]
@@ -14,6 +14,7 @@ from .timer import Timer
 logger = cloud_logging.get_logger(__name__)
 
 SchemaField = bigquery.SchemaField  # export
+ArrayQueryParameter = bigquery.ArrayQueryParameter  # export
 
 
 class Engine:
@@ -23,12 +24,19 @@ class Engine:
     def __init__(self) -> None:
         self._client = bigquery.Client(project=PROJECT_ID)
 
-    def execute_query(self, query: str) -> Iterator[dict[str, Any]]:
+    def execute_query(
+        self,
+        query: str,
+        query_parameters: list[ArrayQueryParameter] | None = None,
+        **context: Any,
+    ) -> Iterator[dict[str, Any]]:
         query = textwrap.dedent(query).strip()
 
-        query_job = self._client.query(query, job_id_prefix=self.QUERY_JOB_ID_PREFIX)
+        query_job_config = bigquery.QueryJobConfig(query_parameters=query_parameters or [])
 
-        sub_logger = logger.bind(job_id=query_job.job_id)
+        query_job = self._client.query(query, job_config=query_job_config, job_id_prefix=self.QUERY_JOB_ID_PREFIX)
+
+        sub_logger = logger.bind(job_id=query_job.job_id, **context)
 
         sub_logger.info("Executing query in BigQuery", query=query)
 
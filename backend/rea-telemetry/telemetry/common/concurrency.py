@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class RateLimiter:
+
+    def __init__(self, max_calls_per_second: float) -> None:
+        assert max_calls_per_second > 0
+
+        self._interval_s = 1 / max_calls_per_second
+        self._next_call_time_s = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now_s = time.monotonic()
+            call_time_s = max(now_s, self._next_call_time_s)
+            self._next_call_time_s = call_time_s + self._interval_s
+
+        if (delay_s := call_time_s - now_s) > 0:
+            time.sleep(delay_s)
+
+
+def map_ordered[T, R](function: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """
+    Apply the function to the items concurrently, yielding results in the order of the items.
+
+    Only `max_workers` calls are submitted ahead of the consumer, so memory stays bounded for long inputs.
+    Pending calls are cancelled if the consumer stops early or a call fails.
+    """
+    assert max_workers > 0
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    futures: deque[Future[R]] = deque()
+
+    try:
+        for item in items:
+            if len(futures) > max_workers:
+                yield futures.popleft().result()
+
+            futures.append(executor.submit(function, item))
+
+        while futures:
+            yield futures.popleft().result()
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -11,6 +11,11 @@ DATA_PROVIDER_API_URLS = {
     DataProvider.KMC: "https://app.kmccommander.com",
 }
 
+DATA_PROVIDER_MAX_REQUESTS_PER_SECOND = {
+    DataProvider.ALSO_ENERGY: 10,
+    DataProvider.KMC: 10,
+}
+
 DATA_PROVIDER_POINT_TAG_MAPS = {
     DataProvider.ALSO_ENERGY: {
         PointTag.DEVICE_POWER_AC: "KwAC:Active_Power",
@@ -41,6 +46,11 @@ INGEST_TELEMETRY_DATA_TOPIC_NAME = os.getenv("INGEST_TELEMETRY_DATA_TOPIC_NAME",
 FETCH_TELEMETRY_DATA_TOPIC_ID = f"projects/{PROJECT_ID}/topics/{FETCH_TELEMETRY_DATA_TOPIC_NAME}"
 INGEST_TELEMETRY_DATA_TOPIC_ID = f"projects/{PROJECT_ID}/topics/{INGEST_TELEMETRY_DATA_TOPIC_NAME}"
 
+# payloads packed per Pub/Sub message for the ingest topic, 0 publishes one message per payload
+MAX_PAYLOADS_PER_ENVELOPE = int(os.getenv("MAX_PAYLOADS_PER_ENVELOPE", default="0"))
+# envelopes pack many payloads per Pub/Sub message as gzip-compressed NDJSON, one payload per line
+ENVELOPE_ENCODING = "ndjson+gzip"
+
 PLATFORM_API_URLS = {
     PlatformEnvironment.UAT: "https://backend-dot-prj-uat-base-70ab.uc.r.appspot.com",
     PlatformEnvironment.QA: "https://backend-dot-prj-qa-base-23d1.uc.r.appspot.com",
@@ -51,9 +61,22 @@ PLATFORM_API_KEY_SECRET_NAME = "{environment}-platform-api-key"
 
 MAX_HISTORY_DEPTH_YEARS = 3
 MAX_FETCH_INTERVAL_DAYS = 31
+# concurrent point interval requests per device, can be tuned per data provider, e.g. KMC_MAX_CONCURRENT_FETCH_REQUESTS
+MAX_CONCURRENT_FETCH_REQUESTS = int(os.getenv("MAX_CONCURRENT_FETCH_REQUESTS", default="4"))
+DATA_PROVIDER_MAX_CONCURRENT_FETCH_REQUESTS = {
+    data_provider: int(
+        os.getenv(f"{data_provider.upper()}_MAX_CONCURRENT_FETCH_REQUESTS", default=str(MAX_CONCURRENT_FETCH_REQUESTS))
+    )
+    for data_provider in DataProvider
+}
+MAX_ALERTS_PER_REQUEST = 500
+
+MAX_CONCURRENT_QUERIES = int(os.getenv("MAX_CONCURRENT_QUERIES", default="4"))
 
 MAX_RETRIES_PER_REQUEST = 4
 TIMEOUT_PER_REQUEST = 15
 
+REQUEST_POOL_MAXSIZE = int(os.getenv("REQUEST_POOL_MAXSIZE", default="32"))
+
 LOCK_CACHE_TTL = 2.5 * 60
 TOKEN_CACHE_TTL = 10 * 60
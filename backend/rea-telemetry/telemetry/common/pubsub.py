@@ -1,3 +1,5 @@
+import zlib
+from collections.abc import Sequence
 from concurrent import futures
 from typing import Any, Final
 
@@ -5,6 +7,7 @@ import orjson
 from google.cloud import pubsub
 
 from . import cloud_logging
+from .constants import ENVELOPE_ENCODING
 from .thread_local import ThreadLocalProxy
 
 logger = cloud_logging.get_logger(__name__)
@@ -14,6 +17,7 @@ class Publisher:
     MAX_BYTES: Final[int] = 1_000_000  # 1 MB
     MAX_LATENCY: Final[float] = 0.1  # 100 ms
     MAX_MESSAGES: Final[int] = 1_000
+    MAX_ENVELOPE_BYTES: Final[int] = 9_000_000  # 9 MB, below the 10 MB message limit (incl. attributes)
 
     def __init__(self) -> None:
         batch_settings = pubsub.types.BatchSettings(
@@ -37,6 +41,55 @@ class Publisher:
 
         return future
 
+    def publish_envelopes(self, topic_id: str, payloads: Sequence[Any], **attrs: str) -> list[futures.Future[str]]:
+        """
+        Publish many payloads as envelopes: gzip-compressed NDJSON, one payload per line.
+        Payloads are split into as many envelopes as needed to keep each of them within `MAX_ENVELOPE_BYTES`.
+        The `encoding` and `count` attributes let subscribers tell envelopes apart from single payload messages.
+        """
+        envelopes_futures = []
+
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # gzip container
+        chunks: list[bytes] = []
+        compressed_size = 0  # exact, as of the last check
+        uncompressed_size = 0  # since the last check, the upper bound of its compressed size
+        count = 0
+
+        for payload in payloads:
+            line = orjson.dumps(payload) + b"\n"
+
+            # the exact compressed size is checked only when the upper bound estimate may exceed the limit
+            if count > 0 and compressed_size + uncompressed_size + len(line) > self.MAX_ENVELOPE_BYTES:
+                compressed_size = sum(map(len, chunks)) + len(compressor.copy().flush())
+                uncompressed_size = 0
+
+                if compressed_size + len(line) > self.MAX_ENVELOPE_BYTES:
+                    chunks.append(compressor.flush())
+                    envelopes_futures.append(self._publish_envelope(topic_id, b"".join(chunks), count, **attrs))
+
+                    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+                    chunks, compressed_size, count = [], 0, 0
+
+            chunks.append(compressor.compress(line))
+            uncompressed_size += len(line)
+            count += 1
+
+        if count > 0:
+            chunks.append(compressor.flush())
+            envelopes_futures.append(self._publish_envelope(topic_id, b"".join(chunks), count, **attrs))
+
+        return envelopes_futures
+
+    def _publish_envelope(self, topic_id: str, data: bytes, count: int, **attrs: str) -> futures.Future[str]:
+        future = self._client.publish(topic_id, data, encoding=ENVELOPE_ENCODING, count=str(count), **attrs)
+        self._futures.add(future)
+
+        if len(self._futures) == self.MAX_MESSAGES:
+            self.wait_until_published()
+            assert len(self._futures) == 0
+
+        return future
+
     def wait_until_published(self) -> None:
         for future in futures.as_completed(self._futures):
             try:
@@ -1,14 +1,81 @@
+import bisect
+import threading
 import uuid
+from collections import defaultdict
 from http import HTTPStatus
-from typing import Any, Literal
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Final, Literal
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from . import cloud_logging
+from .constants import REQUEST_POOL_MAXSIZE
 from .timer import Timer
 
 logger = cloud_logging.get_logger(__name__)
 
+LATENCY_BUCKETS_S: Final[tuple[float, ...]] = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class SessionPool:
+    """
+    Keep-alive sessions shared by all threads, one per host (i.e. per data provider or platform environment),
+    so consecutive requests to the same API reuse open connections instead of paying TCP+TLS handshake each time.
+    Cookies are never persisted, as the same session serves requests made on behalf of different tokens.
+    """
+
+    def __init__(self, pool_maxsize: int) -> None:
+        self._pool_maxsize = pool_maxsize
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+
+            if session is None:
+                session = self._sessions[host] = self._create_session()
+
+            return session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+
+class LatencyHistograms:
+    """Per-host histograms of request durations, exported to the structured logs by `log_latency_histograms`."""
+
+    def __init__(self, buckets_s: tuple[float, ...]) -> None:
+        self._buckets_s = buckets_s
+        self._counts: dict[str, list[int]] = defaultdict(lambda: [0] * (len(buckets_s) + 1))
+        self._lock = threading.Lock()
+
+    def observe(self, host: str, duration_s: float) -> None:
+        with self._lock:
+            self._counts[host][bisect.bisect_left(self._buckets_s, duration_s)] += 1
+
+    def pop(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            counts, self._counts = self._counts, defaultdict(lambda: [0] * (len(self._buckets_s) + 1))
+
+        labels = [f"le_{bucket_s}" for bucket_s in self._buckets_s] + ["le_inf"]
+
+        return {host: dict(zip(labels, host_counts)) for host, host_counts in counts.items()}
+
+
+sessions = SessionPool(REQUEST_POOL_MAXSIZE)
+
+latency_histograms = LatencyHistograms(LATENCY_BUCKETS_S)
+
 
 def request(
     method: Literal["GET", "POST", "PATCH"],
@@ -18,18 +85,22 @@ def request(
 ) -> requests.Response:
     request_id = str(uuid.uuid4())
 
-    sub_logger = logger.bind(request_id=request_id)
+    host = urlsplit(url).netloc
+
+    sub_logger = logger.bind(request_id=request_id, host=host)
 
     sub_logger.info("Sending request to API", method=method, url=url, context=context)
 
     with Timer() as timer:
-        response = requests.request(method, url, **kwargs)
+        response = sessions.get(host).request(method, url, **kwargs)
 
     status_code = response.status_code
     reason_phrase = HTTPStatus(status_code).phrase
 
     duration = timer.elapsed_ms / 1_000
 
+    latency_histograms.observe(host, duration)
+
     sub_logger.info(
         "Received response from API",
         status_code=status_code,
@@ -50,3 +121,9 @@ def post(url: str, context: dict[str, Any] | None = None, **kwargs: Any) -> requ
 
 def patch(url: str, context: dict[str, Any] | None = None, **kwargs: Any) -> requests.Response:
     return request("PATCH", url, context=context, **kwargs)
+
+
+def log_latency_histograms() -> None:
+    """Log (and reset) the request duration histograms per host collected since the previous call."""
+    if histograms := latency_histograms.pop():
+        logger.info("Request latency histograms", histograms=histograms, buckets=LATENCY_BUCKETS_S)
@@ -8,14 +8,17 @@ import requests
 
 from ...common import cloud_logging, request
 from ...common.caching import cache_token
+from ...common.concurrency import RateLimiter, map_ordered
 from ...common.constants import (
     DATA_PROVIDER_API_URLS,
+    DATA_PROVIDER_MAX_CONCURRENT_FETCH_REQUESTS,
+    DATA_PROVIDER_MAX_REQUESTS_PER_SECOND,
     DATA_PROVIDER_POINT_TAG_MAPS,
     MAX_RETRIES_PER_REQUEST,
     TIMEOUT_PER_REQUEST,
 )
 from ...common.entities import TelemetryAlertPayload, TelemetryPointPayload
-from ...common.enums import DataProvider
+from ...common.enums import DataProvider, PointTag
 from ...common.exceptions import DataUnavailableError, DeviceNotFoundError, SiteNotFoundError, TokenUnauthorizedError
 from ...common.retrying import retry_on_exception
 from ...common.validation import validate_response_status
@@ -26,6 +29,9 @@ logger = cloud_logging.get_logger(__name__)
 API_URL = DATA_PROVIDER_API_URLS[DataProvider.ALSO_ENERGY]
 POINT_TAG_MAP = DATA_PROVIDER_POINT_TAG_MAPS[DataProvider.ALSO_ENERGY]  # internal -> external
 
+RATE_LIMITER = RateLimiter(DATA_PROVIDER_MAX_REQUESTS_PER_SECOND[DataProvider.ALSO_ENERGY])
+MAX_CONCURRENT_FETCH_REQUESTS = DATA_PROVIDER_MAX_CONCURRENT_FETCH_REQUESTS[DataProvider.ALSO_ENERGY]
+
 
 def fetch_telemetry_points(token: str, site_id: str, device_id: str) -> Iterator[TelemetryPointPayload]:
     token = _get_access_token(token)
@@ -35,7 +41,9 @@ def fetch_telemetry_points(token: str, site_id: str, device_id: str) -> Iterator
     with cache.next_fetch_telemetry_points_intervals_map(DataProvider.ALSO_ENERGY, site_id, device_id) as intervals_map:
         point_count = 0
 
-        for point_tag, intervals in intervals_map.items():
+        point_names = {}
+
+        for point_tag in intervals_map.keys():
             point_name_map = dict(point_name_item.split(":") for point_name_item in POINT_TAG_MAP[point_tag].split(","))
 
             point_name_subset = point_name_set & point_name_map.keys()
@@ -48,42 +56,67 @@ def fetch_telemetry_points(token: str, site_id: str, device_id: str) -> Iterator
                 continue
 
             point_name_legacy = next(iter(point_name_subset))
-            point_name_standard = point_name_map[point_name_legacy]
+            point_names[point_tag] = (point_name_legacy, point_name_map[point_name_legacy])
+
+        fetch_steps = [
+            (point_tag, start_ts, end_ts)
+            for point_tag, intervals in intervals_map.items()
+            if point_tag in point_names
+            for start_ts, end_ts in intervals
+        ]
+
+        def fetch_point_data(fetch_step: tuple[PointTag, datetime, datetime]) -> tuple[datetime, requests.Response]:
+            point_tag, start_ts, end_ts = fetch_step
+
+            _, point_name_standard = point_names[point_tag]
 
-            for start_ts, end_ts in intervals:
-                fetch_ts = datetime.now(tz=timezone.utc)
+            fetch_ts = datetime.now(tz=timezone.utc)
+
+            return fetch_ts, _get_point_data_request(token, device_id, point_name_standard, start_ts, end_ts)
+
+        stopped_point_tags = set()
+
+        # intervals are fetched concurrently, but processed in the original (timestamp) order
+        for (point_tag, _, _), (fetch_ts, response) in zip(
+            fetch_steps,
+            map_ordered(fetch_point_data, fetch_steps, max_workers=MAX_CONCURRENT_FETCH_REQUESTS),
+        ):
+            if point_tag in stopped_point_tags:
+                continue
 
-                response = _get_point_data_request(token, device_id, point_name_standard, start_ts, end_ts)
+            if response.status_code == HTTPStatus.BAD_REQUEST:
+                stopped_point_tags.add(point_tag)
+                continue
 
-                if response.status_code == HTTPStatus.BAD_REQUEST:
-                    break
+            if response.status_code == HTTPStatus.NO_CONTENT:
+                continue
 
-                if response.status_code == HTTPStatus.NO_CONTENT:
-                    continue
+            payload = orjson.loads(response.content)
 
-                payload = orjson.loads(response.content)
+            assert len(payload["info"]) == 1
 
-                assert len(payload["info"]) == 1
+            point_name_legacy, _ = point_names[point_tag]
 
-                if payload["info"][0]["name"] != point_name_legacy:  # mismatch
-                    break
+            if payload["info"][0]["name"] != point_name_legacy:  # mismatch
+                stopped_point_tags.add(point_tag)
+                continue
 
-                for point_data_item in payload["items"]:
-                    assert len(point_data_item["data"]) == 1
+            for point_data_item in payload["items"]:
+                assert len(point_data_item["data"]) == 1
 
-                    point_data_value = round(value if (value := point_data_item["data"][0]) != "NaN" else 0.0, 9)
-                    point_data_ts = datetime.fromisoformat(point_data_item["timestamp"]).astimezone(tz=timezone.utc)
+                point_data_value = round(value if (value := point_data_item["data"][0]) != "NaN" else 0.0, 9)
+                point_data_ts = datetime.fromisoformat(point_data_item["timestamp"]).astimezone(tz=timezone.utc)
 
-                    yield TelemetryPointPayload(
-                        data_provider=DataProvider.ALSO_ENERGY,
-                        site_id=site_id,
-                        device_id=device_id,
-                        point_tag=point_tag,
-                        point_data_value=point_data_value,
-                        point_data_ts=point_data_ts,
-                        fetch_ts=fetch_ts,
-                    )
-                    point_count += 1
+                yield TelemetryPointPayload(
+                    data_provider=DataProvider.ALSO_ENERGY,
+                    site_id=site_id,
+                    device_id=device_id,
+                    point_tag=point_tag,
+                    point_data_value=point_data_value,
+                    point_data_ts=point_data_ts,
+                    fetch_ts=fetch_ts,
+                )
+                point_count += 1
 
         if point_count == 0:
             # The device may be offline. Raise an exception to avoid updating the cache. This allows future pipeline
@@ -202,6 +235,8 @@ def _get_point_data_request(
     start_ts: datetime,
     end_ts: datetime,
 ) -> requests.Response:
+    RATE_LIMITER.acquire()
+
     response = request.post(
         f"{API_URL}/v2/Data/BinData",
         context={
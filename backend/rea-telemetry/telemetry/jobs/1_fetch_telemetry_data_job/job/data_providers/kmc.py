@@ -2,19 +2,23 @@ import itertools
 from collections.abc import Iterator
 from datetime import datetime, timezone
 from http import HTTPStatus
+from typing import Any
 
 import orjson
 import requests
 
 from ...common import cloud_logging, request
+from ...common.concurrency import RateLimiter, map_ordered
 from ...common.constants import (
     DATA_PROVIDER_API_URLS,
+    DATA_PROVIDER_MAX_CONCURRENT_FETCH_REQUESTS,
+    DATA_PROVIDER_MAX_REQUESTS_PER_SECOND,
     DATA_PROVIDER_POINT_TAG_MAPS,
     MAX_RETRIES_PER_REQUEST,
     TIMEOUT_PER_REQUEST,
 )
 from ...common.entities import TelemetryAlertPayload, TelemetryPointPayload
-from ...common.enums import DataProvider
+from ...common.enums import DataProvider, PointTag
 from ...common.exceptions import DataUnavailableError, DeviceNotFoundError, SiteNotFoundError, TokenUnauthorizedError
 from ...common.retrying import retry_on_exception
 from ...common.validation import validate_response_status
@@ -25,6 +29,9 @@ logger = cloud_logging.get_logger(__name__)
 API_URL = DATA_PROVIDER_API_URLS[DataProvider.KMC]
 POINT_TAG_MAP = DATA_PROVIDER_POINT_TAG_MAPS[DataProvider.KMC]  # internal -> external
 
+RATE_LIMITER = RateLimiter(DATA_PROVIDER_MAX_REQUESTS_PER_SECOND[DataProvider.KMC])
+MAX_CONCURRENT_FETCH_REQUESTS = DATA_PROVIDER_MAX_CONCURRENT_FETCH_REQUESTS[DataProvider.KMC]
+
 
 def fetch_telemetry_points(token: str, site_id: str, device_id: str) -> Iterator[TelemetryPointPayload]:
     token = _get_site_token(token, site_id)
@@ -34,7 +41,9 @@ def fetch_telemetry_points(token: str, site_id: str, device_id: str) -> Iterator
     with cache.next_fetch_telemetry_points_intervals_map(DataProvider.KMC, site_id, device_id) as intervals_map:
         point_count = 0
 
-        for point_tag, intervals in intervals_map.items():
+        point_items = {}
+
+        for point_tag in intervals_map.keys():
             response = _get_points_request(token, device_id, POINT_TAG_MAP[point_tag])
 
             payload = orjson.loads(response.content)
@@ -46,31 +55,45 @@ def fetch_telemetry_points(token: str, site_id: str, device_id: str) -> Iterator
                 logger.warning("Discarding ambiguous device point", device_id=device_id, point_tag=point_tag)
                 continue
 
-            point_item = next(map(lambda item: item["tags"], payload["results"]))
-
-            for start_ts, end_ts in intervals:
-                fetch_ts = datetime.now(tz=timezone.utc)
-
-                response = _get_point_data_request(token, point_item["id"], start_ts, end_ts)
-
-                payload = orjson.loads(response.content)
-
-                for point_data_item in itertools.chain.from_iterable(
-                    map(lambda item: item["trendData"], payload["results"])
-                ):
-                    point_data_value = _convert_value_to_standard_unit(point_data_item["val"], point_item["unit"])
-                    point_data_ts = datetime.fromtimestamp(point_data_item["ts"] / 1_000, tz=timezone.utc)
-
-                    yield TelemetryPointPayload(
-                        data_provider=DataProvider.KMC,
-                        site_id=site_id,
-                        device_id=device_id,
-                        point_tag=point_tag,
-                        point_data_value=point_data_value,
-                        point_data_ts=point_data_ts,
-                        fetch_ts=fetch_ts,
-                    )
-                    point_count += 1
+            point_items[point_tag] = next(map(lambda item: item["tags"], payload["results"]))
+
+        fetch_steps = [
+            (point_tag, point_items[point_tag], start_ts, end_ts)
+            for point_tag, intervals in intervals_map.items()
+            if point_tag in point_items
+            for start_ts, end_ts in intervals
+        ]
+
+        def fetch_point_data(fetch_step: tuple[PointTag, dict[str, Any], datetime, datetime]) -> tuple[datetime, Any]:
+            _, point_item, start_ts, end_ts = fetch_step
+
+            fetch_ts = datetime.now(tz=timezone.utc)
+
+            response = _get_point_data_request(token, point_item["id"], start_ts, end_ts)
+
+            return fetch_ts, orjson.loads(response.content)
+
+        # intervals are fetched concurrently, but processed in the original (timestamp) order
+        for (point_tag, point_item, _, _), (fetch_ts, payload) in zip(
+            fetch_steps,
+            map_ordered(fetch_point_data, fetch_steps, max_workers=MAX_CONCURRENT_FETCH_REQUESTS),
+        ):
+            for point_data_item in itertools.chain.from_iterable(
+                map(lambda item: item["trendData"], payload["results"])
+            ):
+                point_data_value = _convert_value_to_standard_unit(point_data_item["val"], point_item["unit"])
+                point_data_ts = datetime.fromtimestamp(point_data_item["ts"] / 1_000, tz=timezone.utc)
+
+                yield TelemetryPointPayload(
+                    data_provider=DataProvider.KMC,
+                    site_id=site_id,
+                    device_id=device_id,
+                    point_tag=point_tag,
+                    point_data_value=point_data_value,
+                    point_data_ts=point_data_ts,
+                    fetch_ts=fetch_ts,
+                )
+                point_count += 1
 
         if point_count == 0:
             # The device may be offline. Raise an exception to avoid updating the cache. This allows future pipeline
@@ -195,6 +218,8 @@ def _get_points_request(token: str, device_id: str, point_tag: str) -> requests.
 
 @retry_on_exception(requests.RequestException, max_retries=MAX_RETRIES_PER_REQUEST)
 def _get_point_data_request(token: str, point_id: str, start_ts: datetime, end_ts: datetime) -> requests.Response:
+    RATE_LIMITER.acquire()
+
     response = request.post(
         f"{API_URL}/api/points/{point_id}/trends",
         context={
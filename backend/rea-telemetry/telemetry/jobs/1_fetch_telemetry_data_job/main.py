@@ -1,3 +1,5 @@
+import itertools
+
 import functions_framework
 import orjson
 from flask import Request, Response
@@ -5,10 +7,11 @@ from pydantic import ValidationError
 
 from . import job
 from .common import cloud_logging, pubsub, response
-from .common.constants import INGEST_TELEMETRY_DATA_TOPIC_ID
+from .common.constants import INGEST_TELEMETRY_DATA_TOPIC_ID, MAX_PAYLOADS_PER_ENVELOPE
 from .common.enums import TelemetryCategory
 from .common.exceptions import DataUnavailableError, DeviceNotFoundError, SiteNotFoundError, TokenUnauthorizedError
 from .common.params import FetchTelemetryDataJobRequestParams, PlatformParams
+from .common.request import log_latency_histograms
 from .common.thread_local import ThreadLocal
 from .common.timer import Timer
 
@@ -38,6 +41,7 @@ def fetch_telemetry_data_job(request: Request) -> Response:
     topic_id = INGEST_TELEMETRY_DATA_TOPIC_ID
 
     counts = {}
+    messages_counts = {}
 
     for category, fetch_telemetry_data_job in FETCH_TELEMETRY_DATA_JOBS.items():
         sub_logger = logger.bind(category=category, params=params_data)
@@ -45,11 +49,21 @@ def fetch_telemetry_data_job(request: Request) -> Response:
         sub_logger.info("Fetching %s from external API", category)
 
         counts[category] = 0
+        messages_counts[category] = 0
 
         with Timer() as timer:
-            for payload in fetch_telemetry_data_job(params):
-                pubsub.publisher.publish(topic_id, payload, category=category)
-                counts[category] += 1
+            payloads = fetch_telemetry_data_job(params)
+
+            if MAX_PAYLOADS_PER_ENVELOPE > 0:
+                for payloads_batch in itertools.batched(payloads, MAX_PAYLOADS_PER_ENVELOPE):
+                    envelopes_futures = pubsub.publisher.publish_envelopes(topic_id, payloads_batch, category=category)
+                    counts[category] += len(payloads_batch)
+                    messages_counts[category] += len(envelopes_futures)
+            else:
+                for payload in payloads:
+                    pubsub.publisher.publish(topic_id, payload, category=category)
+                    counts[category] += 1
+                    messages_counts[category] += 1
 
         count = counts[category]
 
@@ -59,7 +73,9 @@ def fetch_telemetry_data_job(request: Request) -> Response:
 
     pubsub.publisher.wait_until_published()
 
-    logger.info("Published messages to Pub/Sub", topic_id=topic_id, counts=counts)
+    logger.info("Published messages to Pub/Sub", topic_id=topic_id, counts=counts, messages_counts=messages_counts)
+
+    log_latency_histograms()
 
     return response.ok()
 
@@ -1,3 +1,4 @@
+import gzip
 import re
 from argparse import ArgumentParser, ArgumentTypeError
 from collections.abc import Callable, Iterable
@@ -9,6 +10,7 @@ import apache_beam as beam
 import orjson
 from apache_beam.io.gcp.bigquery_tools import RetryStrategy
 from apache_beam.options.pipeline_options import PipelineOptions, SetupOptions, StandardOptions
+from common.constants import ENVELOPE_ENCODING
 from google.cloud import bigquery
 
 
@@ -53,10 +55,19 @@ class TransformMessageToRecordsDoFn(beam.DoFn):
 
     def process(self, element: beam.io.PubsubMessage, record_categories: frozenset[str]) -> Iterable[Record]:  # noqa
         if (record_category := element.attributes.get("category")) in record_categories:
-            record: Record = orjson.loads(element.data)
-            record["ingest_ts"] = datetime.now(tz=timezone.utc).isoformat()
-            record["__category__"] = record_category  # interim
-            yield record
+            ingest_ts = datetime.now(tz=timezone.utc).isoformat()
+
+            # envelopes pack many records per message as gzip-compressed NDJSON, one record per line
+            if element.attributes.get("encoding") == ENVELOPE_ENCODING:
+                records_data = gzip.decompress(element.data).splitlines()
+            else:
+                records_data = [element.data]
+
+            for record_data in records_data:
+                record: Record = orjson.loads(record_data)
+                record["ingest_ts"] = ingest_ts
+                record["__category__"] = record_category  # interim
+                yield record
 
 
 Error: TypeAlias = dict[str, Any]
@@ -1,9 +1,11 @@
+import functools
+import itertools
+import re
 from collections import defaultdict
-from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor
-from http import HTTPStatus
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
 import orjson
 import requests
@@ -11,6 +13,8 @@ from jinja2 import Template
 
 from .common import bigquery, cloud_logging, firestore, request, secret_manager
 from .common.constants import (
+    MAX_ALERTS_PER_REQUEST,
+    MAX_CONCURRENT_QUERIES,
     MAX_HISTORY_DEPTH_YEARS,
     MAX_RETRIES_PER_REQUEST,
     PLATFORM_API_KEY_SECRET_NAME,
@@ -27,6 +31,15 @@ from .common.validation import validate_response_status
 
 logger = cloud_logging.get_logger(__name__)
 
+TEMPLATE_FRONT_MATTER_PATTERN = re.compile(r"^\{#-?(?P<body>.*?)-?#\}", re.DOTALL)
+TEMPLATE_DEPENDENCY_PATTERN = re.compile(r"^\s*-\s*(\S+)\s*$", re.MULTILINE)
+
+
+class QueryTemplate(TypedDict):
+    name: str
+    template: Template
+    dependencies: frozenset[str]
+
 
 def prepare_id_map() -> None:
     id_map: dict[tuple[str, str, str], set[tuple[str, int, int, int]]] = defaultdict(set)
@@ -122,6 +135,8 @@ def _parse_telemetry_config(
 
 
 def _refine_telemetry_points() -> None:
+    _deduplicate_telemetry_points()
+
     bigquery.engine.execute_query(
         """
         CREATE OR REPLACE TABLE FUNCTION telemetry_rfn.points(start_ts TIMESTAMP, end_ts TIMESTAMP)
@@ -133,28 +148,372 @@ def _refine_telemetry_points() -> None:
             point_data_value NUMERIC,
             point_data_ts TIMESTAMP
         > AS (
-            SELECT * EXCEPT (fetch_ts, ingest_ts) FROM telemetry_raw.points
+            SELECT * EXCEPT (ingest_ts) FROM telemetry_rfn.points_dedup
             WHERE point_data_ts BETWEEN start_ts AND end_ts
-            QUALIFY (
-                ROW_NUMBER() OVER (
-                    PARTITION BY data_provider, site_id, device_id, point_tag, point_data_ts
-                )
-            ) = 1
+        );
+        """
+    )
+
+    _aggregate_telemetry_points()
+    _check_telemetry_points_15min()
+
+
+def _deduplicate_telemetry_points() -> None:
+    bigquery.engine.execute_query(
+        """
+        CREATE TABLE IF NOT EXISTS telemetry_rfn.points_dedup (
+            data_provider STRING NOT NULL,
+            site_id STRING NOT NULL,
+            device_id STRING NOT NULL,
+            point_tag STRING NOT NULL,
+            point_data_value NUMERIC,
+            point_data_ts TIMESTAMP NOT NULL,
+            ingest_ts TIMESTAMP NOT NULL
+        )
+        PARTITION BY TIMESTAMP_TRUNC(point_data_ts, DAY)
+        CLUSTER BY data_provider, site_id, device_id, point_tag;
+        """
+    )
+
+    # only the raw points ingested since the previous run are merged (into the partitions they belong to),
+    # the watermark is shifted back to pick up the points streamed in while the previous run was executing
+    bigquery.engine.execute_query(
+        f"""
+        DECLARE refresh_partitions ARRAY<TIMESTAMP>;
+
+        CREATE TEMP TABLE points_ingested AS
+        SELECT * EXCEPT (fetch_ts) FROM telemetry_raw.points
+        WHERE ingest_ts > (
+            SELECT IFNULL(MAX(ingest_ts), TIMESTAMP_SECONDS(0)) - (INTERVAL 15 MINUTE)
+            FROM telemetry_rfn.points_dedup
+        )
+        AND point_data_ts >= TIMESTAMP(CURRENT_DATE() - (INTERVAL {MAX_HISTORY_DEPTH_YEARS} YEAR))
+        QUALIFY (
+            ROW_NUMBER() OVER (
+                PARTITION BY data_provider, site_id, device_id, point_tag, point_data_ts
+                ORDER BY ingest_ts
+            )
+        ) = 1;
+
+        SET refresh_partitions = (
+            SELECT ARRAY_AGG(DISTINCT TIMESTAMP_TRUNC(point_data_ts, DAY)) FROM points_ingested
+        );
+
+        MERGE INTO telemetry_rfn.points_dedup AS pd
+        USING points_ingested AS pi
+        ON TIMESTAMP_TRUNC(pd.point_data_ts, DAY) IN UNNEST(refresh_partitions)
+        AND pd.data_provider = pi.data_provider
+        AND pd.site_id = pi.site_id
+        AND pd.device_id = pi.device_id
+        AND pd.point_tag = pi.point_tag
+        AND pd.point_data_ts = pi.point_data_ts
+        WHEN NOT MATCHED BY TARGET THEN INSERT (
+            data_provider,
+            site_id,
+            device_id,
+            point_tag,
+            point_data_value,
+            point_data_ts,
+            ingest_ts
+        ) VALUES (
+            pi.data_provider,
+            pi.site_id,
+            pi.device_id,
+            pi.point_tag,
+            pi.point_data_value,
+            pi.point_data_ts,
+            pi.ingest_ts
         );
         """
     )
 
 
+def _aggregate_telemetry_points() -> None:
+    bigquery.engine.execute_query(
+        """
+        CREATE TABLE IF NOT EXISTS telemetry_rfn.points_15min (
+            data_provider STRING NOT NULL,
+            site_id STRING NOT NULL,
+            device_id STRING NOT NULL,
+            point_tag STRING NOT NULL,
+            point_data_sum NUMERIC,
+            point_data_count INTEGER NOT NULL,
+            point_data_last_ts TIMESTAMP NOT NULL,
+            point_data_ts TIMESTAMP NOT NULL,
+            ingest_ts TIMESTAMP NOT NULL
+        )
+        PARTITION BY TIMESTAMP_TRUNC(point_data_ts, DAY)
+        CLUSTER BY data_provider, site_id, device_id, point_tag;
+        """
+    )
+
+    # only the hours with points ingested since the previous run are re-aggregated,
+    # the watermark is shifted back to pick up the points streamed in while the previous run was executing
+    bigquery.engine.execute_query(
+        """
+        DECLARE refresh_hours ARRAY<TIMESTAMP>;
+        DECLARE refresh_partitions ARRAY<TIMESTAMP>;
+        DECLARE refresh_ingest_ts TIMESTAMP;
+
+        SET (refresh_hours, refresh_ingest_ts) = (
+            SELECT AS STRUCT
+                ARRAY_AGG(DISTINCT TIMESTAMP_TRUNC(point_data_ts, HOUR)),
+                MAX(ingest_ts)
+            FROM telemetry_rfn.points_dedup
+            WHERE ingest_ts > (
+                SELECT IFNULL(MAX(ingest_ts), TIMESTAMP_SECONDS(0)) - (INTERVAL 15 MINUTE)
+                FROM telemetry_rfn.points_15min
+            )
+        );
+
+        /* the partitions of the refreshed hours, so both tables are pruned to them */
+        SET refresh_partitions = ARRAY(
+            SELECT DISTINCT TIMESTAMP_TRUNC(refresh_hour, DAY) FROM UNNEST(refresh_hours) AS refresh_hour
+        );
+
+        MERGE INTO telemetry_rfn.points_15min AS pa
+        USING (
+            SELECT
+                data_provider,
+                site_id,
+                device_id,
+                point_tag,
+                SUM(point_data_value) AS point_data_sum,
+                COUNT(point_data_value) AS point_data_count,
+                MAX(point_data_ts) AS point_data_last_ts,
+                TIMESTAMP_TRUNC(point_data_ts, HOUR)
+                + (INTERVAL 15 MINUTE) * DIV(EXTRACT(MINUTE FROM point_data_ts), 15) AS point_data_ts,
+                refresh_ingest_ts AS ingest_ts
+            FROM telemetry_rfn.points_dedup
+            WHERE TIMESTAMP_TRUNC(point_data_ts, DAY) IN UNNEST(refresh_partitions)
+            AND TIMESTAMP_TRUNC(point_data_ts, HOUR) IN UNNEST(refresh_hours)
+            GROUP BY data_provider, site_id, device_id, point_tag, point_data_ts
+        ) AS pb
+        ON TIMESTAMP_TRUNC(pa.point_data_ts, DAY) IN UNNEST(refresh_partitions)
+        AND TIMESTAMP_TRUNC(pa.point_data_ts, HOUR) IN UNNEST(refresh_hours)
+        AND pa.data_provider = pb.data_provider
+        AND pa.site_id = pb.site_id
+        AND pa.device_id = pb.device_id
+        AND pa.point_tag = pb.point_tag
+        AND pa.point_data_ts = pb.point_data_ts
+        WHEN MATCHED THEN UPDATE SET
+            point_data_sum = pb.point_data_sum,
+            point_data_count = pb.point_data_count,
+            point_data_last_ts = pb.point_data_last_ts,
+            ingest_ts = pb.ingest_ts
+        WHEN NOT MATCHED BY TARGET THEN INSERT ROW;
+        """
+    )
+
+    # the 15 minutes aggregates are read for the bins fully covered by the [start_ts, end_ts) range,
+    # while the raw points are read only for the partially covered bins at the edges of a not aligned range
+    aligned_start_ts = "TIMESTAMP_MICROS(DIV(UNIX_MICROS(start_ts) + 899999999, 900000000) * 900000000)"
+    aligned_end_ts = "TIMESTAMP_MICROS(DIV(UNIX_MICROS(end_ts), 900000000) * 900000000)"
+
+    bigquery.engine.execute_query(
+        f"""
+        CREATE OR REPLACE TABLE FUNCTION telemetry_rfn.points_15min_range(start_ts TIMESTAMP, end_ts TIMESTAMP)
+        RETURNS TABLE <
+            data_provider STRING,
+            site_id STRING,
+            device_id STRING,
+            point_tag STRING,
+            point_data_sum NUMERIC,
+            point_data_count INTEGER,
+            point_data_last_ts TIMESTAMP,
+            point_data_ts TIMESTAMP
+        > AS (
+            WITH points_edges AS (  /* partially covered bins */
+                SELECT * FROM telemetry_rfn.points_dedup
+                WHERE point_data_ts >= start_ts
+                AND point_data_ts < LEAST(end_ts, {aligned_start_ts})
+                UNION ALL
+                SELECT * FROM telemetry_rfn.points_dedup
+                WHERE point_data_ts >= GREATEST(start_ts, {aligned_end_ts})
+                AND point_data_ts < end_ts
+                AND {aligned_start_ts} < {aligned_end_ts}
+            )
+            SELECT
+                data_provider,
+                site_id,
+                device_id,
+                point_tag,
+                SUM(point_data_value) AS point_data_sum,
+                COUNT(point_data_value) AS point_data_count,
+                MAX(point_data_ts) AS point_data_last_ts,
+                TIMESTAMP_TRUNC(point_data_ts, HOUR)
+                + (INTERVAL 15 MINUTE) * DIV(EXTRACT(MINUTE FROM point_data_ts), 15) AS point_data_ts
+            FROM points_edges
+            GROUP BY data_provider, site_id, device_id, point_tag, point_data_ts
+            UNION ALL
+            SELECT
+                data_provider,
+                site_id,
+                device_id,
+                point_tag,
+                point_data_sum,
+                point_data_count,
+                point_data_last_ts,
+                point_data_ts
+            FROM telemetry_rfn.points_15min  /* fully covered bins */
+            WHERE point_data_ts >= {aligned_start_ts}
+            AND point_data_ts < {aligned_end_ts}
+        );
+        """
+    )
+
+
+def _check_telemetry_points_15min() -> None:
+    # one not aligned window (the previous hour shifted by 7.5 minutes) aggregated from the raw points
+    # has to match the same window read from the 15 minutes aggregates, i.e. both the aligned bins and the edges;
+    # a mismatch is only reported, so the alerts are still processed and pushed
+    rows = bigquery.engine.execute_query(
+        """
+        DECLARE test_start_ts TIMESTAMP DEFAULT
+            TIMESTAMP_TRUNC(CURRENT_TIMESTAMP(), HOUR) - (INTERVAL 2 HOUR) + (INTERVAL 450 SECOND);
+        DECLARE test_end_ts TIMESTAMP DEFAULT test_start_ts + (INTERVAL 1 HOUR);
+
+        SELECT COUNT(*) AS mismatched_bins_count FROM (
+            WITH points_expected AS (
+                SELECT
+                    data_provider,
+                    site_id,
+                    device_id,
+                    point_tag,
+                    SUM(point_data_value) AS point_data_sum,
+                    COUNT(point_data_value) AS point_data_count,
+                    MAX(point_data_ts) AS point_data_last_ts,
+                    TIMESTAMP_TRUNC(point_data_ts, HOUR)
+                    + (INTERVAL 15 MINUTE) * DIV(EXTRACT(MINUTE FROM point_data_ts), 15) AS point_data_ts
+                FROM telemetry_rfn.points(test_start_ts, test_end_ts)
+                WHERE point_data_ts < test_end_ts  /* inclusive -> exclusive */
+                GROUP BY data_provider, site_id, device_id, point_tag, point_data_ts
+            ),
+            points_actual AS (
+                SELECT
+                    data_provider,
+                    site_id,
+                    device_id,
+                    point_tag,
+                    SUM(point_data_sum) AS point_data_sum,
+                    SUM(point_data_count) AS point_data_count,
+                    MAX(point_data_last_ts) AS point_data_last_ts,
+                    point_data_ts
+                FROM telemetry_rfn.points_15min_range(test_start_ts, test_end_ts)
+                GROUP BY data_provider, site_id, device_id, point_tag, point_data_ts
+            )
+            SELECT 1
+            FROM points_expected AS pe
+            FULL OUTER JOIN points_actual AS pa
+            USING (data_provider, site_id, device_id, point_tag, point_data_ts)
+            WHERE pe.point_data_count IS DISTINCT FROM pa.point_data_count
+            OR pe.point_data_sum IS DISTINCT FROM pa.point_data_sum
+            OR pe.point_data_last_ts IS DISTINCT FROM pa.point_data_last_ts
+        );
+        """
+    )
+
+    mismatched_bins_count = next(rows)["mismatched_bins_count"]
+
+    if mismatched_bins_count:
+        logger.warning(
+            "Telemetry points aggregated into 15 minutes bins do not match the raw points",
+            mismatched_bins_count=mismatched_bins_count,
+        )
+
+
 def _process_telemetry_points(environment: PlatformEnvironment) -> None:
     context = {"environment": environment}
 
+    templates = _load_query_templates()
+
+    pending = dict(templates)
+    executed: set[str] = set()
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_QUERIES) as executor:
+        running: dict[Future[None], str] = {}
+
+        while pending or running:
+            for name, template in list(pending.items()):
+                if template["dependencies"] <= executed:
+                    running[executor.submit(_execute_query_template, template, context)] = name
+                    del pending[name]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                future.result()  # propagate failure
+                executed.add(running.pop(future))
+
+
+@functools.cache
+def _load_query_templates() -> dict[str, QueryTemplate]:
     template_dir_path = Path(__file__).parent / "templates"
     template_file_ext = ".sql.jinja2"
 
-    for template_file_path in template_dir_path.glob(f"**/*{template_file_ext}"):
-        template = Template(template_file_path.read_text(encoding="utf-8"))
+    templates = {}
+
+    for template_file_path in sorted(template_dir_path.glob(f"**/*{template_file_ext}")):
+        name = template_file_path.relative_to(template_dir_path).as_posix().removesuffix(template_file_ext)
+        source = template_file_path.read_text(encoding="utf-8")
+
+        templates[name] = QueryTemplate(
+            name=name,
+            template=Template(source),
+            dependencies=_parse_template_dependencies(source),
+        )
+
+    _validate_template_dependencies(templates)
+
+    return templates
+
+
+def _parse_template_dependencies(source: str) -> frozenset[str]:
+    """
+    Parse dependencies from the template front-matter, i.e. the leading Jinja comment:
+
+    {#-
+    depends_on:
+      - reporting/site_performance_report_daily
+    -#}
+    """
+    front_matter = TEMPLATE_FRONT_MATTER_PATTERN.match(source)
+
+    if front_matter is None:
+        return frozenset()
+
+    return frozenset(TEMPLATE_DEPENDENCY_PATTERN.findall(front_matter.group("body")))
+
+
+def _validate_template_dependencies(templates: dict[str, QueryTemplate]) -> None:
+    for template in templates.values():
+        if unknown_dependencies := template["dependencies"] - templates.keys():
+            raise ValueError(f"Unknown dependencies of template {template['name']!r}: {sorted(unknown_dependencies)}")
+
+    resolved: set[str] = set()
+    unresolved = set(templates)
+
+    while unresolved:
+        ready = {name for name in unresolved if templates[name]["dependencies"] <= resolved}
+
+        if not ready:
+            raise ValueError(f"Cyclic dependencies between templates: {sorted(unresolved)}")
+
+        resolved |= ready
+        unresolved -= ready
 
-        bigquery.engine.execute_query(template.render(**context))
+
+def _execute_query_template(template: QueryTemplate, context: dict[str, Any]) -> None:
+    sub_logger = logger.bind(template=template["name"], **context)
+
+    sub_logger.info("Executing query template")
+
+    with Timer() as timer:
+        bigquery.engine.execute_query(template["template"].render(**context), template=template["name"], **context)
+
+    duration = timer.elapsed_ms / 1_000
+
+    sub_logger.info("Executed query template", duration=duration)
 
 
 def _refine_telemetry_alerts() -> None:
@@ -251,42 +610,67 @@ def _push_platform_alerts(environment: PlatformEnvironment) -> None:
         f"SELECT * EXCEPT (push_ts) FROM platform_{environment}.alerts WHERE push_ts IS NULL;"
     )
 
-    api_url = f"{PLATFORM_API_URLS[environment]}/api/internal/alerts"
+    api_url = f"{PLATFORM_API_URLS[environment]}/api/internal/alerts:batch"
 
     api_key = secret_manager.access_secret(PROJECT_ID, PLATFORM_API_KEY_SECRET_NAME.format(environment=environment))
 
-    for alert in alerts:
-        sub_logger = logger.bind(environment=environment, api_url=api_url, alert=alert)
+    acknowledged_alert_keys: list[str] = []
+
+    for alerts_batch in itertools.batched(alerts, MAX_ALERTS_PER_REQUEST):
+        sub_logger = logger.bind(environment=environment, api_url=api_url, alerts_count=len(alerts_batch))
+
+        sub_logger.info("Pushing alerts to internal API")
 
-        sub_logger.info("Pushing alert to internal API")
+        try:
+            with Timer() as timer:
+                response = _push_alerts_request(api_url, api_key, alerts_batch)
 
-        with Timer() as timer:
-            response = _push_alert_request(api_url, api_key, alert)
+        except requests.RequestException as error:
+            # alerts of the batch remain unacknowledged and will be pushed again by the next run
+            sub_logger.exception("Failed to push alerts to internal API: %r", error)
+            continue
 
-        status_code = response.status_code
-        reason_phrase = HTTPStatus(status_code).phrase
+        outcome = response.json()
 
         duration = timer.elapsed_ms / 1_000
 
         sub_logger.info(
-            "Pushed alert to internal API",
-            status_code=status_code,
-            reason_phrase=reason_phrase,
+            "Pushed alerts to internal API",
+            created=len(outcome["created"]),
+            already_exist=len(outcome["already_exist"]),
+            device_not_found=len(outcome["device_not_found"]),
             duration=duration,
         )
 
+        acknowledged_alert_keys.extend(
+            _alert_key(alert)
+            for alerts_group in ("created", "already_exist", "device_not_found")
+            for alert in outcome[alerts_group]
+        )
+
+    if not acknowledged_alert_keys:
+        return
+
     bigquery.engine.execute_query(
-        f"UPDATE platform_{environment}.alerts SET push_ts = CURRENT_TIMESTAMP() WHERE push_ts IS NULL;"
+        f"""
+        UPDATE platform_{environment}.alerts SET push_ts = CURRENT_TIMESTAMP()
+        WHERE push_ts IS NULL AND FORMAT('%d/%s', device_id, external_id) IN UNNEST(@alert_keys);
+        """,
+        query_parameters=[bigquery.ArrayQueryParameter("alert_keys", "STRING", acknowledged_alert_keys)],
     )
 
 
+def _alert_key(alert: dict[str, Any]) -> str:
+    return f"{alert['device_id']}/{alert['external_id']}"
+
+
 @retry_on_exception(requests.RequestException, max_retries=MAX_RETRIES_PER_REQUEST)
-def _push_alert_request(api_url: str, api_key: str, alert: dict[str, Any]) -> requests.Response:
+def _push_alerts_request(api_url: str, api_key: str, alerts: Sequence[dict[str, Any]]) -> requests.Response:
     response = request.post(
         api_url,
         params={"api_key": api_key},
-        data=orjson.dumps(alert),
+        data=orjson.dumps({"alerts": alerts}),
         headers={"Content-Type": "application/json"},
         timeout=TIMEOUT_PER_REQUEST,
     )
-    return validate_response_status(response, expect={HTTPStatus.CREATED, HTTPStatus.CONFLICT, HTTPStatus.NOT_FOUND})
+    return validate_response_status(response)
@@ -4,6 +4,7 @@ from flask import Request, Response
 from . import job
 from .common import cloud_logging, response
 from .common.enums import TelemetryCategory
+from .common.request import log_latency_histograms
 from .common.timer import Timer
 
 logger = cloud_logging.get_logger(__name__)
@@ -42,6 +43,8 @@ def process_telemetry_data_job(request: Request) -> Response:
 
         sub_logger.info("Processed %s in BigQuery", category, duration=duration)
 
+    log_latency_histograms()
+
     return response.ok()
 
 
@@ -0,0 +1,10 @@
+-- Chunk position within its file, the key of the idempotent upsert of the file chunks.
+-- Run with psql outside of a transaction, CREATE INDEX CONCURRENTLY cannot run in one:
+-- psql -h 127.0.0.2 -U chatbot -d chatbot-documents -f document_embeddings_chunk_index.sql
+-- Rows stored before this migration keep a NULL chunk_index until their file is re-indexed.
+-- Once applied, set PG_VECTOR_CHUNK_UPSERT=true so the uploaded files are upserted.
+
+ALTER TABLE document_embeddings ADD COLUMN IF NOT EXISTS chunk_index integer;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS document_embeddings_file_chunk_idx
+    ON document_embeddings (file_id, chunk_index);
@@ -46,7 +46,10 @@ from src.gen_ai.injections import InjectionClassifier, InjectionError
 from src.pipelines.constants import HARMFUL_PLEASE_REPHRASE, AgreementType
 from src.pipelines.sql_retriever.base import ProjectPreviewRetriever
 from src.vectordb.pg_vector.retriever import PGVectorRetriever
-from src.vectordb.pg_vector.sql import insert_sql_chatbot_history
+from src.vectordb.pg_vector.sql import (
+    insert_sql_chatbot_history,
+    insert_sql_chatbot_history_template,
+)
 
 
 handler = logging.StreamHandler()
@@ -170,7 +173,9 @@ class ChatbotBase:
             filters["document_name"] = document_name
         else:
             filters["agreement_type"] = agreement_type
-        vector_search_response = self.retriever.get_documents(
+        # the embedding and database calls are blocking, run them off the event loop
+        vector_search_response = await asyncio.to_thread(
+            self.retriever.get_documents,
             question,
             filters,
         )
@@ -184,14 +189,20 @@ class ChatbotBase:
         await self.update_status(ChatbotState.ANALYZING_RISK)
         risks_context = ""
         documents_list = []
-        for agreement_type in agreement_types:
-            documents = self.retriever.get_risks(
-                {
-                    "company_id": int(self.company_id),
-                    "site_id": int(self.site_id),
-                    "agreement_type": agreement_type.strip(),
-                }
-            )
+        agreement_types_documents = await asyncio.gather(
+            *[
+                asyncio.to_thread(
+                    self.retriever.get_risks,
+                    {
+                        "company_id": int(self.company_id),
+                        "site_id": int(self.site_id),
+                        "agreement_type": agreement_type.strip(),
+                    },
+                )
+                for agreement_type in agreement_types
+            ]
+        )
+        for documents in agreement_types_documents:
             if not documents:
                 continue
             formated_risks = self.format_risks(documents)
@@ -343,7 +354,7 @@ class ChatbotBase:
 
         await self.update_status(ChatbotState.COLLECTING_INPUTS)
 
-        self.set_other_agreement_type_document_names()
+        await asyncio.to_thread(self.set_other_agreement_type_document_names)
 
         sources = self.classify_sources_binary(user_message)
         agreement_type_key_items = self.classify_agreement_type_key_items(user_message)
@@ -568,13 +579,15 @@ class ChatbotBase:
         await self.update_status(ChatbotState.CHECKING_PP)
         sql_context = ""
         documents_list = []
-        for agreement_type, key_items in agreement_type_key_items:
-            if agreement_type in self.other_agreement_type_document_names:
-                documents = []
-            else:
-                documents = self.project_preview_retriever.get_project_preview_data_by_agreement_type_key_items(  # noqa
-                    agreement_type, key_items
-                )
+        agreement_types_documents = await asyncio.gather(
+            *[
+                self.get_project_preview_documents(agreement_type, key_items)
+                for agreement_type, key_items in agreement_type_key_items
+            ]
+        )
+        for (agreement_type, _), documents in zip(
+            agreement_type_key_items, agreement_types_documents
+        ):
             sql_context += self.format_sql_context(agreement_type, documents)
             documents_list.extend(documents)
 
@@ -587,6 +600,23 @@ class ChatbotBase:
             documents_list,
         )
 
+    async def get_project_preview_documents(
+        self, agreement_type: Any, key_items: Any
+    ) -> Any:
+        """
+        Get the project preview documents of the agreement type from the database.
+        :param agreement_type:
+        :param key_items:
+        :return:
+        """
+        if agreement_type in self.other_agreement_type_document_names:
+            return []
+        return await asyncio.to_thread(
+            self.project_preview_retriever.get_project_preview_data_by_agreement_type_key_items,  # noqa
+            agreement_type,
+            key_items,
+        )
+
     async def get_rag_context(
         self,
         user_message: str,
@@ -604,17 +634,22 @@ class ChatbotBase:
 
         rag_context = ""
         documents_list = []
-        for agreement_type in agreement_types:
-            documents = await self.retrieve_documents_from_rag(
-                user_message,
-                agreement_type.strip(),
-                document_name=(
-                    agreement_type.strip()
-                    if agreement_type.strip()
-                    in self.other_agreement_type_document_names
-                    else None
-                ),
-            )
+        agreement_types_documents = await asyncio.gather(
+            *[
+                self.retrieve_documents_from_rag(
+                    user_message,
+                    agreement_type.strip(),
+                    document_name=(
+                        agreement_type.strip()
+                        if agreement_type.strip()
+                        in self.other_agreement_type_document_names
+                        else None
+                    ),
+                )
+                for agreement_type in agreement_types
+            ]
+        )
+        for documents in agreement_types_documents:
             if not documents:
                 continue
 
@@ -753,7 +788,9 @@ class ChatbotBase:
             }
             documents.append(document)
         self.retriever.db_connector.store_documents(
-            documents=documents, sql_statement=insert_sql_chatbot_history
+            documents=documents,
+            sql_statement=insert_sql_chatbot_history,
+            template=insert_sql_chatbot_history_template,
         )
         logger.info("Chatbot history stored successfully.")
 
@@ -97,7 +97,9 @@ async def websocket_endpoint(websocket: WebSocket, token: str) -> None:
     )
 
     try:
-        chatbot = ChatbotBase(
+        # the connectors and classifiers are set up off the event loop
+        chatbot = await asyncio.to_thread(
+            ChatbotBase,
             llm=llm,
             config=ChatbotConfig(
                 max_documents=5,
@@ -131,8 +133,12 @@ async def websocket_endpoint(websocket: WebSocket, token: str) -> None:
             except WebSocketDisconnect as e:
                 logger.error(f"Websocket disconnect while receiving data: {str(e)}")
                 try:
-                    chatbot.persist_history(
-                        user_id, site_id, company_id, conversation_id=str(uuid4())
+                    await asyncio.to_thread(
+                        chatbot.persist_history,
+                        user_id,
+                        site_id,
+                        company_id,
+                        conversation_id=str(uuid4()),
                     )
                 except Exception as chatbot_history_error:
                     logger.error(
@@ -168,8 +174,12 @@ async def websocket_endpoint(websocket: WebSocket, token: str) -> None:
                 await asyncio.sleep(0)
             except WebSocketDisconnect as e:
                 try:
-                    chatbot.persist_history(
-                        user_id, site_id, company_id, conversation_id=str(uuid4())
+                    await asyncio.to_thread(
+                        chatbot.persist_history,
+                        user_id,
+                        site_id,
+                        company_id,
+                        conversation_id=str(uuid4()),
                     )
                 except Exception as chatbot_history_error:
                     logger.error(
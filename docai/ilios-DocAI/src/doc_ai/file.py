@@ -1,12 +1,13 @@
-import io
+import copy
+import hashlib
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import fitz
 import google.cloud.storage as storage
-from PyPDF2 import PdfReader, PdfWriter
 
 from src.doc_ai.document_sequence import DocumentSequence
 from src.user_interface.doc_type import DocType
@@ -14,6 +15,11 @@ from src.user_interface.doc_type import DocType
 
 logger = logging.getLogger(__name__)
 
+# indirect references, except the ones pointing back to the parent objects
+PDF_REFERENCE_PATTERN = re.compile(r"(?<!/Parent )(?<!/P )\b(\d+) \d+ R\b")
+# approximate size of the page object itself and the PDF file structure around it
+PDF_PAGE_OVERHEAD_BYTES = 1024
+
 
 class File:
     def __init__(self, path: str | Path, pages: List[int] | None) -> None:
@@ -23,16 +29,19 @@ class File:
         self.doc_type: DocType = self._get_doc_type()
         try:
             self.bytes_repr: bytes = self._read_file()
-            self.reader = PdfReader(io.BytesIO(self.bytes_repr), strict=False)
+            self.pdf: fitz.Document = fitz.open(stream=self.bytes_repr, filetype="pdf")
         except Exception as e:
             logger.error(f"Failed to read bytes from {self.path}. Error: {e}")
             raise ValueError(f"Failed to read file from {self.path}. Error:{e}")
 
+        self.content_hash: str = hashlib.sha256(self.bytes_repr).hexdigest()
         self.is_uploaded: bool = True
         self.all_pages: List[int] = self._get_num_pages(pages)
         self.is_processed: bool = False
+        self.failed_pages: List[int] = []
         self.doc_ai_repr: Optional[DocumentSequence] = None
         self.metadata: Optional[Dict[str, Any]] = None
+        self._page_sizes: Optional[List[int]] = None
 
     def _read_file(self) -> bytes:
         """Read document from the source"""
@@ -64,35 +73,104 @@ class File:
         ), "Only PDF files are supported for the read method"
         logger.info("Extracting pages: %s", pages)
         try:
-            pdf_writer = PdfWriter()
-            for page in pages:
-                pdf_writer.add_page(self.reader.pages[page])
-            image_content = io.BytesIO()
-            pdf_writer.write(image_content)
-            image_content.seek(0)
-            image_content = image_content.read()  # type: ignore
+            with fitz.open() as pdf_writer:
+                for page in pages:
+                    pdf_writer.insert_pdf(self.pdf, from_page=page, to_page=page)
+                image_content = pdf_writer.tobytes(garbage=1)
         except Exception as e:
             logger.info(
-                f"PDFReader failed to extract pages {pages} from {self.name}. "
+                f"PyMuPdf failed to extract pages {pages} from {self.name}. "
                 f"Error: {e}"
             )
             raise ValueError(
-                f"PDFReader failed to extract pages {pages} from {self.name}. "
+                f"PyMuPdf failed to extract pages {pages} from {self.name}. "
                 f"Error: {e}"
             )
-        return image_content  # type: ignore
+        return image_content
 
     def get_pdf_page_size(self, page_number: int) -> int:
         """Get the size of a specific PDF page in bytes."""
-        writer = PdfWriter()
-        writer.add_page(self.reader.pages[page_number])
-        output = io.BytesIO()
-        writer.write(output)
-        return len(output.getvalue())
+        return self.get_pdf_page_sizes()[page_number]
 
     def get_pdf_page_sizes(self) -> List[int]:
-        """Get the sizes of all PDF pages in bytes."""
-        return [self.get_pdf_page_size(i) for i, _ in enumerate(self.reader.pages)]
+        """
+        Get the sizes of all PDF pages in bytes.
+
+        Each page size is the sum of the sizes of all the objects (content streams,
+        images, fonts, etc.) the page references, as if the page were extracted alone.
+        Objects are measured once without decoding streams, and the page index is
+        computed once per file. The other pages, reachable through links and
+        destinations, are not part of the page.
+        """
+        if self._page_sizes is None:
+            object_sizes: Dict[int, int] = {}
+            object_references: Dict[int, List[int]] = {}
+            pages_xrefs = [
+                self.pdf.page_xref(page_number)
+                for page_number in range(self.pdf.page_count)
+            ]
+            pages_xrefs_set = set(pages_xrefs)
+            self._page_sizes = [
+                self._get_page_size(
+                    page_xref, pages_xrefs_set, object_sizes, object_references
+                )
+                for page_xref in pages_xrefs
+            ]
+        return self._page_sizes
+
+    def _get_page_size(
+        self,
+        page_xref: int,
+        pages_xrefs: Set[int],
+        object_sizes: Dict[int, int],
+        object_references: Dict[int, List[int]],
+    ) -> int:
+        """Sum the sizes of the objects reachable from the page object."""
+        visited = {page_xref}
+        to_visit = [page_xref]
+        page_size = PDF_PAGE_OVERHEAD_BYTES
+        while to_visit:
+            xref = to_visit.pop()
+            if xref not in object_sizes:
+                self._measure_object(xref, object_sizes, object_references)
+            page_size += object_sizes[xref]
+            for reference in object_references[xref]:
+                # the other pages are never visited
+                if reference not in visited and reference not in pages_xrefs:
+                    visited.add(reference)
+                    to_visit.append(reference)
+        return page_size
+
+    def _measure_object(
+        self,
+        xref: int,
+        object_sizes: Dict[int, int],
+        object_references: Dict[int, List[int]],
+    ) -> None:
+        """Store the size and the references of the PDF object."""
+        try:
+            definition = self.pdf.xref_object(xref, compressed=True)
+        except Exception:
+            object_sizes[xref], object_references[xref] = 0, []
+            return
+        size = len(definition)
+        if self.pdf.xref_is_stream(xref):
+            size += self._get_stream_length(xref)
+        object_sizes[xref] = size
+        object_references[xref] = [
+            int(reference)
+            for reference in PDF_REFERENCE_PATTERN.findall(definition)
+            if 0 < int(reference) < self.pdf.xref_length()
+        ]
+
+    def _get_stream_length(self, xref: int) -> int:
+        """Return the length of the raw (encoded) stream without reading it."""
+        length_type, length = self.pdf.xref_get_key(xref, "Length")
+        if length_type == "int":
+            return int(length)
+        if length_type == "xref":
+            return int(self.pdf.xref_object(int(length.split()[0])).strip())
+        return len(self.pdf.xref_stream_raw(xref))
 
     def _get_doc_type(self) -> DocType:
         """Classify documents based on their file extensions."""
@@ -104,19 +182,18 @@ class File:
             raise ValueError(f"Unsupported file format: {self.name}")
 
     def _get_num_pages(self, pages: List[int] | None) -> List[int]:
-        with fitz.open(stream=io.BytesIO(self.bytes_repr), filetype="pdf") as f:
-            try:
-                original_pages = [i for i in range(0, len(list(f.pages())))]
-                logger.info(f"Number of pages in {self.path}: {len(original_pages)}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to get number of pages from {self.path} "
-                    f"with PyMuPdf. Error: {e}"
-                )
-                raise ValueError(
-                    f"Failed to get number of pages from {self.path} "
-                    f"with PyMuPdf. Error: {e}"
-                )
+        try:
+            original_pages = list(range(self.pdf.page_count))
+            logger.info(f"Number of pages in {self.path}: {len(original_pages)}")
+        except Exception as e:
+            logger.error(
+                f"Failed to get number of pages from {self.path} "
+                f"with PyMuPdf. Error: {e}"
+            )
+            raise ValueError(
+                f"Failed to get number of pages from {self.path} "
+                f"with PyMuPdf. Error: {e}"
+            )
         if pages is None:
             return original_pages
         else:
@@ -157,6 +234,19 @@ class File:
         else:
             raise ValueError("Document has not been processed yet.")
 
+    def select_pages(self, pages: List[int]) -> "File":
+        """
+        Return a view of the processed file restricted to the given pages, built from
+        the stored Document AI output instead of processing the pages again.
+        """
+        if not self.is_processed:
+            raise ValueError("Document has not been processed yet.")
+        selected_pages = set(pages)
+        file = copy.copy(self)
+        file.all_pages = [page for page in self.all_pages if page in selected_pages]
+        file.doc_ai_repr = self.doc_ai_repr.select_pages(pages)  # type: ignore
+        return file
+
     def add_docai_representation(self, docai_representation: DocumentSequence) -> None:
         """Add the DocumentSequence representation of the document."""
         self.doc_ai_repr = docai_representation
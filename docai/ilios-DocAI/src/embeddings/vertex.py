@@ -1,24 +1,40 @@
 import os
-from typing import Any, List
+from typing import Any, List, Optional
 
 from langchain_google_vertexai import VertexAIEmbeddings
 
+from src.embeddings.cache import EmbeddingCache, embedding_cache
+
 
 class VertexAIEmbedder:
-    def __init__(self, embedding_model: str = "text-embedding-005") -> None:
+    def __init__(
+        self,
+        embedding_model: str = "text-embedding-005",
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
         """Initialize the VertexAIEmbedder."""
+        self.embedding_model = embedding_model
         self.embedding_client: VertexAIEmbeddings = VertexAIEmbeddings(
             model_name=embedding_model,
             project="prj-ilios-ai",
             location=os.environ["LOCATION"],
         )
+        self.cache: EmbeddingCache = cache or embedding_cache
 
     def get_single_embedding(self, text: str, **kwargs: Any) -> List[float]:
         """Get the embedding for a single text."""
-        return self.embedding_client.embed([text], **kwargs)[0]
+        return self.get_batch_embeddings([text], **kwargs)[0]
 
     def get_batch_embeddings(
         self, texts: List[str], **kwargs: Any
     ) -> List[List[float]]:
-        """Get the embeddings for a batch of texts."""
-        return self.embedding_client.embed(texts, **kwargs)
+        """
+        Get the embeddings for a batch of texts. Only the texts missing from the
+        cache are sent to Vertex AI.
+        """
+        return self.cache.embed(
+            texts,
+            self.embedding_model,
+            lambda batch: self.embedding_client.embed(batch, **kwargs),
+            **kwargs,
+        )
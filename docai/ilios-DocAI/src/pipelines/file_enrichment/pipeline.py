@@ -96,6 +96,7 @@ class FileEnrichmentPipeline:
         complete_data = [
             {
                 "file_id": metadata["file_id"],
+                "chunk_index": chunk_index,
                 "site_name": metadata["site_name"],
                 "site_id": metadata["site_id"],
                 "company_name": metadata["company_name"],
@@ -114,8 +115,22 @@ class FileEnrichmentPipeline:
                 "risks": risk,
                 "actual": False,
             }
-            for embedding, doc, keyword, risk, summary, summary_embedding in zip(
-                embeddings, doc_chunks, keywords, risks, summaries, summaries_embeddings
+            for chunk_index, (
+                embedding,
+                doc,
+                keyword,
+                risk,
+                summary,
+                summary_embedding,
+            ) in enumerate(
+                zip(
+                    embeddings,
+                    doc_chunks,
+                    keywords,
+                    risks,
+                    summaries,
+                    summaries_embeddings,
+                )
             )
         ]
         logger.info("Run complete")
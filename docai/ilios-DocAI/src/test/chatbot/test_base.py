@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+from langchain_core.documents import Document
+
+from src.chatbot.modules.base import ChatbotBase
+
+
+class BlockingRetriever:
+    """Retriever waiting for all the concurrent lookups before answering"""
+
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def _document(self, name: str, delay: float) -> List[Document]:
+        self.barrier.wait()
+        time.sleep(delay)
+        metadata = {
+            "section_name": "section",
+            "document_name": name,
+            "file_name": f"{name}.pdf",
+            "subsection_name": "subsection",
+        }
+        return [Document(page_content=name, metadata=metadata)]
+
+    def get_documents(self, question: str, filters: Dict[str, Any]) -> List[Document]:
+        name = filters.get("document_name") or filters["agreement_type"]
+        return self._document(name, 0.1 if name == "Site Lease" else 0)
+
+    def get_risks(self, filters: Dict[str, Any]) -> List[Document]:
+        name = filters["agreement_type"]
+        return self._document(name, 0.1 if name == "Site Lease" else 0)
+
+
+class BlockingProjectPreviewRetriever:
+    """Project preview retriever waiting for all the concurrent lookups"""
+
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.agreement_types: List[str] = []
+
+    def get_project_preview_data_by_agreement_type_key_items(
+        self, agreement_type: str, key_items: List[str]
+    ) -> List[Dict[str, Any]]:
+        self.agreement_types.append(agreement_type)
+        self.barrier.wait()
+        time.sleep(0.1 if agreement_type == "Site Lease" else 0)
+        return [{"agreement_type": agreement_type, "key_items": key_items}]
+
+
+def _chatbot(parties: int) -> ChatbotBase:
+    """Create a chatbot with blocking retrievers and no LLM"""
+    chatbot = ChatbotBase.__new__(ChatbotBase)
+    chatbot.site_id = 1
+    chatbot.company_id = 2
+    chatbot.config = type("Config", (), {"max_documents": 5})()
+    chatbot.socket_manager = None
+    chatbot.retriever = BlockingRetriever(parties)
+    chatbot.project_preview_retriever = BlockingProjectPreviewRetriever(parties)
+    chatbot.other_agreement_type_document_names = ["Side Letter"]
+    return chatbot
+
+
+def test_get_rag_context_keeps_order() -> None:
+    """Test that the RAG lookups run concurrently and keep the input order"""
+    chatbot = _chatbot(3)
+    _, documents = asyncio.run(
+        chatbot.get_rag_context(
+            "question", ["Site Lease", "Interconnection Agreement", "Side Letter"]
+        )
+    )
+    assert [document.page_content for document in documents] == [
+        "Site Lease",
+        "Interconnection Agreement",
+        "Side Letter",
+    ]
+
+
+def test_get_risks_context_keeps_order() -> None:
+    """Test that the risks lookups run concurrently and keep the input order"""
+    chatbot = _chatbot(2)
+    risks_context, documents = asyncio.run(
+        chatbot.get_risks_context(["Site Lease", "Interconnection Agreement"])
+    )
+    assert [document.page_content for document in documents] == [
+        "Site Lease",
+        "Interconnection Agreement",
+    ]
+    assert risks_context is not None
+    assert risks_context.index("Site Lease") < risks_context.index(
+        "Interconnection Agreement"
+    )
+
+
+def test_get_sql_context_keeps_order(monkeypatch) -> None:  # type: ignore
+    """Test that the SQL lookups run concurrently and skip other agreement types"""
+    chatbot = _chatbot(2)
+    monkeypatch.setattr(
+        chatbot,
+        "format_sql_context",
+        lambda agreement_type, documents: f"{agreement_type}: {len(documents)}\n",
+    )
+    sql_context, documents = asyncio.run(
+        chatbot.get_sql_context(
+            [
+                ["Site Lease", ["Effective Date"]],
+                ["Side Letter", ["Parties"]],
+                ["Interconnection Agreement", ["Effective Date"]],
+            ]
+        )
+    )
+    assert documents == [
+        {"agreement_type": "Site Lease", "key_items": ["Effective Date"]},
+        {
+            "agreement_type": "Interconnection Agreement",
+            "key_items": ["Effective Date"],
+        },
+    ]
+    assert sql_context == (
+        "Site Lease: 1\nSide Letter: 0\nInterconnection Agreement: 1\n"
+    )
+    assert sorted(chatbot.project_preview_retriever.agreement_types) == [
+        "Interconnection Agreement",
+        "Site Lease",
+    ]
@@ -46,3 +46,38 @@ def test_get_paragraphs(document: Document) -> None:
     """
     ds = DocumentSequence([document])
     assert ds.get_paragraphs() == []
+
+
+def _page(page_number: int, start_index: int, end_index: int) -> Document.Page:
+    """Create a Document page with the layout pointing to the given text offsets"""
+    return Document.Page(
+        page_number=page_number,
+        layout=Document.Page.Layout(
+            text_anchor=Document.TextAnchor(
+                text_segments=[
+                    Document.TextAnchor.TextSegment(
+                        start_index=start_index, end_index=end_index
+                    )
+                ]
+            )
+        ),
+    )
+
+
+def test_select_pages() -> None:
+    """
+    Test that the select_pages method restricts the text to the given original file
+    pages without changing the original sequence
+    """
+    first_chunk = Document(
+        text="page 0\npage 1\n", pages=[_page(1, 0, 7), _page(2, 7, 14)]
+    )
+    second_chunk = Document(text="page 2\n", pages=[_page(1, 0, 7)])
+    ds = DocumentSequence([])
+    ds.append(first_chunk, pages=[0, 1])
+    ds.append(second_chunk, pages=[2])
+
+    assert ds.select_pages([0]).get_all_text() == "page 0\n"
+    assert ds.select_pages([1, 2]).get_all_text() == "page 1\n\npage 2\n"
+    assert ds.select_pages([0, 1]).select_pages([1, 2]).get_all_text() == "page 1\n"
+    assert ds.get_all_text() == "page 0\npage 1\n\npage 2\n"
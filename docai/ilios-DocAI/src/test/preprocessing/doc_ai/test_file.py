@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.doc_ai.file import File
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    """Create a PDF file with a long page in the middle"""
+    path = tmp_path / "test_file.pdf"
+    with fitz.open() as pdf:
+        for page_number in range(3):
+            page = pdf.new_page()
+            text = f"Page {page_number} " * (1000 if page_number == 1 else 1)
+            page.insert_textbox(page.rect, text, fontsize=4)
+        pdf.save(path)
+    return path
+
+
+def test_get_num_pages(pdf_path: Path) -> None:
+    """Test that the pages out of the file are skipped"""
+    assert File(pdf_path, None).all_pages == [0, 1, 2]
+    assert File(pdf_path, [0, 2, 5]).all_pages == [0, 2]
+
+
+def test_get_pdf_page_sizes(pdf_path: Path) -> None:
+    """Test that the page sizes reflect the content of each page"""
+    page_sizes = File(pdf_path, None).get_pdf_page_sizes()
+    assert len(page_sizes) == 3
+    assert page_sizes[1] > page_sizes[0]
+    assert page_sizes[1] > page_sizes[2]
+
+
+def test_get_pages(pdf_path: Path) -> None:
+    """Test that the selected pages are extracted in order"""
+    content = File(pdf_path, None).get_pages([2, 0])
+    with fitz.open(stream=content, filetype="pdf") as pdf:
+        assert [page.get_text().split()[1] for page in pdf] == ["2", "0"]
+
+
+def test_get_pdf_page_sizes_links(tmp_path: Path) -> None:
+    """Test that the links to the other pages don't add their content to the page"""
+    path = tmp_path / "test_links.pdf"
+    with fitz.open() as pdf:
+        for page_number in range(20):
+            page = pdf.new_page()
+            page.insert_textbox(page.rect, f"Page {page_number} " * 200, fontsize=4)
+        # table of contents on the first page, linking to the other pages
+        toc_page = pdf[0]
+        for page_number in range(1, 20):
+            link_rect = fitz.Rect(72, 20 * page_number, 300, 20 * page_number + 15)
+            toc_page.insert_link(
+                {"kind": fitz.LINK_GOTO, "from": link_rect, "page": page_number}
+            )
+        pdf.save(path)
+    page_sizes = File(path, None).get_pdf_page_sizes()
+    # the link annotations are part of the page, the linked pages are not
+    assert page_sizes[0] < 3 * max(page_sizes[1:])
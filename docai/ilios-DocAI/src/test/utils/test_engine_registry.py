@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from src.utils.engine_registry import EngineRegistry
+
+
+def test_get_engine(tmp_path: Path) -> None:
+    """Test that the engine is created once per DSN"""
+    registry = EngineRegistry()
+    dsn = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = registry.get_engine(dsn)
+    assert registry.get_engine(dsn) is engine
+    assert registry.get_engine(f"sqlite:///{tmp_path / 'other.db'}") is not engine
+    assert len(registry.engines) == 2
+
+
+def test_get_pool_metrics(tmp_path: Path) -> None:
+    """Test that the pool usage is reported per database"""
+    registry = EngineRegistry()
+    dsn = f"sqlite:///{tmp_path / 'test.db'}"
+    with registry.get_engine(dsn).connect():
+        assert registry.get_pool_metrics()[dsn]["checked_out"] == 1
+    assert registry.get_pool_metrics()[dsn]["checked_out"] == 0
+
+
+def test_get_database() -> None:
+    """Test that the password is not part of the database name"""
+    dsn = "postgresql+psycopg2://user:secret@/db?host=/cloudsql/instance"
+    assert "secret" not in EngineRegistry._get_database(dsn)
+    assert EngineRegistry._get_database(dsn) == EngineRegistry._get_database(
+        dsn.replace("secret", "rotated")
+    )
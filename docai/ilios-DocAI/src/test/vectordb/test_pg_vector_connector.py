@@ -0,0 +1,38 @@
+from typing import Any, List
+
+import pytest
+
+from src.vectordb.pg_vector.connector import PGVectorConnector
+from src.vectordb.pg_vector.sql import upsert_sql
+
+
+def test_upsert_documents(monkeypatch) -> None:  # type: ignore
+    """Test that the chunks after the last upserted one are deleted per file"""
+    calls: List[Any] = []
+    connector = PGVectorConnector.__new__(PGVectorConnector)
+    monkeypatch.setattr(connector, "_write_documents", lambda *args: calls.append(args))
+    documents = [
+        {"file_id": 1, "chunk_index": 0},
+        {"file_id": 1, "chunk_index": 1},
+        {"file_id": 2, "chunk_index": 0},
+    ]
+    connector.upsert_documents(documents)
+    assert calls[0][0] == documents
+    assert calls[0][1] == upsert_sql
+    assert calls[0][3] == [
+        {"file_id": 1, "chunks_count": 2},
+        {"file_id": 2, "chunks_count": 1},
+    ]
+
+
+def test_upsert_documents_raises(monkeypatch, caplog) -> None:  # type: ignore
+    """Test that a failed upsert is logged and raised instead of being dropped"""
+    connector = PGVectorConnector.__new__(PGVectorConnector)
+
+    def write_documents(*args: Any) -> None:
+        raise ValueError("no unique or exclusion constraint matching")
+
+    monkeypatch.setattr(connector, "_write_documents", write_documents)
+    with pytest.raises(ValueError):
+        connector.upsert_documents([{"file_id": 1, "chunk_index": 0}])
+    assert "Error upserting documents" in caplog.text
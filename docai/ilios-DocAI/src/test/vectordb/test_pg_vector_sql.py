@@ -0,0 +1,23 @@
+from src.vectordb.pg_vector.sql import (
+    delete_trailing_chunks_sql,
+    indexed_retriever_sql,
+    indexed_retriever_sql_by_document_name,
+    retriever_sql,
+)
+
+
+def test_indexed_retriever_sql() -> None:
+    """Test that the indexed search reads the stored tsvector with the same fusion"""
+    for sql in [indexed_retriever_sql, indexed_retriever_sql_by_document_name]:
+        assert "to_tsvector" not in sql
+        assert "content_tsv @@ query" in sql
+    assert (
+        indexed_retriever_sql.split("SELECT\n", 1)[1]
+        == retriever_sql.split("SELECT\n", 1)[1]
+    )
+
+
+def test_delete_trailing_chunks_sql() -> None:
+    """Test that re-indexing a file also deletes its chunks stored without index"""
+    assert "chunk_index >= %(chunks_count)s" in delete_trailing_chunks_sql
+    assert "chunk_index IS NULL" in delete_trailing_chunks_sql
@@ -1,10 +1,20 @@
 import hmac
 import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 import streamlit as st
 from google.cloud import secretmanager
 
 
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get("SECRET_CACHE_TTL_SECONDS", "300"))
+
+_secret_cache: Dict[str, Tuple[float, str]] = {}
+_secret_client: Optional[secretmanager.SecretManagerServiceClient] = None
+_secret_lock = threading.Lock()
+
+
 def check_password() -> bool:
     """Returns `True` if the user had the correct password."""
 
@@ -33,15 +43,28 @@ def check_password() -> bool:
 
 
 def get_secret(project_id: str, secret_id: str, version_id: str = "latest") -> str:
-    """Access the secret version and return the payload data."""
-    # Create the Secret Manager client.
-    client = secretmanager.SecretManagerServiceClient()
-
-    # Build the resource name of the secret version.
+    """
+    Access the secret version and return the payload data. Payloads are cached for
+    SECRET_CACHE_TTL_SECONDS, so the secret is not fetched on every connection.
+    """
     name = f"projects/{project_id}/secrets/{secret_id}/versions/{version_id}"
+    with _secret_lock:
+        cached = _secret_cache.get(name)
+    if cached is not None and time.monotonic() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+        return cached[1]
 
     # Access the secret version.
-    response = client.access_secret_version(request={"name": name})
+    response = _get_secret_client().access_secret_version(request={"name": name})
+    payload: str = response.payload.data.decode("UTF-8")
+    with _secret_lock:
+        _secret_cache[name] = (time.monotonic(), payload)
+    return payload
+
 
-    # Return the payload data.
-    return response.payload.data.decode("UTF-8")
+def _get_secret_client() -> secretmanager.SecretManagerServiceClient:
+    """Return the Secret Manager client, created once per process."""
+    global _secret_client
+    with _secret_lock:
+        if _secret_client is None:
+            _secret_client = secretmanager.SecretManagerServiceClient()
+        return _secret_client
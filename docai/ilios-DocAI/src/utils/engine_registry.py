@@ -0,0 +1,80 @@
+import logging
+import os
+import threading
+from typing import Any, Dict
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+
+
+logger = logging.getLogger(__name__)
+
+
+class EngineRegistry:
+    """
+    Process-wide SQLAlchemy engines keyed by DSN, created lazily on first use, so
+    the connectors constructed per request or per websocket share the same
+    connection pool. When the DSN of a database changes (e.g. a rotated password),
+    the engine built for the previous DSN is disposed.
+    """
+
+    def __init__(self) -> None:
+        self.engines: Dict[str, Engine] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_engine_options() -> Dict[str, Any]:
+        """Return the pool options from the DB_POOL_* environment variables."""
+        return {
+            "pool_size": int(os.environ.get("DB_POOL_SIZE", "5")),
+            "max_overflow": int(os.environ.get("DB_POOL_MAX_OVERFLOW", "10")),
+            "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", "30")),
+            "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+            "pool_pre_ping": True,
+        }
+
+    def get_engine(self, dsn: str) -> Engine:
+        """Return the engine for the DSN, creating it on first use."""
+        engine = self.engines.get(dsn)
+        if engine is not None:
+            return engine
+        with self.lock:
+            if dsn not in self.engines:
+                database = self._get_database(dsn)
+                for stale_dsn in [
+                    key for key in self.engines if self._get_database(key) == database
+                ]:
+                    logger.info(f"Disposing the engine for {database}")
+                    self.engines.pop(stale_dsn).dispose()
+                logger.info(f"Creating the engine for {database}")
+                self.engines[dsn] = create_engine(dsn, **self.get_engine_options())
+            return self.engines[dsn]
+
+    def get_pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return the connection pool usage of each engine."""
+        with self.lock:
+            engines = list(self.engines.values())
+        return {
+            engine.url.render_as_string(hide_password=True): {
+                "size": engine.pool.size(),  # type: ignore
+                "checked_in": engine.pool.checkedin(),  # type: ignore
+                "checked_out": engine.pool.checkedout(),  # type: ignore
+                "overflow": engine.pool.overflow(),  # type: ignore
+            }
+            for engine in engines
+        }
+
+    def dispose(self) -> None:
+        """Dispose all the engines."""
+        with self.lock:
+            for engine in self.engines.values():
+                engine.dispose()
+            self.engines.clear()
+
+    @staticmethod
+    def _get_database(dsn: str) -> str:
+        """Return the DSN without the password."""
+        return make_url(dsn).render_as_string(hide_password=True)
+
+
+engine_registry = EngineRegistry()
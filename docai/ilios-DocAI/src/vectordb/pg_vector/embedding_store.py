@@ -0,0 +1,68 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from src.deployment.fast_api.settings import settings
+from src.vectordb.pg_vector.config import PGVectorConfig
+from src.vectordb.pg_vector.connector import PGVectorConnector
+from src.vectordb.pg_vector.sql import (
+    insert_embedding_cache_sql,
+    select_embedding_cache_sql,
+)
+from src.vectordb.pg_vector.tables.embedding_cache import EmbeddingCacheModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class PGEmbeddingStore:
+    """
+    Embeddings stored in the embedding_cache table of the PGVector database, so
+    they are shared across instances and survive restarts. The connection is opened
+    and the table created on first use.
+    """
+
+    def __init__(self, config: PGVectorConfig) -> None:
+        self.config = config
+        self._engine: Optional[Any] = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "PGEmbeddingStore":
+        """Create the store for the database of the current environment."""
+        return cls(settings.get_pg_vector_config())
+
+    @property
+    def engine(self) -> Any:
+        with self.lock:
+            if self._engine is None:
+                engine = PGVectorConnector(self.config).engine
+                EmbeddingCacheModel.__table__.create(engine, checkfirst=True)
+                self._engine = engine
+        return self._engine
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the stored embeddings of the given keys."""
+        with self.engine.connect() as connection:
+            result = connection.execute(
+                text(select_embedding_cache_sql), {"keys": keys}
+            ).fetchall()
+        return {key: json.loads(embedding) for key, embedding in result}
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        """Store the embeddings, keeping the existing ones."""
+        if not embeddings:
+            return
+        with self.engine.connect() as connection:
+            connection.execute(
+                text(insert_embedding_cache_sql),
+                [
+                    {"key": key, "model": model, "embedding": embedding}
+                    for key, embedding in embeddings.items()
+                ],
+            )
+            connection.commit()
+        logger.info(f"Stored {len(embeddings)} embeddings for {model}")
@@ -1,5 +1,6 @@
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import ARRAY, TEXT, Boolean, Column, Integer, String
+from sqlalchemy import ARRAY, TEXT, Boolean, Column, Computed, Integer, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
 
 
@@ -11,6 +12,7 @@ class DocumentModel(Base):  # type: ignore
     __tablename__ = "document_embeddings"
     id = Column(Integer, primary_key=True, autoincrement=True)
     file_id = Column(Integer)
+    chunk_index = Column(Integer)
     site_name = Column(String)
     site_id = Column(Integer)
     company_name = Column(String)
@@ -21,6 +23,9 @@ class DocumentModel(Base):  # type: ignore
     summary = Column(String)
     summary_embedding = Vector(N_DIM)
     content = Column(String)
+    content_tsv = Column(
+        TSVECTOR, Computed("to_tsvector('english', content)", persisted=True)
+    )
     keywords = Column(ARRAY(TEXT))  # type: ignore
     risks = Column(String)
     actual = Column(Boolean, default=False)
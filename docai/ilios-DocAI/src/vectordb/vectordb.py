@@ -17,12 +17,20 @@ from langchain_google_vertexai import VertexAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from src.doc_ai.file_sequence import FileSequence
+from src.embeddings.cache import CachedEmbeddings
+from src.vectordb.retrieval_index import (
+    PrecomputedEmbeddings,
+    RetrievalIndex,
+    retrieval_index_store,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
 class VectorDB:
+    embedding_model = "text-embedding-005"
+
     def __init__(
         self,
         k: int = 20,
@@ -38,11 +46,12 @@ class VectorDB:
         self.text_splitter = self.get_text_splitter()
         self.embeddings = self.get_embeddings()
 
-    @staticmethod
-    def get_embeddings() -> Embeddings:
+    @classmethod
+    def get_embeddings(cls) -> Embeddings:
         """Get the embeddings to be used for the VectorDB."""
-        return VertexAIEmbeddings(
-            model_name="text-embedding-005", project="prj-ilios-ai"
+        return CachedEmbeddings(
+            VertexAIEmbeddings(model_name=cls.embedding_model, project="prj-ilios-ai"),
+            model=cls.embedding_model,
         )
 
     def get_text_splitter(self) -> TextSplitter:
@@ -61,51 +70,106 @@ class VectorDB:
         self, file_sequence: FileSequence
     ) -> BaseRetriever:
         """Creates a retriever from a given text."""
-        docs = self.text_docs_from_file_sequence(file_sequence)
-
-        if self.add_tables:
-            retriever = TFIDFRetriever.from_documents(docs)
-            table_docs = self.table_docs_from_file_sequence(file_sequence)
-            if not table_docs:
-                return retriever
-            tables_retriever = self.multi_vector_retriever_from_documents(table_docs)
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[retriever, tables_retriever], weights=[0.95, 0.05]
-            )
-            return ensemble_retriever
-        else:
-            return CustomRetriever(documents=docs, k=self.k)
+        index = self.retrieval_index_from_file_sequence(file_sequence)
+        if not index.table_docs:
+            return index.text_retriever
+        if index.tables_retriever is None:
+            index.tables_retriever = self.multi_vector_retriever_from_index(index)
+        ensemble_retriever = EnsembleRetriever(
+            retrievers=[index.text_retriever, index.tables_retriever],
+            weights=[0.95, 0.05],
+        )
+        return ensemble_retriever
 
-    def text_docs_from_file_sequence(
+    def retrieval_index_from_file_sequence(
         self, file_sequence: FileSequence
-    ) -> List[Document]:
-        """Creates a list of documents from the text in the file sequence."""
+    ) -> RetrievalIndex:
+        """
+        Returns the retrieval index of the file sequence content for the current
+        embedding model and chunking parameters, building it only if it was not
+        built before.
+        """
         text = file_sequence.get_all_text()
+        tables = (
+            [self.dataframe_to_string(table) for table in file_sequence.get_tables()]
+            if self.add_tables
+            else []
+        )
+        key = RetrievalIndex.get_key(
+            text,
+            tables,  # type: ignore
+            self.embedding_model,
+            k=self.k,
+            chunk_size=self.chunk_size,
+            overlap_factor=self.overlap_factor,
+            add_tables=self.add_tables,
+        )
+        index = retrieval_index_store.get(key)
+        if index is None:
+            index = self.build_retrieval_index(key, text, tables)  # type: ignore
+            retrieval_index_store.set(index)
+        return index
+
+    def build_retrieval_index(
+        self, key: str, text: str, tables: List[str]
+    ) -> RetrievalIndex:
+        """Splits the text and the tables into chunks and vectorizes them."""
         docs = self.text_splitter.create_documents([text])
         logger.info(f"CHUNK_LENGTHS: {[len(doc.page_content) for doc in docs]}")
-        return docs
+        if not self.add_tables:
+            return RetrievalIndex(
+                key=key, text_retriever=CustomRetriever(documents=docs, k=self.k)
+            )
+
+        table_docs = [Document(table) for table in tables]
+        table_docs_ids = [f"{key}-table-{i}" for i in range(len(table_docs))]
+        # The splitter to use to create smaller chunks
+        child_text_splitter = RecursiveCharacterTextSplitter(
+            chunk_overlap=100, chunk_size=500
+        )
+        table_sub_docs = []
+        for doc_id, doc in zip(table_docs_ids, table_docs):
+            sub_docs = child_text_splitter.split_documents([doc])
+            for sub_doc in sub_docs:
+                sub_doc.metadata["doc_id"] = doc_id
+            table_sub_docs.extend(sub_docs)
+        table_embeddings = (
+            self.embeddings.embed_documents(
+                [sub_doc.page_content for sub_doc in table_sub_docs]
+            )
+            if table_sub_docs
+            else []
+        )
+        return RetrievalIndex(
+            key=key,
+            text_retriever=TFIDFRetriever.from_documents(docs),
+            table_docs=table_docs,
+            table_docs_ids=table_docs_ids,
+            table_sub_docs=table_sub_docs,
+            table_embeddings=table_embeddings,
+        )
 
     @staticmethod
     def dataframe_to_string(df: pd.DataFrame) -> str | pd.DataFrame:
         """Converts a dataframe to a string."""
         return df.to_string(index=False)
 
-    def table_docs_from_file_sequence(
-        self, file_sequence: FileSequence
-    ) -> List[Document]:
-        """Creates a list of documents from the tables in the file sequence."""
-        tables = [
-            self.dataframe_to_string(table) for table in file_sequence.get_tables()
-        ]
-        docs = [Document(table) for table in tables]
-        return docs
-
-    def multi_vector_retriever_from_documents(
-        self, docs: List[Document]
+    def multi_vector_retriever_from_index(
+        self, index: RetrievalIndex
     ) -> MultiVectorRetriever:
-        """Creates a MultiVectorRetriever from a list of documents."""
+        """Creates a MultiVectorRetriever from the table documents of the index."""
+        # tables chunks are added with their precomputed embeddings
+        embeddings = PrecomputedEmbeddings(
+            self.embeddings,
+            {
+                sub_doc.page_content: embedding
+                for sub_doc, embedding in zip(
+                    index.table_sub_docs, index.table_embeddings
+                )
+            },
+        )
         vectorstore = Chroma(
-            collection_name="full_documents", embedding_function=self.embeddings
+            collection_name=f"tables-{index.key[:32]}", embedding_function=embeddings
         )
         # The storage layer for the parent documents
         store = InMemoryByteStore()
@@ -117,21 +181,14 @@ class VectorDB:
             docstore=store,  # type: ignore
             id_key=id_key,
         )
-        doc_ids = [str(uuid.uuid4()) for _ in docs]
-
-        # The splitter to use to create smaller chunks
-        child_text_splitter = RecursiveCharacterTextSplitter(
-            chunk_overlap=100, chunk_size=500
-        )
-        sub_docs = []
-        for i, doc in enumerate(docs):
-            _id = doc_ids[i]
-            _sub_docs = child_text_splitter.split_documents([doc])
-            for _doc in _sub_docs:
-                _doc.metadata[id_key] = _id
-            sub_docs.extend(_sub_docs)
-        retriever.vectorstore.add_documents(sub_docs)
-        retriever.docstore.mset(list(zip(doc_ids, docs)))
+        if index.table_sub_docs:
+            retriever.vectorstore.add_documents(
+                index.table_sub_docs,
+                ids=[
+                    f"{index.key}-chunk-{i}" for i in range(len(index.table_sub_docs))
+                ],
+            )
+        retriever.docstore.mset(list(zip(index.table_docs_ids, index.table_docs)))
 
         return retriever
 